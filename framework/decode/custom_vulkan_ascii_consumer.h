@@ -95,6 +95,16 @@ inline std::string PointerDecoderToString(PointerDecoderType* pObj,
     return pDecodedObj ? util::ToString(*pDecodedObj, toStringFlags, tabCount, tabSize) : "null";
 }
 
+template <typename PointerDecoderType>
+inline void PointerDecoderToStream(std::ostream&       strStrm,
+                                   PointerDecoderType* pObj,
+                                   util::ToStringFlags toStringFlags = util::kToString_Default,
+                                   uint32_t            tabCount      = 0,
+                                   uint32_t            tabSize       = 4)
+{
+    util::PointerToStream(strStrm, pObj ? pObj->GetPointer() : nullptr, toStringFlags, tabCount, tabSize);
+}
+
 inline std::string DescriptorUpdateTemplateDecoderToString(const DescriptorUpdateTemplateDecoder* pObj,
                                                            util::ToStringFlags toStringFlags = util::kToString_Default,
                                                            uint32_t            tabCount      = 0,
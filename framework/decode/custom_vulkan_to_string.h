@@ -29,7 +29,10 @@
 
 #include "vulkan/vulkan.h"
 
+#include <algorithm>
+#include <array>
 #include <string>
+#include <vector>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(util)
@@ -175,6 +178,116 @@ inline std::string BitmaskToString(VkFlags vkFlags)
     return str;
 }
 
+// Name of an enumerant, used to build the lookup tables for the generated enum ToString() functions.
+template <typename VkEnumType>
+struct VkEnumName
+{
+    VkEnumType  value;
+    const char* name;
+};
+
+// Table of enumerant names sorted by value, for converting enum values to strings with a binary search.
+template <typename VkEnumType>
+class VkEnumNameTable
+{
+  public:
+    template <size_t N>
+    VkEnumNameTable(const VkEnumName<VkEnumType> (&names)[N], const char* unhandled_name) :
+        names_(names, names + N), unhandled_name_(unhandled_name)
+    {
+        std::stable_sort(
+            names_.begin(), names_.end(), [](const VkEnumName<VkEnumType>& lhs, const VkEnumName<VkEnumType>& rhs) {
+                return lhs.value < rhs.value;
+            });
+    }
+
+    const char* GetName(VkEnumType value) const
+    {
+        auto entry = std::lower_bound(
+            names_.begin(), names_.end(), value, [](const VkEnumName<VkEnumType>& lhs, VkEnumType rhs) {
+                return lhs.value < rhs;
+            });
+
+        if ((entry != names_.end()) && (entry->value == value))
+        {
+            return entry->name;
+        }
+
+        return unhandled_name_;
+    }
+
+  private:
+    std::vector<VkEnumName<VkEnumType>> names_;
+    const char*                         unhandled_name_;
+};
+
+// Table of the names of the single bit values of a flag bits enum, indexed by bit position, for converting flags to
+// strings.  Produces the same strings as BitmaskToString().
+template <typename VkBitmaskType>
+class VkBitmaskNameTable
+{
+  public:
+    template <size_t N>
+    VkBitmaskNameTable(const VkEnumName<VkBitmaskType> (&names)[N], const char* unhandled_name) :
+        zero_name_(unhandled_name)
+    {
+        bit_names_.fill(unhandled_name);
+
+        for (size_t i = 0; i < N; ++i)
+        {
+            VkFlags value = static_cast<VkFlags>(names[i].value);
+            if (value == 0)
+            {
+                zero_name_ = names[i].name;
+            }
+            else if ((value & (value - 1)) == 0)
+            {
+                bit_names_[GetBitIndex(value)] = names[i].name;
+            }
+        }
+    }
+
+    std::string GetNames(VkFlags vkFlags) const
+    {
+        std::string str;
+        uint32_t    index = 0;
+        while (vkFlags)
+        {
+            if (vkFlags & 1)
+            {
+                if (!str.empty())
+                {
+                    str.append("|");
+                }
+                str.append(bit_names_[index]);
+            }
+            ++index;
+            vkFlags >>= 1;
+        }
+        if (str.empty())
+        {
+            str.append(zero_name_);
+        }
+        return str;
+    }
+
+  private:
+    static uint32_t GetBitIndex(VkFlags bit)
+    {
+        uint32_t index = 0;
+        while (bit > 1)
+        {
+            ++index;
+            bit >>= 1;
+        }
+        return index;
+    }
+
+  private:
+    std::array<const char*, sizeof(VkFlags) * 8> bit_names_;
+    const char*                                  zero_name_;
+};
+
 inline std::string UIDToString(uint32_t uidSize, const uint8_t* pUid)
 {
     std::stringstream strStrm;
@@ -395,7 +395,20 @@ bool FileProcessor::ProcessFunctionCall(const format::BlockHeader& block_header,
     {
         parameter_buffer_size -= sizeof(call_info.thread_id);
 
-        if (format::IsBlockCompressed(block_header.type))
+        // The decoders that process the call are found once, and are used to both skip and dispatch the call.
+        FindApiCallDecoders(call_id);
+
+        if (call_decoders_.empty())
+        {
+            // No decoder processes the call, so its parameter data is skipped without being read or decompressed.
+            success = SkipBytes(parameter_buffer_size);
+
+            if (!success)
+            {
+                HandleBlockReadError(kErrorReadingBlockData, "Failed to skip function call block data");
+            }
+        }
+        else if (format::IsBlockCompressed(block_header.type))
         {
             parameter_buffer_size -= sizeof(uncompressed_size);
             success = ReadBytes(&uncompressed_size, sizeof(uncompressed_size));
@@ -437,14 +450,11 @@ bool FileProcessor::ProcessFunctionCall(const format::BlockHeader& block_header,
 
         if (success)
         {
-            for (auto decoder : decoders_)
+            for (auto decoder : call_decoders_)
             {
-                if (decoder->SupportsApiCall(call_id))
-                {
-                    DecodeAllocator::Begin();
-                    decoder->DecodeFunctionCall(call_id, call_info, parameter_buffer_.data(), parameter_buffer_size);
-                    DecodeAllocator::End();
-                }
+                DecodeAllocator::Begin();
+                decoder->DecodeFunctionCall(call_id, call_info, parameter_buffer_.data(), parameter_buffer_size);
+                DecodeAllocator::End();
             }
 
             ++api_call_index_;
@@ -1237,6 +1247,19 @@ bool FileProcessor::ProcessAnnotation(const format::BlockHeader& block_header, f
     return success;
 }
 
+void FileProcessor::FindApiCallDecoders(format::ApiCallId call_id)
+{
+    call_decoders_.clear();
+
+    for (auto decoder : decoders_)
+    {
+        if (decoder->SupportsApiCall(call_id))
+        {
+            call_decoders_.push_back(decoder);
+        }
+    }
+}
+
 bool FileProcessor::IsFrameDelimiter(format::ApiCallId call_id) const
 {
     // TODO: IDs of API calls that were treated as frame delimiters by the GFXReconstruct layer should be in the capture
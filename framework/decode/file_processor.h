@@ -117,6 +117,9 @@ class FileProcessor
 
     bool ProcessAnnotation(const format::BlockHeader& block_header, format::AnnotationType annotation_type);
 
+    // Finds the decoders that process an API call, and stores them in call_decoders_.
+    void FindApiCallDecoders(format::ApiCallId call_id);
+
     bool IsFrameDelimiter(format::ApiCallId call_id) const;
 
     bool IsFileHeaderValid() const { return (file_header_.fourcc == GFXRECON_FOURCC); }
@@ -134,6 +137,7 @@ class FileProcessor
     Error                               error_state_;
     AnnotationHandler*                  annotation_handler_;
     std::vector<ApiDecoder*>            decoders_;
+    std::vector<ApiDecoder*>            call_decoders_;
     std::vector<uint8_t>                parameter_buffer_;
     std::vector<uint8_t>                compressed_parameter_buffer_;
     util::Compressor*                   compressor_;
@@ -87,6 +87,8 @@ class HandlePointerDecoder
 
     const T* GetHandlePointer() const { return handle_data_; }
 
+    void SetDecodeOnAccess(bool decode_on_access) { decoder_.SetDecodeOnAccess(decode_on_access); }
+
     size_t Decode(const uint8_t* buffer, size_t buffer_size) { return decoder_.DecodeHandleId(buffer, buffer_size); }
 
     // The value returned is only guaranteed to be valid if the current consumer has called SetConsumerData.
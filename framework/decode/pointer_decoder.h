@@ -43,9 +43,21 @@ class PointerDecoder : public PointerDecoderBase
   public:
     PointerDecoder() : data_(nullptr), capacity_(0), is_memory_external_(false), output_len_(0) {}
 
-    T* GetPointer() { return data_; }
+    T* GetPointer()
+    {
+        DecodeDeferredData();
+        return data_;
+    }
+
+    const T* GetPointer() const
+    {
+        DecodeDeferredData();
+        return data_;
+    }
 
-    const T* GetPointer() const { return data_; }
+    /// When enabled, the array data is not copied from the parameter buffer by the Decode methods. It is decoded when
+    /// it is first retrieved with GetPointer(), which must happen before the parameter buffer is released.
+    void SetDecodeOnAccess(bool decode_on_access) { decode_on_access_ = decode_on_access; }
 
     size_t GetOutputLength() const { return output_len_; }
 
@@ -174,8 +186,19 @@ class PointerDecoder : public PointerDecoderBase
 
         if (HasData())
         {
-            data_      = DecodeAllocator::Allocate<T>(len, false);
-            bytes_read = ValueDecoder::DecodeArrayFrom<SrcT>(buffer, buffer_size, data_, len);
+            if (decode_on_access_ && (buffer_size >= (sizeof(SrcT) * len)))
+            {
+                // Record the location of the array data, which will be decoded by DecodeDeferredData().
+                bytes_read            = sizeof(SrcT) * len;
+                deferred_buffer_      = buffer;
+                deferred_buffer_size_ = bytes_read;
+                deferred_decode_      = &ValueDecoder::DecodeArrayFrom<SrcT, T>;
+            }
+            else
+            {
+                data_      = DecodeAllocator::Allocate<T>(len, false);
+                bytes_read = ValueDecoder::DecodeArrayFrom<SrcT>(buffer, buffer_size, data_, len);
+            }
         }
         else
         {
@@ -220,10 +243,21 @@ class PointerDecoder : public PointerDecoderBase
         return bytes_read;
     }
 
+    void DecodeDeferredData() const
+    {
+        if (deferred_decode_ != nullptr)
+        {
+            size_t len = GetLength();
+            data_      = DecodeAllocator::Allocate<T>(len, false);
+            deferred_decode_(deferred_buffer_, deferred_buffer_size_, data_, len);
+            deferred_decode_ = nullptr;
+        }
+    }
+
   private:
     /// Memory to hold decoded data. Points to an internal allocation when #is_memory_external_ is false and
     /// to an externally provided allocation when #is_memory_external_ is true.
-    T*     data_;
+    mutable T* data_;
     size_t capacity_; ///< Size of external memory allocation referenced by #data_ when #is_memory_external_ is true.
     bool   is_memory_external_; ///< Indicates that the memory referenced by #data_ is an external allocation.
 
@@ -232,6 +266,16 @@ class PointerDecoder : public PointerDecoderBase
     /// compared.
     OutputT* output_data_{ nullptr };
     size_t   output_len_; ///< Size of #output_data_.
+
+    using DeferredDecodeFunction = size_t (*)(const uint8_t*, size_t, T*, size_t);
+
+    bool decode_on_access_{ false }; ///< Defer decoding of the array data until it is retrieved with GetPointer().
+
+    /// Location of the array data in the parameter buffer and the function to decode it with, when decoding has been
+    /// deferred and the data has not been retrieved yet.
+    const uint8_t*                 deferred_buffer_{ nullptr };
+    size_t                         deferred_buffer_size_{ 0 };
+    mutable DeferredDecodeFunction deferred_decode_{ nullptr };
 };
 
 template <typename T>
@@ -26,14 +26,22 @@
 #define CATCH_CONFIG_MAIN
 #include <catch2/catch.hpp>
 
+#include "decode/custom_vulkan_to_string.h"
+#include "decode/decode_allocator.h"
+#include "decode/handle_pointer_decoder.h"
+#include "decode/pointer_decoder.h"
 #include "decode/vulkan_handle_mapping_util.h"
 #include "decode/vulkan_object_info.h"
 #include "decode/vulkan_object_info_table.h"
+#include "decode/vulkan_object_info_table_base.h"
 #include "format/format.h"
 #include "format/format_util.h"
+#include "generated/generated_vulkan_enum_to_string.h"
 
 #include "vulkan/vulkan.h"
 
+#include <algorithm>
+#include <cstring>
 #include <vector>
 
 const VkBuffer                   kBufferHandles[] = { gfxrecon::format::FromHandleId<VkBuffer>(0xabcd),
@@ -147,3 +155,367 @@ TEST_CASE("handle IDs need to be mapped to valid handles", "[wrapper]")
 
     gfxrecon::util::Log::Release();
 }
+
+template <typename T>
+static void EncodeValue(std::vector<uint8_t>* buffer, T value)
+{
+    const uint8_t* bytes = reinterpret_cast<const uint8_t*>(&value);
+    buffer->insert(buffer->end(), bytes, bytes + sizeof(value));
+}
+
+// Encode an array parameter with the pointer attributes, address, and length that precede the array values.
+template <typename T>
+static std::vector<uint8_t> EncodeArray(const std::vector<T>& values)
+{
+    std::vector<uint8_t> buffer;
+    EncodeValue<uint32_t>(&buffer,
+                          gfxrecon::format::PointerAttributes::kIsArray |
+                              gfxrecon::format::PointerAttributes::kHasAddress |
+                              gfxrecon::format::PointerAttributes::kHasData);
+    EncodeValue<gfxrecon::format::AddressEncodeType>(&buffer, 0x1000);
+    EncodeValue<gfxrecon::format::SizeTEncodeType>(&buffer, values.size());
+
+    for (const auto& value : values)
+    {
+        EncodeValue(&buffer, value);
+    }
+
+    return buffer;
+}
+
+TEST_CASE("array parameters can be decoded when they are accessed", "[decoder]")
+{
+    gfxrecon::util::Log::Init(gfxrecon::util::Log::kErrorSeverity);
+    gfxrecon::decode::DecodeAllocator::Begin();
+
+    const std::vector<uint32_t> values = { 1, 2, 3, 0xffffffff };
+    std::vector<uint8_t>        buffer = EncodeArray(values);
+
+    SECTION("Data decoded on access matches data decoded by Decode")
+    {
+        gfxrecon::decode::PointerDecoder<uint32_t> eager;
+        gfxrecon::decode::PointerDecoder<uint32_t> deferred;
+        deferred.SetDecodeOnAccess(true);
+
+        size_t eager_bytes    = eager.DecodeUInt32(buffer.data(), buffer.size());
+        size_t deferred_bytes = deferred.DecodeUInt32(buffer.data(), buffer.size());
+
+        REQUIRE(deferred_bytes == buffer.size());
+        REQUIRE(deferred_bytes == eager_bytes);
+        REQUIRE(deferred.GetLength() == values.size());
+
+        const uint32_t* deferred_data = deferred.GetPointer();
+
+        REQUIRE(deferred_data != nullptr);
+        REQUIRE(std::equal(values.begin(), values.end(), deferred_data));
+        REQUIRE(std::equal(values.begin(), values.end(), eager.GetPointer()));
+
+        // The data is only decoded once.
+        REQUIRE(deferred.GetPointer() == deferred_data);
+    }
+
+    SECTION("Data decoded on access is read from the parameter buffer when it is first accessed")
+    {
+        gfxrecon::decode::PointerDecoder<uint32_t> deferred;
+        deferred.SetDecodeOnAccess(true);
+        deferred.DecodeUInt32(buffer.data(), buffer.size());
+
+        const uint32_t replacement = 42;
+        memcpy(&buffer[buffer.size() - sizeof(replacement)], &replacement, sizeof(replacement));
+
+        REQUIRE(deferred.GetPointer()[values.size() - 1] == replacement);
+    }
+
+    SECTION("Data decoded on access is converted when the encoded type has a different size")
+    {
+        gfxrecon::decode::PointerDecoder<uint64_t> eager;
+        gfxrecon::decode::PointerDecoder<uint64_t> deferred;
+        deferred.SetDecodeOnAccess(true);
+
+        size_t eager_bytes    = eager.DecodeUInt32(buffer.data(), buffer.size());
+        size_t deferred_bytes = deferred.DecodeUInt32(buffer.data(), buffer.size());
+
+        REQUIRE(deferred_bytes == buffer.size());
+        REQUIRE(deferred_bytes == eager_bytes);
+        REQUIRE(std::equal(values.begin(), values.end(), deferred.GetPointer()));
+        REQUIRE(std::equal(values.begin(), values.end(), eager.GetPointer()));
+    }
+
+    SECTION("Handle pointer decoders forward decoding on access to their ID decoder")
+    {
+        const std::vector<gfxrecon::format::HandleId> ids       = { kBufferIds[0], kBufferIds[1], kBufferIds[2] };
+        std::vector<uint8_t>                          id_buffer = EncodeArray(ids);
+
+        gfxrecon::decode::HandlePointerDecoder<VkBuffer> deferred;
+        deferred.SetDecodeOnAccess(true);
+
+        REQUIRE(deferred.Decode(id_buffer.data(), id_buffer.size()) == id_buffer.size());
+        REQUIRE(deferred.GetLength() == ids.size());
+
+        const gfxrecon::format::HandleId replacement = kBufferIds[3];
+        memcpy(&id_buffer[id_buffer.size() - sizeof(replacement)], &replacement, sizeof(replacement));
+
+        const gfxrecon::format::HandleId* deferred_ids = deferred.GetPointer();
+
+        REQUIRE(deferred_ids != nullptr);
+        REQUIRE(std::equal(ids.begin(), ids.end() - 1, deferred_ids));
+        REQUIRE(deferred_ids[ids.size() - 1] == replacement);
+    }
+
+    SECTION("Data is decoded by Decode when the parameter buffer is too small to hold the array")
+    {
+        size_t short_size = buffer.size() - 1;
+
+        gfxrecon::decode::PointerDecoder<uint32_t> eager;
+        gfxrecon::decode::PointerDecoder<uint32_t> deferred;
+        deferred.SetDecodeOnAccess(true);
+
+        size_t eager_bytes    = eager.DecodeUInt32(buffer.data(), short_size);
+        size_t deferred_bytes = deferred.DecodeUInt32(buffer.data(), short_size);
+
+        REQUIRE(deferred_bytes == eager_bytes);
+        REQUIRE(deferred_bytes < buffer.size());
+        REQUIRE(deferred.GetLength() == values.size());
+        REQUIRE(deferred.GetPointer() != nullptr);
+    }
+
+    gfxrecon::decode::DecodeAllocator::End();
+    gfxrecon::util::Log::Release();
+}
+
+// Enumerant lists for the name table tests, in the order of the registry rather than the order of the values.
+const gfxrecon::util::VkEnumName<VkCompareOp> kCompareOpNames[] = {
+    { VK_COMPARE_OP_NEVER, "VK_COMPARE_OP_NEVER" },
+    { VK_COMPARE_OP_ALWAYS, "VK_COMPARE_OP_ALWAYS" },
+    { VK_COMPARE_OP_LESS, "VK_COMPARE_OP_LESS" },
+    { VK_COMPARE_OP_GREATER_OR_EQUAL, "VK_COMPARE_OP_GREATER_OR_EQUAL" },
+    { VK_COMPARE_OP_EQUAL, "VK_COMPARE_OP_EQUAL" },
+    { VK_COMPARE_OP_NOT_EQUAL, "VK_COMPARE_OP_NOT_EQUAL" },
+    { VK_COMPARE_OP_LESS_OR_EQUAL, "VK_COMPARE_OP_LESS_OR_EQUAL" },
+    { VK_COMPARE_OP_GREATER, "VK_COMPARE_OP_GREATER" },
+};
+
+const gfxrecon::util::VkEnumName<VkCullModeFlagBits> kCullModeNames[] = {
+    { VK_CULL_MODE_FRONT_AND_BACK, "VK_CULL_MODE_FRONT_AND_BACK" },
+    { VK_CULL_MODE_BACK_BIT, "VK_CULL_MODE_BACK_BIT" },
+    { VK_CULL_MODE_NONE, "VK_CULL_MODE_NONE" },
+    { VK_CULL_MODE_FRONT_BIT, "VK_CULL_MODE_FRONT_BIT" },
+};
+
+const gfxrecon::util::VkEnumName<VkDependencyFlagBits> kDependencyNames[] = {
+    { VK_DEPENDENCY_BY_REGION_BIT, "VK_DEPENDENCY_BY_REGION_BIT" },
+    { VK_DEPENDENCY_DEVICE_GROUP_BIT, "VK_DEPENDENCY_DEVICE_GROUP_BIT" },
+    { VK_DEPENDENCY_VIEW_LOCAL_BIT, "VK_DEPENDENCY_VIEW_LOCAL_BIT" },
+};
+
+TEST_CASE("enum name tables produce the same strings as the enum ToString functions", "[to_string]")
+{
+    SECTION("Enum names match the names of the switch based ToString")
+    {
+        gfxrecon::util::VkEnumNameTable<VkCompareOp> table(kCompareOpNames, "Unhandled VkCompareOp");
+
+        for (int32_t value = -1; value <= 9; ++value)
+        {
+            VkCompareOp compare_op = static_cast<VkCompareOp>(value);
+            REQUIRE(table.GetName(compare_op) == gfxrecon::util::ToString(compare_op));
+        }
+
+        REQUIRE(std::string(table.GetName(VK_COMPARE_OP_GREATER)) == "VK_COMPARE_OP_GREATER");
+        REQUIRE(std::string(table.GetName(VK_COMPARE_OP_MAX_ENUM)) == "Unhandled VkCompareOp");
+    }
+
+    SECTION("Flag bit names match the names of the switch based ToString")
+    {
+        gfxrecon::util::VkEnumNameTable<VkCullModeFlagBits> table(kCullModeNames, "Unhandled VkCullModeFlagBits");
+
+        for (uint32_t value = 0; value <= 4; ++value)
+        {
+            VkCullModeFlagBits cull_mode = static_cast<VkCullModeFlagBits>(value);
+            REQUIRE(table.GetName(cull_mode) == gfxrecon::util::ToString(cull_mode));
+        }
+    }
+
+    SECTION("Flags names match the names of BitmaskToString")
+    {
+        gfxrecon::util::VkBitmaskNameTable<VkCullModeFlagBits>   cull_mode_table(kCullModeNames,
+                                                                                 "Unhandled VkCullModeFlagBits");
+        gfxrecon::util::VkBitmaskNameTable<VkDependencyFlagBits> dependency_table(kDependencyNames,
+                                                                                  "Unhandled VkDependencyFlagBits");
+
+        const VkFlags flags[] = { 0, 1, 2, 3, 4, 5, 6, 7, 8, 0x10, 0x40000000, 0x40000003, 0x7fffffff };
+
+        for (VkFlags value : flags)
+        {
+            REQUIRE(cull_mode_table.GetNames(value) == gfxrecon::util::BitmaskToString<VkCullModeFlagBits>(value));
+            REQUIRE(dependency_table.GetNames(value) == gfxrecon::util::BitmaskToString<VkDependencyFlagBits>(value));
+        }
+
+        REQUIRE(cull_mode_table.GetNames(0) == "VK_CULL_MODE_NONE");
+        REQUIRE(cull_mode_table.GetNames(VK_CULL_MODE_FRONT_AND_BACK) ==
+                "VK_CULL_MODE_FRONT_BIT|VK_CULL_MODE_BACK_BIT");
+        REQUIRE(dependency_table.GetNames(0) == "Unhandled VkDependencyFlagBits");
+        REQUIRE(dependency_table.GetNames(VK_DEPENDENCY_BY_REGION_BIT | 0x10) ==
+                "VK_DEPENDENCY_BY_REGION_BIT|Unhandled VkDependencyFlagBits");
+    }
+}
+
+struct TestObjectInfo
+{
+    gfxrecon::format::HandleId capture_id{ 0 };
+    std::vector<uint32_t>      values;
+};
+
+static std::vector<gfxrecon::format::HandleId>
+GetVisitedIds(const gfxrecon::decode::PagedObjectInfoMap<TestObjectInfo>& map)
+{
+    std::vector<gfxrecon::format::HandleId> ids;
+    map.Visit([&](const TestObjectInfo* info) { ids.push_back(info->capture_id); });
+    return ids;
+}
+
+TEST_CASE("paged object info maps store info structures by capture ID", "[object_info_table]")
+{
+    // IDs at or above the paged range are stored in an unordered map.
+    const gfxrecon::format::HandleId kSparseIds[] = { 1 << 22, (1 << 22) + 64, 0xffffffffffffffffull };
+
+    gfxrecon::decode::PagedObjectInfoMap<TestObjectInfo> map;
+
+    SECTION("Inserted info structures are found by capture ID")
+    {
+        auto result = map.Insert(70, TestObjectInfo{ 70, { 1, 2 } });
+
+        REQUIRE(result.second);
+        REQUIRE(result.first != nullptr);
+        REQUIRE(map.Find(70) == result.first);
+        REQUIRE(map.Find(70)->values == std::vector<uint32_t>{ 1, 2 });
+        REQUIRE(map.Find(0) == nullptr);
+        REQUIRE(map.Find(69) == nullptr);
+        REQUIRE(map.Find(71) == nullptr);
+        REQUIRE(map.Find(1 << 21) == nullptr);
+
+        // Existing info structures are not replaced.
+        auto duplicate = map.Insert(70, TestObjectInfo{ 70, { 3 } });
+
+        REQUIRE(!duplicate.second);
+        REQUIRE(duplicate.first == result.first);
+        REQUIRE(map.Find(70)->values == std::vector<uint32_t>{ 1, 2 });
+
+        // Info structures are not moved by later insertions.
+        for (gfxrecon::format::HandleId id = 1; id < 4096; id += 3)
+        {
+            map.Insert(id, TestObjectInfo{ id, {} });
+        }
+
+        REQUIRE(map.Find(70) == result.first);
+    }
+
+    SECTION("Info structures are visited in capture ID order")
+    {
+        const gfxrecon::format::HandleId ids[] = { 130, 3, 64, 1, 63, 2 };
+        for (auto id : ids)
+        {
+            map.Insert(id, TestObjectInfo{ id, {} });
+        }
+
+        REQUIRE(GetVisitedIds(map) == std::vector<gfxrecon::format::HandleId>{ 1, 2, 3, 63, 64, 130 });
+
+        map.Remove(3);
+        map.Remove(64);
+        map.Remove(65);
+
+        REQUIRE(GetVisitedIds(map) == std::vector<gfxrecon::format::HandleId>{ 1, 2, 63, 130 });
+    }
+
+    SECTION("Removed info structures are not found")
+    {
+        map.Insert(1, TestObjectInfo{ 1, {} });
+        map.Insert(2, TestObjectInfo{ 2, {} });
+        map.Insert(64, TestObjectInfo{ 64, {} });
+
+        map.Remove(2);
+
+        REQUIRE(map.Find(2) == nullptr);
+        REQUIRE(map.Find(1) != nullptr);
+        REQUIRE(map.Find(64) != nullptr);
+
+        // Removing the last info structure of a page frees the page.
+        map.Remove(1);
+
+        REQUIRE(map.Find(1) == nullptr);
+        REQUIRE(map.Find(64) != nullptr);
+        REQUIRE(GetVisitedIds(map) == std::vector<gfxrecon::format::HandleId>{ 64 });
+
+        // Removing IDs that are not in the map has no effect.
+        map.Remove(1);
+        map.Remove(65);
+        map.Remove(1 << 21);
+
+        REQUIRE(GetVisitedIds(map) == std::vector<gfxrecon::format::HandleId>{ 64 });
+    }
+
+    SECTION("Info structures with IDs outside of the paged range are stored")
+    {
+        map.Insert(5, TestObjectInfo{ 5, {} });
+        for (auto id : kSparseIds)
+        {
+            auto result = map.Insert(id, TestObjectInfo{ id, { 1 } });
+
+            REQUIRE(result.second);
+            REQUIRE(map.Find(id) == result.first);
+        }
+
+        auto duplicate = map.Insert(kSparseIds[0], TestObjectInfo{ kSparseIds[0], { 2 } });
+
+        REQUIRE(!duplicate.second);
+        REQUIRE(map.Find(kSparseIds[0])->values == std::vector<uint32_t>{ 1 });
+        REQUIRE(map.Find(kSparseIds[0] + 1) == nullptr);
+
+        // Paged IDs are visited first, followed by the other IDs in an unspecified order.
+        auto visited = GetVisitedIds(map);
+
+        REQUIRE(visited.size() == 4);
+        REQUIRE(visited[0] == 5);
+        for (auto id : kSparseIds)
+        {
+            REQUIRE(std::find(visited.begin(), visited.end(), id) != visited.end());
+        }
+
+        map.Remove(kSparseIds[1]);
+
+        REQUIRE(map.Find(kSparseIds[1]) == nullptr);
+        REQUIRE(map.Find(kSparseIds[0]) != nullptr);
+        REQUIRE(GetVisitedIds(map).size() == 3);
+    }
+
+    SECTION("Removed IDs can be inserted again")
+    {
+        map.Insert(8, TestObjectInfo{ 8, { 1 } });
+        map.Insert(9, TestObjectInfo{ 9, { 1 } });
+        map.Insert(kSparseIds[0], TestObjectInfo{ kSparseIds[0], { 1 } });
+
+        map.Remove(8);
+        map.Remove(kSparseIds[0]);
+
+        auto result        = map.Insert(8, TestObjectInfo{ 8, { 2 } });
+        auto sparse_result = map.Insert(kSparseIds[0], TestObjectInfo{ kSparseIds[0], { 2 } });
+
+        REQUIRE(result.second);
+        REQUIRE(sparse_result.second);
+        REQUIRE(map.Find(8)->values == std::vector<uint32_t>{ 2 });
+        REQUIRE(map.Find(kSparseIds[0])->values == std::vector<uint32_t>{ 2 });
+
+        // IDs can be inserted again after their page has been freed.
+        map.Remove(8);
+        map.Remove(9);
+
+        REQUIRE(map.Find(8) == nullptr);
+        REQUIRE(map.Find(9) == nullptr);
+
+        result = map.Insert(9, TestObjectInfo{ 9, { 3 } });
+
+        REQUIRE(result.second);
+        REQUIRE(map.Find(8) == nullptr);
+        REQUIRE(map.Find(9)->values == std::vector<uint32_t>{ 3 });
+        REQUIRE(GetVisitedIds(map) == std::vector<gfxrecon::format::HandleId>{ 9, kSparseIds[0] });
+    }
+}
@@ -32,6 +32,8 @@
 #include "vulkan/vulkan.h"
 
 #include <cstdio>
+#include <ostream>
+#include <streambuf>
 #include <string>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
@@ -117,14 +119,52 @@ class VulkanAsciiConsumerBase : public VulkanConsumer
                                    ToStringFunctionType toStringFunction)
     {
         using namespace util;
-        fprintf(file_, "%s\n", (call_info.index ? "," : ""));
-        fprintf(file_, "\"[%s]%s\":", std::to_string(call_info.index).c_str(), functionName.c_str());
-        fprintf(file_, "%s", GetWhitespaceString(toStringFlags).c_str());
-        fprintf(file_, "%s", ObjectToString(toStringFlags, tabCount, tabSize, toStringFunction).c_str());
+
+        // The API call is written to a buffer that is reused for each call, and then written to the file at once.
+        api_call_buffer_.Clear();
+        api_call_stream_ << (call_info.index ? "," : "") << '\n';
+        api_call_stream_ << "\"[" << call_info.index << ']' << functionName << "\":";
+        WhitespaceToStream(api_call_stream_, toStringFlags);
+        ObjectToStream(
+            api_call_stream_, toStringFlags, tabCount, tabSize, [&]() { toStringFunction(api_call_stream_); });
+
+        const std::string& api_call_string = api_call_buffer_.GetData();
+        fwrite(api_call_string.data(), 1, api_call_string.size(), file_);
     }
 
   private:
-    FILE* file_{ nullptr };
+    // Stream buffer that appends to a string, which retains its capacity when cleared.
+    class ApiCallBuffer : public std::streambuf
+    {
+      public:
+        void Clear() { data_.clear(); }
+
+        const std::string& GetData() const { return data_; }
+
+      protected:
+        virtual int_type overflow(int_type c) override
+        {
+            if (!traits_type::eq_int_type(c, traits_type::eof()))
+            {
+                data_.push_back(traits_type::to_char_type(c));
+            }
+            return traits_type::not_eof(c);
+        }
+
+        virtual std::streamsize xsputn(const char* s, std::streamsize count) override
+        {
+            data_.append(s, static_cast<size_t>(count));
+            return count;
+        }
+
+      private:
+        std::string data_;
+    };
+
+  private:
+    FILE*         file_{ nullptr };
+    ApiCallBuffer api_call_buffer_;
+    std::ostream  api_call_stream_{ &api_call_buffer_ };
 };
 
 GFXRECON_END_NAMESPACE(decode)
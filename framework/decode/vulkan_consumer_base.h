@@ -47,6 +47,10 @@ class VulkanConsumerBase
 
     virtual ~VulkanConsumerBase() {}
 
+    // Determines if the consumer processes the specified API call.  Consumers that only process a subset of the API
+    // calls can override this method, allowing the decoder to skip the calls that no consumer processes.
+    virtual bool IsApiCallHandled(format::ApiCallId call_id) const { return true; }
+
     virtual void ProcessStateBeginMarker(uint64_t frame_number) {}
 
     virtual void ProcessStateEndMarker(uint64_t frame_number) {}
@@ -55,7 +55,11 @@ class VulkanDecoderBase : public ApiDecoder
 
     virtual bool SupportsApiCall(format::ApiCallId call_id) override
     {
-        return (format::GetApiCallFamily(call_id) == format::ApiFamilyId::ApiFamily_Vulkan);
+        // Calls that are not processed by any of the consumers are not decoded.
+        return (format::GetApiCallFamily(call_id) == format::ApiFamilyId::ApiFamily_Vulkan) &&
+               std::any_of(consumers_.begin(), consumers_.end(), [call_id](const VulkanConsumer* consumer) {
+                   return consumer->IsApiCallHandled(call_id);
+               });
     }
 
     virtual bool SupportsMetaDataId(format::MetaDataId meta_data_id) override
@@ -163,7 +167,6 @@ class VulkanDecoderBase : public ApiDecoder
   protected:
     const std::vector<VulkanConsumer*>& GetConsumers() const { return consumers_; }
 
-  private:
     size_t Decode_vkUpdateDescriptorSetWithTemplate(const ApiCallInfo& call_info,
                                                     const uint8_t*     parameter_buffer,
                                                     size_t             buffer_size);
@@ -34,25 +34,20 @@ class VulkanObjectInfoTable : public VulkanObjectInfoTableBase2
   public:
     void ReplaceSemaphore(VkSemaphore target, VkSemaphore replacement)
     {
-        for (auto& entry : semaphore_map_)
+        auto info =
+            FindObjectInfo(&semaphore_map_, [target](const SemaphoreInfo& entry) { return entry.handle == target; });
+        if (info != nullptr)
         {
-            if (entry.second.handle == target)
-            {
-                entry.second.handle = replacement;
-                break;
-            }
+            info->handle = replacement;
         }
     }
 
     void ReplaceFence(VkFence target, VkFence replacement)
     {
-        for (auto& entry : fence_map_)
+        auto info = FindObjectInfo(&fence_map_, [target](const FenceInfo& entry) { return entry.handle == target; });
+        if (info != nullptr)
         {
-            if (entry.second.handle == target)
-            {
-                entry.second.handle = replacement;
-                break;
-            }
+            info->handle = replacement;
         }
     }
 };
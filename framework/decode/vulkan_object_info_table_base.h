@@ -32,11 +32,185 @@
 
 #include <cassert>
 #include <functional>
+#include <memory>
 #include <unordered_map>
+#include <utility>
+#include <vector>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
+// Object info storage that is indexed by capture ID. Capture IDs are allocated sequentially, so info structures are
+// stored in fixed size pages that are allocated when first used, and are found without hashing. A page only holds
+// pointers to the info structures, which are allocated on insertion, and is freed when its last info structure is
+// removed. IDs that are too large for the paged range are stored in an unordered map. Info structures are not moved
+// after insertion.
+template <typename T>
+class PagedObjectInfoMap
+{
+  public:
+    // Returns a pointer to the info structure for the ID, and a value indicating if it was inserted. When an info
+    // structure already exists for the ID, it is not replaced.
+    std::pair<T*, bool> Insert(format::HandleId id, T&& info)
+    {
+        if (id >= kMaxPagedId)
+        {
+            auto entry = sparse_infos_.find(id);
+            if (entry != sparse_infos_.end())
+            {
+                return std::make_pair(&entry->second, false);
+            }
+
+            auto result = sparse_infos_.emplace(id, std::forward<T>(info));
+            return std::make_pair(&result.first->second, true);
+        }
+
+        size_t page_index = static_cast<size_t>(id / kPageSize);
+        size_t slot       = static_cast<size_t>(id % kPageSize);
+
+        if (page_index >= pages_.size())
+        {
+            pages_.resize(page_index + 1);
+        }
+
+        auto& page = pages_[page_index];
+        if (page == nullptr)
+        {
+            page = std::make_unique<Page>();
+        }
+
+        auto& slot_info = page->infos[slot];
+        if (slot_info != nullptr)
+        {
+            return std::make_pair(slot_info.get(), false);
+        }
+
+        slot_info = std::make_unique<T>(std::forward<T>(info));
+        ++page->count;
+        return std::make_pair(slot_info.get(), true);
+    }
+
+    void Remove(format::HandleId id)
+    {
+        if (id >= kMaxPagedId)
+        {
+            sparse_infos_.erase(id);
+        }
+        else
+        {
+            Page*  page = GetPage(id);
+            size_t slot = static_cast<size_t>(id % kPageSize);
+            if ((page != nullptr) && (page->infos[slot] != nullptr))
+            {
+                page->infos[slot].reset();
+
+                if (--page->count == 0)
+                {
+                    pages_[static_cast<size_t>(id / kPageSize)].reset();
+                }
+            }
+        }
+    }
+
+    T* Find(format::HandleId id) { return const_cast<T*>(static_cast<const PagedObjectInfoMap*>(this)->Find(id)); }
+
+    const T* Find(format::HandleId id) const
+    {
+        if (id >= kMaxPagedId)
+        {
+            auto entry = sparse_infos_.find(id);
+            return (entry != sparse_infos_.end()) ? &entry->second : nullptr;
+        }
+
+        const Page* page = GetPage(id);
+        size_t      slot = static_cast<size_t>(id % kPageSize);
+        return (page != nullptr) ? page->infos[slot].get() : nullptr;
+    }
+
+    // Visits the info structures in the paged range in capture ID order, followed by the info structures in the
+    // unordered map.
+    template <typename Visitor>
+    void Visit(Visitor visitor) const
+    {
+        for (const auto& page : pages_)
+        {
+            if (page != nullptr)
+            {
+                for (const auto& info : page->infos)
+                {
+                    if (info != nullptr)
+                    {
+                        visitor(info.get());
+                    }
+                }
+            }
+        }
+
+        for (const auto& entry : sparse_infos_)
+        {
+            visitor(&entry.second);
+        }
+    }
+
+    template <typename Visitor>
+    void Visit(Visitor visitor)
+    {
+        static_cast<const PagedObjectInfoMap*>(this)->Visit([&](const T* info) { visitor(const_cast<T*>(info)); });
+    }
+
+  private:
+    static const size_t           kPageSize   = 64;
+    static const format::HandleId kMaxPagedId = 1 << 22;
+
+    struct Page
+    {
+        std::unique_ptr<T> infos[kPageSize];
+        size_t             count{ 0 };
+    };
+
+    Page* GetPage(format::HandleId id) const
+    {
+        size_t page_index = static_cast<size_t>(id / kPageSize);
+        return (page_index < pages_.size()) ? pages_[page_index].get() : nullptr;
+    }
+
+    std::vector<std::unique_ptr<Page>>      pages_;
+    std::unordered_map<format::HandleId, T> sparse_infos_;
+};
+
+// Returns the first info structure that the predicate accepts, or nullptr.
+template <typename T, typename Predicate>
+T* FindObjectInfo(std::unordered_map<format::HandleId, T>* map, Predicate predicate)
+{
+    assert(map != nullptr);
+
+    for (auto& entry : *map)
+    {
+        if (predicate(entry.second))
+        {
+            return &entry.second;
+        }
+    }
+
+    return nullptr;
+}
+
+template <typename T, typename Predicate>
+T* FindObjectInfo(PagedObjectInfoMap<T>* map, Predicate predicate)
+{
+    assert(map != nullptr);
+
+    T* object_info = nullptr;
+    map->Visit([&](T* info) {
+        if ((object_info == nullptr) && predicate(*info))
+        {
+            object_info = info;
+        }
+    });
+
+    return object_info;
+}
+
 class VulkanObjectInfoTableBase
 {
   protected:
@@ -68,6 +242,23 @@ class VulkanObjectInfoTableBase
         }
     }
 
+    template <typename T>
+    void AddObjectInfo(T&& info, PagedObjectInfoMap<T>* map)
+    {
+        assert(map != nullptr);
+
+        if ((info.capture_id != 0) && (info.handle != VK_NULL_HANDLE))
+        {
+            auto result = map->Insert(info.capture_id, std::forward<T>(info));
+
+            // The existing info structure is only replaced for a new handle, as described for the unordered map.
+            if (!result.second && (result.first->handle != info.handle))
+            {
+                *result.first = std::forward<T>(info);
+            }
+        }
+    }
+
     template <typename T>
     const T* GetObjectInfo(format::HandleId id, const std::unordered_map<format::HandleId, T>* map) const
     {
@@ -107,6 +298,20 @@ class VulkanObjectInfoTableBase
 
         return object_info;
     }
+
+    template <typename T>
+    const T* GetObjectInfo(format::HandleId id, const PagedObjectInfoMap<T>* map) const
+    {
+        assert(map != nullptr);
+        return (id != 0) ? map->Find(id) : nullptr;
+    }
+
+    template <typename T>
+    T* GetObjectInfo(format::HandleId id, PagedObjectInfoMap<T>* map)
+    {
+        assert(map != nullptr);
+        return (id != 0) ? map->Find(id) : nullptr;
+    }
 };
 
 GFXRECON_END_NAMESPACE(decode)
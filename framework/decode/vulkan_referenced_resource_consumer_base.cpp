@@ -34,6 +34,39 @@ VulkanReferencedResourceConsumerBase::VulkanReferencedResourceConsumerBase() :
     loading_state_(false), loaded_state_(false)
 {}
 
+bool VulkanReferencedResourceConsumerBase::IsApiCallHandled(format::ApiCallId call_id) const
+{
+    switch (call_id)
+    {
+        case format::ApiCallId::ApiCall_vkQueueSubmit:
+        case format::ApiCallId::ApiCall_vkCreateBuffer:
+        case format::ApiCallId::ApiCall_vkCreateBufferView:
+        case format::ApiCallId::ApiCall_vkCreateImage:
+        case format::ApiCallId::ApiCall_vkCreateImageView:
+        case format::ApiCallId::ApiCall_vkCreateFramebuffer:
+        case format::ApiCallId::ApiCall_vkCreateDescriptorSetLayout:
+        case format::ApiCallId::ApiCall_vkCreateDescriptorUpdateTemplate:
+        case format::ApiCallId::ApiCall_vkCreateDescriptorUpdateTemplateKHR:
+        case format::ApiCallId::ApiCall_vkDestroyDescriptorPool:
+        case format::ApiCallId::ApiCall_vkResetDescriptorPool:
+        case format::ApiCallId::ApiCall_vkAllocateDescriptorSets:
+        case format::ApiCallId::ApiCall_vkFreeDescriptorSets:
+        case format::ApiCallId::ApiCall_vkUpdateDescriptorSets:
+        case format::ApiCallId::ApiCall_vkUpdateDescriptorSetWithTemplate:
+        case format::ApiCallId::ApiCall_vkCmdPushDescriptorSetWithTemplateKHR:
+        case format::ApiCallId::ApiCall_vkUpdateDescriptorSetWithTemplateKHR:
+        case format::ApiCallId::ApiCall_vkDestroyCommandPool:
+        case format::ApiCallId::ApiCall_vkResetCommandPool:
+        case format::ApiCallId::ApiCall_vkAllocateCommandBuffers:
+        case format::ApiCallId::ApiCall_vkFreeCommandBuffers:
+        case format::ApiCallId::ApiCall_vkBeginCommandBuffer:
+        case format::ApiCallId::ApiCall_vkResetCommandBuffer:
+            return true;
+        default:
+            return false;
+    }
+}
+
 void VulkanReferencedResourceConsumerBase::Process_vkQueueSubmit(const ApiCallInfo& call_info,
                                                                  VkResult           returnValue,
                                                                  format::HandleId   queue,
@@ -56,6 +56,8 @@ class VulkanReferencedResourceConsumerBase : public VulkanConsumer
         loaded_state_  = true;
     }
 
+    virtual bool IsApiCallHandled(format::ApiCallId call_id) const override;
+
     virtual void Process_vkQueueSubmit(const ApiCallInfo&                          call_info,
                                        VkResult                                    returnValue,
                                        format::HandleId                            queue,
@@ -141,9 +141,10 @@ static uint32_t GetHardwareBufferFormatBpp(uint32_t format)
 
 VulkanReplayConsumerBase::VulkanReplayConsumerBase(std::shared_ptr<application::Application> application,
                                                    const VulkanReplayOptions&                options) :
-    loader_handle_(nullptr),
-    get_instance_proc_addr_(nullptr), create_instance_proc_(nullptr), application_(application), options_(options),
-    loading_trim_state_(false), have_imported_semaphores_(false), create_surface_count_(0), fps_info_(nullptr)
+    loader_handle_(nullptr), get_instance_proc_addr_(nullptr), create_instance_proc_(nullptr),
+    last_instance_key_(nullptr), last_instance_table_(nullptr), last_device_key_(nullptr), last_device_table_(nullptr),
+    application_(application), options_(options), loading_trim_state_(false), have_imported_semaphores_(false),
+    create_surface_count_(0), fps_info_(nullptr)
 {
     assert(application_ != nullptr);
     assert(options.create_resource_allocator != nullptr);
@@ -1552,16 +1553,44 @@ PFN_vkCreateDevice VulkanReplayConsumerBase::GetCreateDeviceProc(VkPhysicalDevic
 
 const encode::InstanceTable* VulkanReplayConsumerBase::GetInstanceTable(const void* handle) const
 {
-    auto table = instance_tables_.find(encode::GetDispatchKey(handle));
-    assert(table != instance_tables_.end());
-    return (table != instance_tables_.end()) ? &table->second : nullptr;
+    // Most calls are made with the same instance as the previous call, so the last table found is checked before
+    // searching the table map. Table map entries are never erased, so the cached table pointer remains valid.
+    encode::DispatchKey dispatch_key = encode::GetDispatchKey(handle);
+    if (dispatch_key != last_instance_key_)
+    {
+        auto table = instance_tables_.find(dispatch_key);
+        assert(table != instance_tables_.end());
+        if (table == instance_tables_.end())
+        {
+            return nullptr;
+        }
+
+        last_instance_key_   = dispatch_key;
+        last_instance_table_ = &table->second;
+    }
+
+    return last_instance_table_;
 }
 
 const encode::DeviceTable* VulkanReplayConsumerBase::GetDeviceTable(const void* handle) const
 {
-    auto table = device_tables_.find(encode::GetDispatchKey(handle));
-    assert(table != device_tables_.end());
-    return (table != device_tables_.end()) ? &table->second : nullptr;
+    // Most calls are made with the same device as the previous call, so the last table found is checked before
+    // searching the table map.
+    encode::DispatchKey dispatch_key = encode::GetDispatchKey(handle);
+    if (dispatch_key != last_device_key_)
+    {
+        auto table = device_tables_.find(dispatch_key);
+        assert(table != device_tables_.end());
+        if (table == device_tables_.end())
+        {
+            return nullptr;
+        }
+
+        last_device_key_   = dispatch_key;
+        last_device_table_ = &table->second;
+    }
+
+    return last_device_table_;
 }
 
 void* VulkanReplayConsumerBase::PreProcessExternalObject(uint64_t          object_id,
@@ -998,6 +998,10 @@ class VulkanReplayConsumerBase : public VulkanConsumer
     std::unordered_map<encode::DispatchKey, PFN_vkCreateDevice>      create_device_procs_;
     std::unordered_map<encode::DispatchKey, encode::InstanceTable>   instance_tables_;
     std::unordered_map<encode::DispatchKey, encode::DeviceTable>     device_tables_;
+    mutable encode::DispatchKey                                      last_instance_key_;
+    mutable const encode::InstanceTable*                             last_instance_table_;
+    mutable encode::DispatchKey                                      last_device_key_;
+    mutable const encode::DeviceTable*                               last_device_table_;
     std::function<void(const char*)>                                 fatal_error_handler_;
     std::shared_ptr<application::Application>                        application_;
     VulkanObjectInfoTable                                            object_info_table_;
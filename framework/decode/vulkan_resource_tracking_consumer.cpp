@@ -39,9 +39,9 @@ const std::vector<std::string> kLoaderLibNames = {
 
 VulkanResourceTrackingConsumer::VulkanResourceTrackingConsumer(
     const VulkanReplayOptions& options, VulkanTrackedObjectInfoTable* tracked_object_info_table) :
-    options_(options),
-    loader_handle_(nullptr), get_instance_proc_addr_(nullptr), create_instance_function_(nullptr),
-    tracked_object_info_table_(tracked_object_info_table)
+    options_(options), loader_handle_(nullptr), last_instance_key_(nullptr), last_instance_table_(nullptr),
+    last_device_key_(nullptr), last_device_table_(nullptr), get_instance_proc_addr_(nullptr),
+    create_instance_function_(nullptr), tracked_object_info_table_(tracked_object_info_table)
 {
     assert(tracked_object_info_table != nullptr);
 }
@@ -112,16 +112,44 @@ PFN_vkCreateDevice VulkanResourceTrackingConsumer::GetCreateDeviceProc(VkPhysica
 
 const encode::InstanceTable* VulkanResourceTrackingConsumer::GetInstanceTable(const void* handle) const
 {
-    auto table = instance_tables_.find(encode::GetDispatchKey(handle));
-    assert(table != instance_tables_.end());
-    return (table != instance_tables_.end()) ? &table->second : nullptr;
+    // Most calls are made with the same instance as the previous call, so the last table found is checked before
+    // searching the table map. Table map entries are never erased, so the cached table pointer remains valid.
+    encode::DispatchKey dispatch_key = encode::GetDispatchKey(handle);
+    if (dispatch_key != last_instance_key_)
+    {
+        auto table = instance_tables_.find(dispatch_key);
+        assert(table != instance_tables_.end());
+        if (table == instance_tables_.end())
+        {
+            return nullptr;
+        }
+
+        last_instance_key_   = dispatch_key;
+        last_instance_table_ = &table->second;
+    }
+
+    return last_instance_table_;
 }
 
 const encode::DeviceTable* VulkanResourceTrackingConsumer::GetDeviceTable(const void* handle) const
 {
-    auto table = device_tables_.find(encode::GetDispatchKey(handle));
-    assert(table != device_tables_.end());
-    return (table != device_tables_.end()) ? &table->second : nullptr;
+    // Most calls are made with the same device as the previous call, so the last table found is checked before
+    // searching the table map.
+    encode::DispatchKey dispatch_key = encode::GetDispatchKey(handle);
+    if (dispatch_key != last_device_key_)
+    {
+        auto table = device_tables_.find(dispatch_key);
+        assert(table != device_tables_.end());
+        if (table == device_tables_.end())
+        {
+            return nullptr;
+        }
+
+        last_device_key_   = dispatch_key;
+        last_device_table_ = &table->second;
+    }
+
+    return last_device_table_;
 }
 
 void VulkanResourceTrackingConsumer::Process_vkCreateInstance(
@@ -184,6 +184,10 @@ class VulkanResourceTrackingConsumer : public VulkanConsumer
     std::unordered_map<encode::DispatchKey, PFN_vkCreateDevice>      create_device_procs_;
     std::unordered_map<encode::DispatchKey, encode::InstanceTable>   instance_tables_;
     std::unordered_map<encode::DispatchKey, encode::DeviceTable>     device_tables_;
+    mutable encode::DispatchKey                                      last_instance_key_;
+    mutable const encode::InstanceTable*                             last_instance_table_;
+    mutable encode::DispatchKey                                      last_device_key_;
+    mutable const encode::DeviceTable*                               last_device_table_;
     // funtion pointers to the API calls that will be made during the first pass of replay
     PFN_vkCreateInstance      create_instance_function_;
     PFN_vkGetInstanceProcAddr get_instance_proc_addr_;
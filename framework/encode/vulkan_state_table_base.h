@@ -29,9 +29,13 @@
 
 #include "vulkan/vulkan.h"
 
+#include <algorithm>
 #include <cassert>
 #include <functional>
 #include <map>
+#include <unordered_map>
+#include <utility>
+#include <vector>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(encode)
@@ -44,33 +48,53 @@ class VulkanStateTableBase
     ~VulkanStateTableBase() {}
 
   protected:
-    template <typename T>
-    bool InsertEntry(format::HandleId id, T* wrapper, std::map<format::HandleId, T*>& map)
+    // The entry functions accept either std::map or std::unordered_map, depending on the type of map selected for the
+    // generated state table.
+    template <typename T, typename Map>
+    bool InsertEntry(format::HandleId id, T* wrapper, Map& map)
     {
         const auto& inserted = map.insert(std::make_pair(id, wrapper));
         return inserted.second;
     }
 
-    template <typename Wrapper>
-    bool RemoveEntry(const Wrapper* wrapper, std::map<format::HandleId, Wrapper*>& map)
+    template <typename Wrapper, typename Map>
+    bool RemoveEntry(const Wrapper* wrapper, Map& map)
     {
         assert(wrapper != nullptr);
         return (map.erase(wrapper->handle_id) != 0);
     }
 
-    template <typename T>
-    T* GetWrapper(format::HandleId id, std::map<format::HandleId, T*>& map)
+    template <typename T, typename Map>
+    T* GetWrapper(format::HandleId id, Map& map)
     {
         auto entry = map.find(id);
         return (entry != map.end()) ? entry->second : nullptr;
     }
 
-    template <typename T>
-    const T* GetWrapper(format::HandleId id, const std::map<format::HandleId, T*>& map) const
+    template <typename T, typename Map>
+    const T* GetWrapper(format::HandleId id, const Map& map) const
     {
         auto entry = map.find(id);
         return (entry != map.end()) ? entry->second : nullptr;
     }
+
+    template <typename T>
+    void VisitEntries(const std::unordered_map<format::HandleId, T*>& map, const std::function<void(T*)>& visitor) const
+    {
+        // Visit the entries in handle ID order, which is the order that the state writer expects, as it is the order
+        // that the objects were created.
+        std::vector<std::pair<format::HandleId, T*>> entries(map.begin(), map.end());
+        std::sort(entries.begin(),
+                  entries.end(),
+                  [](const std::pair<format::HandleId, T*>& lhs, const std::pair<format::HandleId, T*>& rhs) {
+                      return lhs.first < rhs.first;
+                  });
+
+        for (const auto& entry : entries)
+        {
+            visitor(entry.second);
+        }
+    }
 };
 
 GFXRECON_END_NAMESPACE(encode)
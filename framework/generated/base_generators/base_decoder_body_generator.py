@@ -27,6 +27,17 @@ from base_generator import ValueInfo, write
 class BaseDecoderBodyGenerator():
     """Base class for generating decoder body code."""
 
+    # Generate decoders that defer decoding of array parameters until they are accessed by a consumer.
+    lazy_decode = False
+
+    # Commands with custom decoders implemented by VulkanDecoderBase, which are added to the
+    # VulkanDecoder::DecodeFunctionCall dispatch table.
+    BASE_DECODER_CMDS = [
+        'vkUpdateDescriptorSetWithTemplate',
+        'vkCmdPushDescriptorSetWithTemplateKHR',
+        'vkUpdateDescriptorSetWithTemplateKHR'
+    ]
+
     def generate_feature(self):
         """Performs C++ code generation for the feature."""
         platform_type = 'Vulkan'
@@ -105,6 +116,18 @@ class BaseDecoderBodyGenerator():
         if values or return_type:
             body += '\n'
 
+        # Defer decoding of value and handle arrays, which can be skipped without decoding them.
+        if self.lazy_decode:
+            lazy_values = [
+                value for value in values if self.is_lazy_decoded_param_type(
+                    self.make_decoded_param_type(value)
+                )
+            ]
+            for value in lazy_values:
+                body += '    {}.SetDecodeOnAccess(true);\n'.format(value.name)
+            if lazy_values:
+                body += '\n'
+
         # Decode() method calls for pointer decoder wrappers.
         for value in values:
             body += BaseDecoderBodyGenerator.make_decode_invocation(
@@ -146,6 +169,18 @@ class BaseDecoderBodyGenerator():
 
         return body
 
+    def is_lazy_decoded_param_type(self, decode_type):
+        """Determine if a parameter decoder type supports deferring decoding until the decoded data is accessed.
+        Only arrays of values with a fixed encoded size qualify, as the encoded size of structs and strings is not
+        known until they are decoded."""
+        if decode_type.startswith('HandlePointerDecoder<'):
+            return True
+        if decode_type.startswith('PointerDecoder<'):
+            # Exclude the PointerDecoder<T*> specialization for 2D arrays.
+            element_type = decode_type[len('PointerDecoder<'):-1].split(',')[0]
+            return not element_type.endswith('*')
+        return False
+
     def make_decode_invocation(self, value):
         """Generate parameter decode function/method invocation."""
         buffer_args = '(parameter_buffer + bytes_read), (buffer_size - bytes_read)'
@@ -256,3 +291,97 @@ class BaseDecoderBodyGenerator():
 
         write('    }', file=self.outFile)
         write('}\n', file=self.outFile)
+
+    def generate_decode_table(self):
+        """Generate the VulkanDecoder::DecodeFunctionCall method, dispatching through a table of member
+        function pointers indexed by the low bits of the API call ID instead of a switch statement."""
+        write(
+            'void VulkanDecoder::DecodeFunctionCall(format::ApiCallId             call_id,',
+            file=self.outFile
+        )
+        write(
+            '                                       const ApiCallInfo&            call_info,',
+            file=self.outFile
+        )
+        write(
+            '                                       const uint8_t*                parameter_buffer,',
+            file=self.outFile
+        )
+        write(
+            '                                       size_t                        buffer_size)',
+            file=self.outFile
+        )
+        write('{', file=self.outFile)
+        write(
+            '    using DecodeFunction = size_t (VulkanDecoder::*)(const ApiCallInfo&, const uint8_t*, size_t);',
+            file=self.outFile
+        )
+        self.newline()
+        write(
+            '    static constexpr uint32_t kApiCallIndexMask = 0x0000ffff;',
+            file=self.outFile
+        )
+        write(
+            '    static constexpr uint32_t kFirstApiCallIndex = format::ApiCallId::ApiCall_vkCreateInstance & kApiCallIndexMask;',
+            file=self.outFile
+        )
+        write(
+            '    static constexpr uint32_t kDecodeTableSize = (format::ApiCallId::ApiCall_VulkanLast & kApiCallIndexMask) - kFirstApiCallIndex;',
+            file=self.outFile
+        )
+        self.newline()
+        write(
+            '    static const std::array<DecodeFunction, kDecodeTableSize> decode_table = []() {',
+            file=self.outFile
+        )
+        write(
+            '        std::array<DecodeFunction, kDecodeTableSize> table{};',
+            file=self.outFile
+        )
+        write(
+            '        auto get_index = [](format::ApiCallId id) { return (id & kApiCallIndexMask) - kFirstApiCallIndex; };',
+            file=self.outFile
+        )
+        self.newline()
+
+        cmd_names = self.cmd_names + [
+            cmd for cmd in self.BASE_DECODER_CMDS if cmd not in self.cmd_names
+        ]
+        for cmd in cmd_names:
+            write(
+                '        table[get_index(format::ApiCallId::ApiCall_{0})] = &VulkanDecoder::Decode_{0};'
+                .format(cmd),
+                file=self.outFile
+            )
+
+        self.newline()
+        write('        return table;', file=self.outFile)
+        write('    }();', file=self.outFile)
+        self.newline()
+        write(
+            '    // API call IDs below the first Vulkan API call wrap around to an index that is out of range.',
+            file=self.outFile
+        )
+        write(
+            '    const uint32_t index = (call_id & kApiCallIndexMask) - kFirstApiCallIndex;',
+            file=self.outFile
+        )
+        write(
+            '    if ((format::GetApiCallFamily(call_id) == format::ApiFamilyId::ApiFamily_Vulkan) && (index < kDecodeTableSize) &&',
+            file=self.outFile
+        )
+        write('        (decode_table[index] != nullptr))', file=self.outFile)
+        write('    {', file=self.outFile)
+        write(
+            '        (this->*decode_table[index])(call_info, parameter_buffer, buffer_size);',
+            file=self.outFile
+        )
+        write('    }', file=self.outFile)
+        write('    else', file=self.outFile)
+        write('    {', file=self.outFile)
+        write(
+            '        VulkanDecoderBase::DecodeFunctionCall(call_id, call_info, parameter_buffer, buffer_size);',
+            file=self.outFile
+        )
+        write('    }', file=self.outFile)
+        write('}\n', file=self.outFile)
@@ -183,52 +183,68 @@ class BaseStructHandleMappersBodyGenerator():
             base_type = 'handle'
             given_object = ''
 
-        body = ''
+        body = []
         for member in handle_members:
-            body += '\n'
+            body.append('\n')
             map_func = self.MAP_STRUCT_TYPE.get(member.base_type)
 
             if ('pNext' in member.name) and (not is_dx12_class):
-                body += '        if (wrapper->pNext)\n'
-                body += '        {\n'
-                body += '            MapPNextStructHandles(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), object_info_table);\n'
-                body += '        }\n'
+                body.append('        if (wrapper->pNext)\n')
+                body.append('        {\n')
+                body.append(
+                    '            MapPNextStructHandles(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), object_info_table);\n'
+                )
+                body.append('        }\n')
             elif map_func:
                 if member.is_array:
-                    body += '    if ({0})\n'\
-                            '    {{\n'\
-                            '        object_mapping::{2}(value->{0}->GetPointer(), {1}, {3});\n'\
-                            '    }}\n'.format(
-                        member.name, member.array_length, map_func[1], map_func[2]
+                    body.append(
+                        '    if ({0})\n'
+                        '    {{\n'
+                        '        object_mapping::{2}(value->{0}->GetPointer(), {1}, {3});\n'
+                        '    }}\n'.format(
+                            member.name, member.array_length, map_func[1],
+                            map_func[2]
+                        )
                     )
                 else:
                     if member.is_pointer:
-                        body += '    if ({0})\n'\
-                                '    {{\n'\
-                                '        object_mapping::{1}(value->{0}->GetPointer(), {2});\n'\
-                                '    }}\n'.format(
-                            member.name, map_func[0], map_func[2]
+                        body.append(
+                            '    if ({0})\n'
+                            '    {{\n'
+                            '        object_mapping::{1}(value->{0}->GetPointer(), {2});\n'
+                            '    }}\n'.format(
+                                member.name, map_func[0], map_func[2]
+                            )
                         )
                     else:
-                        body += '        object_mapping::{}(value->{}, {});\n'.format(
-                            map_func[0], member.name, map_func[2]
+                        body.append(
+                            '        object_mapping::{}(value->{}, {});\n'.
+                            format(map_func[0], member.name, map_func[2])
                         )
             elif self.is_struct(member.base_type):
                 # This is a struct that includes handles.
                 if member.is_array:
-                    body += '        MapStructArray{}<Decoded_{}>(wrapper->{name}->GetMetaStructPointer(), wrapper->{name}->GetLength(), object_info_table{});\n'.format(
-                        map_types,
-                        member.base_type,
-                        given_object,
-                        name=member.name
+                    body.append(
+                        '        MapStructArray{}<Decoded_{}>(wrapper->{name}->GetMetaStructPointer(), wrapper->{name}->GetLength(), object_info_table{});\n'
+                        .format(
+                            map_types,
+                            member.base_type,
+                            given_object,
+                            name=member.name
+                        )
                     )
                 elif member.is_pointer:
-                    body += '        MapStructArray{}<Decoded_{}>(wrapper->{}->GetMetaStructPointer(), 1, object_info_table{});\n'.format(
-                        map_types, member.base_type, member.name, given_object
+                    body.append(
+                        '        MapStructArray{}<Decoded_{}>(wrapper->{}->GetMetaStructPointer(), 1, object_info_table{});\n'
+                        .format(
+                            map_types, member.base_type, member.name,
+                            given_object
+                        )
                     )
                 else:
-                    body += '        MapStruct{}(wrapper->{}, object_info_table{});\n'.format(
-                        map_types, member.name, given_object
+                    body.append(
+                        '        MapStruct{}(wrapper->{}, object_info_table{});\n'
+                        .format(map_types, member.name, given_object)
                     )
             else:
                 type = member.base_type
@@ -246,40 +262,52 @@ class BaseStructHandleMappersBodyGenerator():
                     )
                 ):
                     if member.is_dynamic or member.is_pointer:
-                        body += '        value->{name} = {}_mapping::Map{}Array<{type}>(&wrapper->{name}, object_info_table{});\n'.format(
-                            base_type,
-                            map_type,
-                            object_info_table_get,
-                            type=type,
-                            name=member.name
+                        body.append(
+                            '        value->{name} = {}_mapping::Map{}Array<{type}>(&wrapper->{name}, object_info_table{});\n'
+                            .format(
+                                base_type,
+                                map_type,
+                                object_info_table_get,
+                                type=type,
+                                name=member.name
+                            )
                         )
                     else:
-                        body += '        {}_mapping::Map{}Array<{type}>(&wrapper->{name}, object_info_table{});\n'.format(
+                        body.append(
+                            '        {}_mapping::Map{}Array<{type}>(&wrapper->{name}, object_info_table{});\n'
+                            .format(
+                                base_type,
+                                map_type,
+                                object_info_table_get,
+                                type=type,
+                                name=member.name
+                            )
+                        )
+                else:
+                    body.append(
+                        '        value->{name} = {}_mapping::Map{}<{type}>(wrapper->{name}, object_info_table{});\n'
+                        .format(
                             base_type,
                             map_type,
                             object_info_table_get,
                             type=type,
                             name=member.name
                         )
-                else:
-                    body += '        value->{name} = {}_mapping::Map{}<{type}>(wrapper->{name}, object_info_table{});\n'.format(
-                        base_type,
-                        map_type,
-                        object_info_table_get,
-                        type=type,
-                        name=member.name
                     )
 
         for member in generic_handle_members:
-            body += '\n'
-            body += '        value->{name} = {}_mapping::Map{}(wrapper->{name}, value->{}, object_info_table);\n'.format(
-                base_type,
-                map_type,
-                generic_handle_members[member],
-                name=member
+            body.append('\n')
+            body.append(
+                '        value->{name} = {}_mapping::Map{}(wrapper->{name}, value->{}, object_info_table);\n'
+                .format(
+                    base_type,
+                    map_type,
+                    generic_handle_members[member],
+                    name=member
+                )
             )
 
-        return body
+        return ''.join(body)
 
     def make_struct_handle_additions(self, name, members):
         """Generating expressions for adding mappings for handles created at replay that are embedded in structs."""
@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2021 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+'''Benchmark the GFXR Vulkan code generators
+
+Builds a synthetic Vulkan registry (vk.xml) of configurable size, runs the generator
+for each target generated by generate_vulkan.py against it, and reports the time,
+peak memory and output size of each target as JSON.
+'''
+
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from generate_vulkan import SCRIPT_DIR, KHRONOS_REGISTRY_DIR, BASE_GENERATOR_DIR, GENERATOR_DIR, VK_HEADERS_DIR, generate_targets
+
+# Types used for the struct members and command parameters that are not handles.
+value_types = ['uint32_t', 'int32_t', 'float', 'VkBool32', 'VkDeviceSize']
+
+
+class SyntheticRegistry():
+    """SyntheticRegistry - Class to build a synthetic Vulkan registry.
+    The registry contains the core types and commands that the generators expect to find,
+    along with the requested number of structs, commands and handle types.  A quarter of the
+    commands are command buffer commands, and each handle type has create and destroy
+    commands.  Struct members and command parameters are handles with the specified
+    probability; other members are scalars, scalar arrays, or pointers to previously
+    defined structs.  The pNext extending structs are defined by a device extension.
+
+    Members:
+      struct_count - Number of structs.
+      command_count - Number of commands, not including handle create and destroy commands.
+      pnext_struct_count - Number of structs extending the pNext chains of other structs.
+      handle_count - Number of non-dispatchable handle types.
+      handle_density - Probability that a struct member or command parameter is a handle.
+    """
+
+    def __init__(
+        self,
+        struct_count,
+        command_count,
+        pnext_struct_count,
+        handle_count,
+        handle_density,
+        seed=0
+    ):
+        self.struct_count = struct_count
+        self.command_count = command_count
+        self.pnext_struct_count = pnext_struct_count
+        self.handle_count = handle_count
+        self.handle_density = handle_density
+        self.random = random.Random(seed)
+
+        self.handles = [
+            'VkSynthHandle{}'.format(i) for i in range(handle_count)
+        ]
+        self.structs = [
+            'VkSynthStruct{}'.format(i) for i in range(struct_count)
+        ]
+        self.pnext_structs = [
+            'VkSynthExtensionStruct{}'.format(i)
+            for i in range(pnext_struct_count)
+        ]
+
+    def get_stype(self, struct):
+        """Return the VkStructureType value for a struct."""
+        words = re.sub('([A-Z])', '_\\1', struct[2:])
+        words = re.sub('([a-z])([0-9])', '\\1_\\2', words)
+        return 'VK_STRUCTURE_TYPE' + words.upper()
+
+    def make_value(self, name, defined_structs):
+        """Return the declaration of a struct member or command parameter with a random type."""
+        if self.handles and (self.random.random() < self.handle_density):
+            handle = self.random.choice(self.handles)
+            if self.random.random() < 0.25:
+                return [
+                    '<type>uint32_t</type> <name>{}Count</name>'.format(name),
+                    'const <type>{}</type>* <name>p{}s</name>'.format(
+                        handle, name.capitalize()
+                    )
+                ], ['', '{}Count'.format(name)]
+            return ['<type>{}</type> <name>{}</name>'.format(handle,
+                                                             name)], ['']
+
+        choice = self.random.random()
+        if defined_structs and (choice < 0.2):
+            struct = self.random.choice(defined_structs)
+            return [
+                'const <type>{}</type>* <name>p{}</name>'.format(
+                    struct, name.capitalize()
+                )
+            ], ['']
+        if choice < 0.3:
+            return [
+                '<type>uint32_t</type> <name>{}Count</name>'.format(name),
+                'const <type>uint32_t</type>* <name>p{}s</name>'.format(
+                    name.capitalize()
+                )
+            ], ['', '{}Count'.format(name)]
+        return [
+            '<type>{}</type> <name>{}</name>'.format(
+                self.random.choice(value_types), name
+            )
+        ], ['']
+
+    def make_struct(self, struct, defined_structs, extends=None):
+        """Return the XML definition of a struct with sType and pNext members."""
+        lines = []
+        if extends:
+            lines.append(
+                '        <type category="struct" name="{}" structextends="{}">'
+                .format(struct, ','.join(extends))
+            )
+        else:
+            lines.append(
+                '        <type category="struct" name="{}">'.format(struct)
+            )
+        lines.append(
+            '            <member values="{}"><type>VkStructureType</type> <name>sType</name></member>'
+            .format(self.get_stype(struct))
+        )
+        lines.append(
+            '            <member optional="true">const <type>void</type>* <name>pNext</name></member>'
+        )
+        for index in range(self.random.randint(1, 8)):
+            decls, lengths = self.make_value(
+                'member{}'.format(index), defined_structs
+            )
+            for decl, length in zip(decls, lengths):
+                if length:
+                    lines.append(
+                        '            <member len="{}">{}</member>'.format(
+                            length, decl
+                        )
+                    )
+                else:
+                    lines.append(
+                        '            <member>{}</member>'.format(decl)
+                    )
+        lines.append('        </type>')
+        return lines
+
+    def make_command(self, name, return_type, params, attributes=''):
+        """Return the XML definition of a command from a list of (declaration, length) pairs."""
+        lines = [
+            '        <command{}>'.format(attributes),
+            '            <proto><type>{}</type> <name>{}</name></proto>'.
+            format(return_type, name)
+        ]
+        for decl, length in params:
+            if length:
+                lines.append(
+                    '            <param len="{}">{}</param>'.format(
+                        length, decl
+                    )
+                )
+            else:
+                lines.append('            <param>{}</param>'.format(decl))
+        lines.append('        </command>')
+        return lines
+
+    def build(self):
+        """Return the content of the synthetic vk.xml file."""
+        success = ' successcodes="VK_SUCCESS" errorcodes="VK_ERROR_OUT_OF_HOST_MEMORY"'
+        lines = [
+            '<?xml version="1.0" encoding="UTF-8"?>', '<registry>',
+            '    <comment>Synthetic registry generated by benchmark_vulkan.py</comment>',
+            '    <types>',
+            '        <type name="vk_platform" category="include">#include "vk_platform.h"</type>',
+            '        <type requires="vk_platform" name="void"/>',
+            '        <type requires="vk_platform" name="char"/>',
+            '        <type requires="vk_platform" name="float"/>',
+            '        <type requires="vk_platform" name="uint8_t"/>',
+            '        <type requires="vk_platform" name="uint32_t"/>',
+            '        <type requires="vk_platform" name="uint64_t"/>',
+            '        <type requires="vk_platform" name="int32_t"/>',
+            '        <type requires="vk_platform" name="size_t"/>',
+            '        <type category="define">#define <name>VK_DEFINE_HANDLE</name>(object) typedef struct object##_T* object;</type>',
+            '        <type category="define">#define <name>VK_DEFINE_NON_DISPATCHABLE_HANDLE</name>(object) typedef uint64_t object;</type>',
+            '        <type category="basetype">typedef <type>uint32_t</type> <name>VkBool32</name>;</type>',
+            '        <type category="basetype">typedef <type>uint32_t</type> <name>VkFlags</name>;</type>',
+            '        <type category="basetype">typedef <type>uint64_t</type> <name>VkDeviceSize</name>;</type>',
+            '        <type name="VkResult" category="enum"/>',
+            '        <type name="VkStructureType" category="enum"/>',
+            '        <type name="VkObjectType" category="enum"/>',
+            '        <type category="funcpointer">typedef void (VKAPI_PTR *<name>PFN_vkVoidFunction</name>)(void);</type>',
+            '        <type category="handle" objtypeenum="VK_OBJECT_TYPE_INSTANCE"><type>VK_DEFINE_HANDLE</type>(<name>VkInstance</name>)</type>',
+            '        <type category="handle" parent="VkInstance" objtypeenum="VK_OBJECT_TYPE_PHYSICAL_DEVICE"><type>VK_DEFINE_HANDLE</type>(<name>VkPhysicalDevice</name>)</type>',
+            '        <type category="handle" parent="VkPhysicalDevice" objtypeenum="VK_OBJECT_TYPE_DEVICE"><type>VK_DEFINE_HANDLE</type>(<name>VkDevice</name>)</type>',
+            '        <type category="handle" parent="VkDevice" objtypeenum="VK_OBJECT_TYPE_COMMAND_BUFFER"><type>VK_DEFINE_HANDLE</type>(<name>VkCommandBuffer</name>)</type>'
+        ]
+        for handle in self.handles:
+            lines.append(
+                '        <type category="handle" parent="VkDevice" objtypeenum="{}"><type>VK_DEFINE_NON_DISPATCHABLE_HANDLE</type>(<name>{}</name>)</type>'
+                .format(self.get_object_type(handle), handle)
+            )
+
+        lines += [
+            '        <type category="struct" name="VkAllocationCallbacks">',
+            '            <member optional="true"><type>void</type>* <name>pUserData</name></member>',
+            '        </type>',
+            '        <type category="struct" name="VkInstanceCreateInfo">',
+            '            <member values="VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO"><type>VkStructureType</type> <name>sType</name></member>',
+            '            <member optional="true">const <type>void</type>* <name>pNext</name></member>',
+            '            <member optional="true"><type>uint32_t</type> <name>enabledExtensionCount</name></member>',
+            '            <member len="enabledExtensionCount,null-terminated">const <type>char</type>* const* <name>ppEnabledExtensionNames</name></member>',
+            '        </type>',
+            '        <type category="struct" name="VkDeviceCreateInfo">',
+            '            <member values="VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO"><type>VkStructureType</type> <name>sType</name></member>',
+            '            <member optional="true">const <type>void</type>* <name>pNext</name></member>',
+            '            <member optional="true"><type>uint32_t</type> <name>enabledExtensionCount</name></member>',
+            '            <member len="enabledExtensionCount,null-terminated">const <type>char</type>* const* <name>ppEnabledExtensionNames</name></member>',
+            '        </type>'
+        ]
+
+        defined_structs = []
+        for struct in self.structs:
+            lines += self.make_struct(struct, defined_structs)
+            defined_structs.append(struct)
+
+        for struct in self.pnext_structs:
+            extends = self.random.sample(
+                self.structs,
+                min(len(self.structs), self.random.randint(1, 3))
+            )
+            lines += self.make_struct(struct, defined_structs, extends)
+
+        lines.append('    </types>')
+
+        lines += [
+            '    <enums name="VkResult" type="enum">',
+            '        <enum value="0" name="VK_SUCCESS"/>',
+            '        <enum value="-1" name="VK_ERROR_OUT_OF_HOST_MEMORY"/>',
+            '    </enums>', '    <enums name="VkStructureType" type="enum">',
+            '        <enum value="1" name="VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO"/>',
+            '        <enum value="3" name="VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO"/>'
+        ]
+        for index, struct in enumerate(self.structs):
+            lines.append(
+                '        <enum value="{}" name="{}"/>'.format(
+                    index + 100, self.get_stype(struct)
+                )
+            )
+        lines.append('    </enums>')
+        lines += [
+            '    <enums name="VkObjectType" type="enum">',
+            '        <enum value="1" name="VK_OBJECT_TYPE_INSTANCE"/>',
+            '        <enum value="2" name="VK_OBJECT_TYPE_PHYSICAL_DEVICE"/>',
+            '        <enum value="3" name="VK_OBJECT_TYPE_DEVICE"/>',
+            '        <enum value="6" name="VK_OBJECT_TYPE_COMMAND_BUFFER"/>'
+        ]
+        for index, handle in enumerate(self.handles):
+            lines.append(
+                '        <enum value="{}" name="{}"/>'.format(
+                    index + 100, self.get_object_type(handle)
+                )
+            )
+        lines.append('    </enums>')
+
+        lines.append('    <commands>')
+        lines += self.make_command(
+            'vkCreateInstance', 'VkResult', [
+                (
+                    'const <type>VkInstanceCreateInfo</type>* <name>pCreateInfo</name>',
+                    ''
+                ),
+                (
+                    'const <type>VkAllocationCallbacks</type>* <name>pAllocator</name>',
+                    ''
+                ), ('<type>VkInstance</type>* <name>pInstance</name>', '')
+            ], success
+        )
+        lines += self.make_command(
+            'vkDestroyInstance', 'void', [
+                ('<type>VkInstance</type> <name>instance</name>', ''),
+                (
+                    'const <type>VkAllocationCallbacks</type>* <name>pAllocator</name>',
+                    ''
+                )
+            ]
+        )
+        lines += self.make_command(
+            'vkEnumeratePhysicalDevices', 'VkResult', [
+                ('<type>VkInstance</type> <name>instance</name>', ''),
+                (
+                    '<type>uint32_t</type>* <name>pPhysicalDeviceCount</name>',
+                    ''
+                ),
+                (
+                    '<type>VkPhysicalDevice</type>* <name>pPhysicalDevices</name>',
+                    'pPhysicalDeviceCount'
+                )
+            ], success
+        )
+        lines += self.make_command(
+            'vkCreateDevice', 'VkResult', [
+                (
+                    '<type>VkPhysicalDevice</type> <name>physicalDevice</name>',
+                    ''
+                ),
+                (
+                    'const <type>VkDeviceCreateInfo</type>* <name>pCreateInfo</name>',
+                    ''
+                ),
+                (
+                    'const <type>VkAllocationCallbacks</type>* <name>pAllocator</name>',
+                    ''
+                ), ('<type>VkDevice</type>* <name>pDevice</name>', '')
+            ], success
+        )
+        lines += self.make_command(
+            'vkDestroyDevice', 'void', [
+                ('<type>VkDevice</type> <name>device</name>', ''),
+                (
+                    'const <type>VkAllocationCallbacks</type>* <name>pAllocator</name>',
+                    ''
+                )
+            ]
+        )
+        lines += self.make_command(
+            'vkGetInstanceProcAddr', 'PFN_vkVoidFunction', [
+                ('<type>VkInstance</type> <name>instance</name>', ''),
+                (
+                    'const <type>char</type>* <name>pName</name>',
+                    'null-terminated'
+                )
+            ]
+        )
+        lines += self.make_command(
+            'vkGetDeviceProcAddr', 'PFN_vkVoidFunction', [
+                ('<type>VkDevice</type> <name>device</name>', ''),
+                (
+                    'const <type>char</type>* <name>pName</name>',
+                    'null-terminated'
+                )
+            ]
+        )
+
+        commands = []
+        for handle in self.handles:
+            create_info = self.random.choice(
+                self.structs
+            ) if self.structs else 'VkDeviceCreateInfo'
+            name = handle[2:]
+            commands.append('vkCreate' + name)
+            lines += self.make_command(
+                'vkCreate' + name, 'VkResult', [
+                    ('<type>VkDevice</type> <name>device</name>', ''),
+                    (
+                        'const <type>{}</type>* <name>pCreateInfo</name>'.
+                        format(create_info), ''
+                    ),
+                    (
+                        'const <type>VkAllocationCallbacks</type>* <name>pAllocator</name>',
+                        ''
+                    ),
+                    (
+                        '<type>{}</type>* <name>p{}</name>'.format(
+                            handle, name
+                        ), ''
+                    )
+                ], success
+            )
+            commands.append('vkDestroy' + name)
+            lines += self.make_command(
+                'vkDestroy' + name, 'void', [
+                    ('<type>VkDevice</type> <name>device</name>', ''),
+                    (
+                        '<type>{}</type> <name>{}</name>'.format(
+                            handle, name[0].lower() + name[1:]
+                        ), ''
+                    ),
+                    (
+                        'const <type>VkAllocationCallbacks</type>* <name>pAllocator</name>',
+                        ''
+                    )
+                ]
+            )
+
+        for index in range(self.command_count):
+            if index % 4 == 0:
+                name = 'vkCmdSynthCommand{}'.format(index)
+                return_type = 'void'
+                params = [
+                    (
+                        '<type>VkCommandBuffer</type> <name>commandBuffer</name>',
+                        ''
+                    )
+                ]
+                attributes = ''
+            else:
+                name = 'vkSynthCommand{}'.format(index)
+                return_type = 'VkResult'
+                params = [('<type>VkDevice</type> <name>device</name>', '')]
+                attributes = success
+            for param_index in range(self.random.randint(1, 5)):
+                decls, lengths = self.make_value(
+                    'param{}'.format(param_index), self.structs
+                )
+                params += zip(decls, lengths)
+            commands.append(name)
+            lines += self.make_command(name, return_type, params, attributes)
+
+        lines.append('    </commands>')
+
+        core_types = [
+            'VkInstance', 'VkPhysicalDevice', 'VkDevice', 'VkCommandBuffer',
+            'VkAllocationCallbacks', 'VkInstanceCreateInfo',
+            'VkDeviceCreateInfo'
+        ] + self.handles + self.structs
+        core_commands = [
+            'vkCreateInstance', 'vkDestroyInstance',
+            'vkEnumeratePhysicalDevices', 'vkCreateDevice', 'vkDestroyDevice',
+            'vkGetInstanceProcAddr', 'vkGetDeviceProcAddr'
+        ] + commands
+        lines += [
+            '    <feature api="vulkan" name="VK_VERSION_1_0" number="1.0" comment="Synthetic core API">',
+            '        <require>'
+        ]
+        lines += [
+            '            <type name="{}"/>'.format(name) for name in core_types
+        ]
+        lines += [
+            '            <command name="{}"/>'.format(name)
+            for name in core_commands
+        ]
+        lines += ['        </require>', '    </feature>']
+
+        lines += [
+            '    <extensions>',
+            '        <extension name="VK_EXT_synthetic" number="1" type="device" supported="vulkan">',
+            '            <require>',
+            '                <enum value="1" name="VK_EXT_SYNTHETIC_SPEC_VERSION"/>',
+            '                <enum value="&quot;VK_EXT_synthetic&quot;" name="VK_EXT_SYNTHETIC_EXTENSION_NAME"/>'
+        ]
+        for index, struct in enumerate(self.pnext_structs):
+            lines.append(
+                '                <enum offset="{}" extends="VkStructureType" name="{}"/>'
+                .format(index, self.get_stype(struct))
+            )
+            lines.append('                <type name="{}"/>'.format(struct))
+        lines += [
+            '            </require>', '        </extension>',
+            '    </extensions>', '</registry>', ''
+        ]
+        return '\n'.join(lines)
+
+    def get_object_type(self, handle):
+        """Return the VkObjectType value for a synthetic handle."""
+        return 'VK_OBJECT_TYPE_SYNTH_HANDLE_{}'.format(
+            handle[len('VkSynthHandle'):]
+        )
+
+
+def run_target(gencode_args, target, env, output_dir):
+    """Generate a single target in a separate process, returning its benchmark results."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        gencode_args + [target], env=env, cwd=SCRIPT_DIR, shell=False
+    )
+    peak_memory = None
+    if hasattr(os, 'wait4'):
+        # Use the resource usage of the generator process to determine its peak memory.
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        # The maximum resident set size is reported in bytes on macOS and kilobytes elsewhere.
+        peak_memory = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    else:
+        process.wait()
+    elapsed = time.perf_counter() - start
+
+    output_path = os.path.join(output_dir, target)
+    return {
+        'target':
+        target,
+        'returncode':
+        process.returncode,
+        'seconds':
+        round(elapsed, 4),
+        'peak_memory_bytes':
+        peak_memory,
+        'output_bytes':
+        os.path.getsize(output_path) if os.path.isfile(output_path) else 0
+    }
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    arg_parser.add_argument(
+        '--structs',
+        dest='structs',
+        type=int,
+        default=1000,
+        help='Number of structs in the synthetic registry.'
+    )
+    arg_parser.add_argument(
+        '--commands',
+        dest='commands',
+        type=int,
+        default=600,
+        help=
+        'Number of commands in the synthetic registry, not including handle create and destroy commands.'
+    )
+    arg_parser.add_argument(
+        '--pnext-structs',
+        dest='pnext_structs',
+        type=int,
+        default=300,
+        help='Number of structs that extend the pNext chains of other structs.'
+    )
+    arg_parser.add_argument(
+        '--handles',
+        dest='handles',
+        type=int,
+        default=40,
+        help='Number of non-dispatchable handle types in the synthetic registry.'
+    )
+    arg_parser.add_argument(
+        '--handle-density',
+        dest='handle_density',
+        type=float,
+        default=0.2,
+        help=
+        'Probability, from 0 to 1, that a struct member or command parameter is a handle.'
+    )
+    arg_parser.add_argument(
+        '--seed',
+        dest='seed',
+        type=int,
+        default=0,
+        help=
+        'Seed for the random choices made when building the synthetic registry.'
+    )
+    arg_parser.add_argument(
+        '--registry',
+        dest='registry',
+        default=None,
+        help=
+        'Path to an existing registry file (vk.xml) to benchmark, instead of a synthetic registry.'
+    )
+    arg_parser.add_argument(
+        '--output',
+        dest='output',
+        default=None,
+        help=
+        'Path to the JSON report file. The report is written to stdout if this option is not provided.'
+    )
+    arg_parser.add_argument(
+        '--keep',
+        dest='keep',
+        action='store_true',
+        default=False,
+        help=
+        'Keep the directory containing the synthetic registry and the generated files.'
+    )
+    arg_parser.add_argument(
+        'targets',
+        metavar='target',
+        nargs='*',
+        help=
+        'Targets to benchmark. All targets generated by generate_vulkan.py are benchmarked if none are provided.'
+    )
+    args = arg_parser.parse_args()
+
+    targets = args.targets if args.targets else generate_targets
+    work_dir = tempfile.mkdtemp(prefix='gfxr_benchmark_')
+    output_dir = os.path.join(work_dir, 'generated')
+    os.makedirs(output_dir)
+
+    if args.registry is not None:
+        registry_path = os.path.abspath(args.registry)
+        registry_info = {'path': registry_path}
+    else:
+        registry_path = os.path.join(work_dir, 'vk.xml')
+        registry = SyntheticRegistry(
+            args.structs, args.commands, args.pnext_structs, args.handles,
+            args.handle_density, args.seed
+        )
+        with open(registry_path, 'w', encoding='utf-8') as f:
+            f.write(registry.build())
+        registry_info = {
+            'structs': args.structs,
+            'commands': args.commands,
+            'pnext_structs': args.pnext_structs,
+            'handles': args.handles,
+            'handle_density': args.handle_density,
+            'seed': args.seed
+        }
+    registry_info['bytes'] = os.path.getsize(registry_path)
+
+    # The caller's PYTHONPATH is searched after the registry scripts in the Vulkan-Headers submodule, so that
+    # registry scripts from another location can be used when the submodule is not checked out.
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join(
+        [
+            KHRONOS_REGISTRY_DIR,
+            BASE_GENERATOR_DIR,
+            GENERATOR_DIR,
+            VK_HEADERS_DIR,
+        ] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else [])
+    )
+    gencode_args = [
+        sys.executable,
+        os.path.join(GENERATOR_DIR, 'gencode.py'),
+        '-o',
+        output_dir,
+        '-configs',
+        GENERATOR_DIR,
+        '-registry',
+        registry_path,
+    ]
+
+    results = []
+    for target in targets:
+        print('Benchmarking', target, file=sys.stderr)
+        results.append(run_target(gencode_args, target, env, output_dir))
+
+    report = {
+        'python':
+        sys.version.split()[0],
+        'registry':
+        registry_info,
+        'targets':
+        results,
+        'total_seconds':
+        round(sum(result['seconds'] for result in results), 4),
+        'failed':
+        [result['target'] for result in results if result['returncode'] != 0]
+    }
+
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.keep:
+        print('Benchmark files kept in', work_dir, file=sys.stderr)
+    else:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    sys.exit(1 if report['failed'] else 0)
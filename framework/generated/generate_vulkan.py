@@ -24,6 +24,7 @@
 '''
 
 import argparse
+import json
 import os
 import sys
 import subprocess
@@ -72,6 +73,113 @@ generate_targets = [
     'generated_vulkan_state_table.h'
 ]
 
+# File name suffixes of the profile reports written by gencode.py for each target.
+PROFILE_JSON_SUFFIX = '.profile.json'
+PROFILE_STACKS_SUFFIX = '.profile.folded'
+
+
+def remove_profiles(profile_dir, targets):
+    """Remove the profile reports written for targets by a previous run."""
+    for target in targets:
+        for suffix in [PROFILE_JSON_SUFFIX, PROFILE_STACKS_SUFFIX]:
+            path = os.path.join(profile_dir, target + suffix)
+            if os.path.isfile(path):
+                os.remove(path)
+
+
+def summarize_profiles(profile_dir, targets):
+    """Combine the profile reports written for targets into profile_summary.json and a
+    single profile.folded collapsed stack file, and print the slowest targets and functions.
+    """
+    reports = []
+    for target in targets:
+        path = os.path.join(profile_dir, target + PROFILE_JSON_SUFFIX)
+        if os.path.isfile(path):
+            with open(path, encoding='utf-8') as f:
+                reports.append(json.load(f))
+    if not reports:
+        print('No profile reports were written to', profile_dir)
+        return
+
+    phases = dict()
+    functions = dict()
+    for report in reports:
+        for name, seconds in report['phases'].items():
+            phases[name] = phases.get(name, 0.0) + seconds
+        for entry in report['functions']:
+            stats = functions.setdefault(entry['name'], [0, 0.0, 0.0])
+            stats[0] += entry['calls']
+            stats[1] += entry['total_seconds']
+            stats[2] += entry['self_seconds']
+
+    reports.sort(key=lambda report: report['total_seconds'], reverse=True)
+    summary = {
+        'total_seconds':
+        round(sum(report['total_seconds'] for report in reports), 6),
+        'phases': {
+            name: round(seconds, 6)
+            for name, seconds in phases.items()
+        },
+        'targets': [
+            {
+                'target': report['target'],
+                'total_seconds': report['total_seconds'],
+                'phases': report['phases']
+            } for report in reports
+        ],
+        'functions':
+        sorted(
+            [
+                {
+                    'name': name,
+                    'calls': stats[0],
+                    'total_seconds': round(stats[1], 6),
+                    'self_seconds': round(stats[2], 6)
+                } for name, stats in functions.items()
+            ],
+            key=lambda entry: entry['self_seconds'],
+            reverse=True
+        )
+    }
+    with open(
+        os.path.join(profile_dir, 'profile_summary.json'),
+        'w',
+        encoding='utf-8'
+    ) as f:
+        json.dump(summary, f, indent=2)
+
+    # Each target is the root of its own stacks, so the collapsed stack files can be concatenated.
+    with open(
+        os.path.join(profile_dir, 'profile.folded'), 'w', encoding='utf-8'
+    ) as out:
+        for target in targets:
+            path = os.path.join(profile_dir, target + PROFILE_STACKS_SUFFIX)
+            if os.path.isfile(path):
+                with open(path, encoding='utf-8') as f:
+                    out.write(f.read())
+
+    print(
+        'Profiled {} targets in {:.3f} seconds'.format(
+            len(reports), summary['total_seconds']
+        )
+    )
+    print('Slowest targets:')
+    for report in reports[:5]:
+        print(
+            '  {:>9.3f}s  {}'.format(
+                report['total_seconds'], report['target']
+            )
+        )
+    print('Slowest functions (exclusive time):')
+    for entry in summary['functions'][:10]:
+        print(
+            '  {:>9.3f}s  {:>8} calls  {}'.format(
+                entry['self_seconds'], entry['calls'], entry['name']
+            )
+        )
+    print('Profile reports written to', profile_dir)
+
+
 if __name__ == '__main__':
     arg_parser = argparse.ArgumentParser(description=__doc__)
     arg_parser.add_argument(
@@ -97,7 +205,186 @@ if __name__ == '__main__':
             ]
         )
     )
+    arg_parser.add_argument(
+        '--generation-profile',
+        dest='generation_profile',
+        default=None,
+        help='\n'.join(
+            [
+                'Path to a generation profile JSON file, listing the API versions and extensions to generate code for.',
+                'The profile may contain a "versions" list of API versions and an "extensions" list of extensions to generate code for,',
+                'which default to all versions and extensions, and an "exclude_extensions" list of extensions to skip.',
+                'The same subset is generated for every target, producing a smaller capture layer and replay tool.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--single-process',
+        dest='single_process',
+        action='store_true',
+        default=False,
+        help='\n'.join(
+            [
+                'Generate all targets with a single generator process.',
+                'The registry is parsed once and shared by all targets, instead of being parsed again for each target.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--jobs',
+        dest='jobs',
+        type=int,
+        default=1,
+        help='\n'.join(
+            [
+                'Number of worker processes used to generate targets in parallel.',
+                'Implies --single-process: the registry is parsed once and shared with the workers.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--cache-dir',
+        dest='cache_dir',
+        default=None,
+        help='\n'.join(
+            [
+                'Path to a directory, such as the build directory, used to cache the loaded registry between runs.',
+                'The cache is keyed by the content of vk.xml, the extra headers, and the registry loading scripts.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--incremental',
+        dest='incremental',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='MANIFEST',
+        help='\n'.join(
+            [
+                'Only generate the targets whose inputs changed since the previous incremental run.',
+                'Target inputs are recorded in the MANIFEST file, which defaults to a file stored in the directory specified by --cache-dir.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--shards',
+        dest='shards',
+        type=int,
+        default=1,
+        help='\n'.join(
+            [
+                'Number of parts to split the largest generated C++ source files into, so that they can be compiled in parallel.',
+                'The parts are written to generated_<name>_partN.cpp files, which are listed by a generated_<name>_parts.cmake file.',
+                'The unsplit generated_<name>.cpp file is removed, and is generated again by a run without this option.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--decode-dispatch-table',
+        dest='decode_dispatch_table',
+        action='store_true',
+        default=False,
+        help='\n'.join(
+            [
+                'Generate a VulkanDecoder::DecodeFunctionCall that dispatches through a table of decode functions indexed by the API call ID,',
+                'instead of a switch statement over all API call IDs.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--lazy-decode',
+        dest='lazy_decode',
+        action='store_true',
+        default=False,
+        help='\n'.join(
+            [
+                'Generate VulkanDecoder methods that defer decoding of array parameters until they are first accessed by a consumer,',
+                'so that consumers that ignore a parameter do not pay for copying its data.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--enum-lookup-tables',
+        dest='enum_lookup_tables',
+        action='store_true',
+        default=False,
+        help='\n'.join(
+            [
+                'Generate enum and flags ToString() functions that look up names in sorted tables of enumerants,',
+                'instead of switch statements with a case for each enumerant.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--state-table-hash-maps',
+        dest='state_table_hash_maps',
+        action='store_true',
+        default=False,
+        help='\n'.join(
+            [
+                'Generate a capture state table that stores handle wrappers in std::unordered_map, instead of std::map,',
+                'for constant time insertion and removal of tracked objects.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--object-info-paged-maps',
+        dest='object_info_paged_maps',
+        action='store_true',
+        default=False,
+        help='\n'.join(
+            [
+                'Generate a replay object info table that stores object info in pages indexed by capture ID,',
+                'instead of std::unordered_map, so that handle mapping does not hash the capture ID.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--to-string-streaming',
+        dest='to_string_streaming',
+        action='store_true',
+        default=False,
+        help='\n'.join(
+            [
+                'Generate struct to-string and ASCII consumer code that writes nested structures and parameters',
+                'directly to the caller\'s output stream, instead of concatenating temporary strings.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--check',
+        dest='check',
+        action='store_true',
+        default=False,
+        help='\n'.join(
+            [
+                'Generate all targets in memory, in parallel, and compare them with the generated files in the source tree.',
+                'No files are written.  Prints a diff of each file that differs, and exits with a non-zero status if any file differs.',
+                'The number of worker processes is specified by --jobs, and defaults to the number of CPUs.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--profile',
+        dest='profile',
+        default=None,
+        metavar='DIR',
+        help='\n'.join(
+            [
+                'Path to a directory to write per-target generation profile reports to.',
+                'A JSON report and a collapsed stack file, which can be rendered as a flame graph, are written for each target,',
+                'and are combined into profile_summary.json and profile.folded.'
+            ]
+        )
+    )
     args = arg_parser.parse_args()
+    if (args.incremental == '') and (args.cache_dir is None):
+        arg_parser.error(
+            '--incremental requires a MANIFEST file or --cache-dir'
+        )
+    if args.check and (args.incremental is not None):
+        arg_parser.error('--check cannot be used with --incremental')
     registry_dir = KHRONOS_REGISTRY_DIR
     if args.registry_dir is not None:
         registry_dir = os.path.abspath(args.registry_dir)
@@ -118,32 +405,107 @@ if __name__ == '__main__':
             VK_HEADERS_DIR,
         ]
     )
-    for target in generate_targets:
-        print('Generating', target)
-        gencode_args = [
-            sys.executable,
-            os.path.join(GENERATOR_DIR, 'gencode.py'),
-            '-o',
-            SCRIPT_DIR,
-            '-configs',
-            GENERATOR_DIR,
-            '-registry',
-            registry_path,
-        ]
-        if args.headers_dir is not None:
-            if not os.path.isdir(args.headers_dir):
-                raise Exception(
-                    'Error: extra headers dir', args.headers_dir,
-                    'is not a directory'
-                )
-            gencode_args.extend(
-                ['-headers-dir',
-                 os.path.abspath(args.headers_dir)]
+    gencode_args = [
+        sys.executable,
+        os.path.join(GENERATOR_DIR, 'gencode.py'),
+        '-o',
+        SCRIPT_DIR,
+        '-configs',
+        GENERATOR_DIR,
+        '-registry',
+        registry_path,
+    ]
+    if args.headers_dir is not None:
+        if not os.path.isdir(args.headers_dir):
+            raise Exception(
+                'Error: extra headers dir', args.headers_dir,
+                'is not a directory'
+            )
+        gencode_args.extend(
+            ['-headers-dir', os.path.abspath(args.headers_dir)]
+        )
+    if args.generation_profile is not None:
+        if not os.path.isfile(args.generation_profile):
+            raise Exception(
+                'Error: generation profile', args.generation_profile,
+                'does not exist'
+            )
+        gencode_args.extend(
+            ['-generation-profile',
+             os.path.abspath(args.generation_profile)]
+        )
+    if args.shards > 1:
+        gencode_args.extend(['-shards', str(args.shards)])
+    if args.decode_dispatch_table:
+        gencode_args.append('-decode-dispatch-table')
+    if args.lazy_decode:
+        gencode_args.append('-lazy-decode')
+    if args.enum_lookup_tables:
+        gencode_args.append('-enum-lookup-tables')
+    if args.state_table_hash_maps:
+        gencode_args.append('-state-table-hash-maps')
+    if args.object_info_paged_maps:
+        gencode_args.append('-object-info-paged-maps')
+    if args.to_string_streaming:
+        gencode_args.append('-to-string-streaming')
+    if args.cache_dir is not None:
+        gencode_args.extend(['-cache-dir', os.path.abspath(args.cache_dir)])
+    if args.profile is not None:
+        profile_dir = os.path.abspath(args.profile)
+        remove_profiles(profile_dir, generate_targets)
+        gencode_args.extend(['-profile', profile_dir])
+    if args.incremental is not None:
+        manifest_path = args.incremental
+        if not manifest_path:
+            manifest_path = os.path.join(
+                args.cache_dir, 'generate_manifest.json'
             )
-        gencode_args.append(target)
-        subprocess.call(
-            gencode_args,
+        gencode_args.extend(['-manifest', os.path.abspath(manifest_path)])
+
+    failed_targets = []
+    if args.check:
+        print('Checking', len(generate_targets), 'targets')
+        jobs = args.jobs if args.jobs > 1 else (os.cpu_count() or 1)
+        gencode_args.extend(['-check', '-jobs', str(jobs)])
+        sys.exit(
+            subprocess.call(
+                gencode_args + generate_targets,
+                shell=False,
+                env=env,
+                cwd=SCRIPT_DIR,
+            )
+        )
+    elif args.single_process or (args.jobs > 1):
+        print('Generating', len(generate_targets), 'targets')
+        gencode_args.extend(['-jobs', str(args.jobs)])
+        returncode = subprocess.call(
+            gencode_args + generate_targets,
             shell=False,
             env=env,
             cwd=SCRIPT_DIR,
         )
+        if returncode != 0:
+            failed_targets = generate_targets
+    else:
+        for target in generate_targets:
+            print('Generating', target)
+            returncode = subprocess.call(
+                gencode_args + [target],
+                shell=False,
+                env=env,
+                cwd=SCRIPT_DIR,
+            )
+            if returncode != 0:
+                failed_targets.append(target)
+
+    if args.profile is not None:
+        summarize_profiles(profile_dir, generate_targets)
+
+    if failed_targets:
+        print(
+            'Failed to generate {} of {} targets'.format(
+                len(failed_targets), len(generate_targets)
+            ),
+            file=sys.stderr
+        )
+        sys.exit(1)
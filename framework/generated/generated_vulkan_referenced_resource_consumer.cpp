@@ -1682,5 +1682,83 @@ void VulkanReferencedResourceConsumer::Process_vkCmdBindInvocationMaskHUAWEI(
     GetTable().AddResourceToUser(commandBuffer, imageView);
 }
 
+bool VulkanReferencedResourceConsumer::IsApiCallHandled(format::ApiCallId call_id) const
+{
+    switch (call_id)
+    {
+        case format::ApiCallId::ApiCall_vkBeginCommandBuffer:
+        case format::ApiCallId::ApiCall_vkCmdBindDescriptorSets:
+        case format::ApiCallId::ApiCall_vkCmdBindIndexBuffer:
+        case format::ApiCallId::ApiCall_vkCmdBindVertexBuffers:
+        case format::ApiCallId::ApiCall_vkCmdDrawIndirect:
+        case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirect:
+        case format::ApiCallId::ApiCall_vkCmdDispatchIndirect:
+        case format::ApiCallId::ApiCall_vkCmdCopyBuffer:
+        case format::ApiCallId::ApiCall_vkCmdCopyImage:
+        case format::ApiCallId::ApiCall_vkCmdBlitImage:
+        case format::ApiCallId::ApiCall_vkCmdCopyBufferToImage:
+        case format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer:
+        case format::ApiCallId::ApiCall_vkCmdUpdateBuffer:
+        case format::ApiCallId::ApiCall_vkCmdFillBuffer:
+        case format::ApiCallId::ApiCall_vkCmdClearColorImage:
+        case format::ApiCallId::ApiCall_vkCmdClearDepthStencilImage:
+        case format::ApiCallId::ApiCall_vkCmdResolveImage:
+        case format::ApiCallId::ApiCall_vkCmdWaitEvents:
+        case format::ApiCallId::ApiCall_vkCmdPipelineBarrier:
+        case format::ApiCallId::ApiCall_vkCmdCopyQueryPoolResults:
+        case format::ApiCallId::ApiCall_vkCmdBeginRenderPass:
+        case format::ApiCallId::ApiCall_vkCmdExecuteCommands:
+        case format::ApiCallId::ApiCall_vkCmdDrawIndirectCount:
+        case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCount:
+        case format::ApiCallId::ApiCall_vkCmdBeginRenderPass2:
+        case format::ApiCallId::ApiCall_vkCmdSetEvent2:
+        case format::ApiCallId::ApiCall_vkCmdWaitEvents2:
+        case format::ApiCallId::ApiCall_vkCmdPipelineBarrier2:
+        case format::ApiCallId::ApiCall_vkCmdCopyBuffer2:
+        case format::ApiCallId::ApiCall_vkCmdCopyImage2:
+        case format::ApiCallId::ApiCall_vkCmdCopyBufferToImage2:
+        case format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer2:
+        case format::ApiCallId::ApiCall_vkCmdBlitImage2:
+        case format::ApiCallId::ApiCall_vkCmdResolveImage2:
+        case format::ApiCallId::ApiCall_vkCmdBeginRendering:
+        case format::ApiCallId::ApiCall_vkCmdBindVertexBuffers2:
+        case format::ApiCallId::ApiCall_vkCmdBeginRenderingKHR:
+        case format::ApiCallId::ApiCall_vkCmdPushDescriptorSetKHR:
+        case format::ApiCallId::ApiCall_vkCmdBeginRenderPass2KHR:
+        case format::ApiCallId::ApiCall_vkCmdDrawIndirectCountKHR:
+        case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountKHR:
+        case format::ApiCallId::ApiCall_vkCmdSetEvent2KHR:
+        case format::ApiCallId::ApiCall_vkCmdWaitEvents2KHR:
+        case format::ApiCallId::ApiCall_vkCmdPipelineBarrier2KHR:
+        case format::ApiCallId::ApiCall_vkCmdWriteBufferMarker2AMD:
+        case format::ApiCallId::ApiCall_vkCmdCopyBuffer2KHR:
+        case format::ApiCallId::ApiCall_vkCmdCopyImage2KHR:
+        case format::ApiCallId::ApiCall_vkCmdCopyBufferToImage2KHR:
+        case format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer2KHR:
+        case format::ApiCallId::ApiCall_vkCmdBlitImage2KHR:
+        case format::ApiCallId::ApiCall_vkCmdResolveImage2KHR:
+        case format::ApiCallId::ApiCall_vkCmdBindTransformFeedbackBuffersEXT:
+        case format::ApiCallId::ApiCall_vkCmdBeginTransformFeedbackEXT:
+        case format::ApiCallId::ApiCall_vkCmdEndTransformFeedbackEXT:
+        case format::ApiCallId::ApiCall_vkCmdDrawIndirectByteCountEXT:
+        case format::ApiCallId::ApiCall_vkCmdDrawIndirectCountAMD:
+        case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountAMD:
+        case format::ApiCallId::ApiCall_vkCmdBeginConditionalRenderingEXT:
+        case format::ApiCallId::ApiCall_vkCmdBindShadingRateImageNV:
+        case format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructureNV:
+        case format::ApiCallId::ApiCall_vkCmdTraceRaysNV:
+        case format::ApiCallId::ApiCall_vkCmdWriteBufferMarkerAMD:
+        case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectNV:
+        case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectCountNV:
+        case format::ApiCallId::ApiCall_vkCmdBindVertexBuffers2EXT:
+        case format::ApiCallId::ApiCall_vkCmdPreprocessGeneratedCommandsNV:
+        case format::ApiCallId::ApiCall_vkCmdExecuteGeneratedCommandsNV:
+        case format::ApiCallId::ApiCall_vkCmdBindInvocationMaskHUAWEI:
+            return true;
+        default:
+            return VulkanReferencedResourceConsumerBase::IsApiCallHandled(call_id);
+    }
+}
+
 GFXRECON_END_NAMESPACE(decode)
 GFXRECON_END_NAMESPACE(gfxrecon)
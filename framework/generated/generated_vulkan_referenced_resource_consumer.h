@@ -569,6 +569,8 @@ class VulkanReferencedResourceConsumer : public VulkanReferencedResourceConsumer
         format::HandleId                            commandBuffer,
         format::HandleId                            imageView,
         VkImageLayout                               imageLayout) override;
+
+    virtual bool IsApiCallHandled(format::ApiCallId call_id) const override;
 };
 
 GFXRECON_END_NAMESPACE(decode)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2021 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+'''Tests for generate_vulkan.py
+
+Runs a copy of the generator scripts against a small synthetic registry, so that the
+generated files in the source tree are not modified.  The Khronos registry scripts are
+used from the Vulkan-Headers submodule.
+
+Run with: python3 -m unittest discover framework/generated/test
+'''
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+)
+
+from generate_vulkan import SCRIPT_DIR, KHRONOS_REGISTRY_DIR, generate_targets
+from benchmark_vulkan import SyntheticRegistry
+
+
+@unittest.skipUnless(
+    os.path.isfile(os.path.join(KHRONOS_REGISTRY_DIR, 'reg.py')),
+    'The Khronos registry scripts are not available'
+)
+class GenerateVulkanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        # The scripts find the registry scripts relative to their own location.
+        self.script_dir = os.path.join(
+            self.temp_dir.name, 'framework', 'generated'
+        )
+        shutil.copytree(
+            SCRIPT_DIR,
+            self.script_dir,
+            ignore=shutil.ignore_patterns(
+                'generated_*', '__pycache__', 'test'
+            )
+        )
+        shutil.copytree(
+            KHRONOS_REGISTRY_DIR,
+            os.path.join(
+                self.temp_dir.name, 'external', 'Vulkan-Headers', 'registry'
+            ),
+            ignore=shutil.ignore_patterns('__pycache__')
+        )
+
+        self.registry_dir = os.path.join(self.temp_dir.name, 'registry')
+        os.makedirs(self.registry_dir)
+        self.write_registry(SyntheticRegistry(20, 20, 5, 4, 0.2).build())
+
+    def write_registry(self, content):
+        with open(
+            os.path.join(self.registry_dir, 'vk.xml'), 'w', encoding='utf-8'
+        ) as f:
+            f.write(content)
+
+    def run_generate(self, *args):
+        return subprocess.run(
+            [
+                sys.executable,
+                os.path.join(self.script_dir, 'generate_vulkan.py'),
+                '--registry-dir', self.registry_dir
+            ] + list(args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True
+        )
+
+    def test_generate_all_targets(self):
+        result = self.run_generate('--single-process')
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        for target in generate_targets:
+            self.assertTrue(
+                os.path.isfile(os.path.join(self.script_dir, target)), target
+            )
+
+    def test_sharded_targets_replace_unsplit_files(self):
+        sharded_targets = [
+            'generated_vulkan_api_call_encoders.cpp',
+            'generated_vulkan_ascii_consumer.cpp',
+            'generated_vulkan_decoder.cpp',
+            'generated_vulkan_struct_decoders.cpp',
+            'generated_vulkan_struct_to_string.cpp'
+        ]
+
+        result = self.run_generate('--single-process')
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        result = self.run_generate('--single-process', '--shards', '2')
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        for target in sharded_targets:
+            base = os.path.join(self.script_dir, os.path.splitext(target)[0])
+            self.assertFalse(
+                os.path.exists(os.path.join(self.script_dir, target)), target
+            )
+            self.assertTrue(os.path.isfile(base + '_part0.cpp'), target)
+            self.assertTrue(os.path.isfile(base + '_part1.cpp'), target)
+            self.assertTrue(os.path.isfile(base + '_parts.cmake'), target)
+
+        # Check mode reports an unsplit file left with the parts.
+        stale_path = os.path.join(self.script_dir, sharded_targets[0])
+        with open(stale_path, 'w', encoding='utf-8') as f:
+            f.write('// Stale\n')
+
+        result = self.run_generate('--check', '--shards', '2')
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn(sharded_targets[0] + ' differs', result.stderr)
+        self.assertTrue(os.path.isfile(stale_path))
+
+        # A run without parts generates the unsplit files again, and removes the parts.
+        result = self.run_generate('--single-process')
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        for target in sharded_targets:
+            base = os.path.join(self.script_dir, os.path.splitext(target)[0])
+            self.assertTrue(
+                os.path.isfile(os.path.join(self.script_dir, target)), target
+            )
+            self.assertFalse(os.path.exists(base + '_part0.cpp'), target)
+            self.assertFalse(os.path.exists(base + '_parts.cmake'), target)
+
+    def check_incremental_runs(self, args, skip_messages):
+        """Run incremental generation twice, and check that the targets are generated by the
+        first run and that every target is skipped by the second run."""
+        first_result = self.run_generate(*args)
+
+        self.assertEqual(first_result.returncode, 0, first_result.stderr)
+        self.assertIn('targets changed', first_result.stderr)
+        self.assertNotIn('All targets are up to date', first_result.stderr)
+
+        second_result = self.run_generate(*args)
+
+        self.assertEqual(second_result.returncode, 0, second_result.stderr)
+        self.assertNotIn('targets changed', second_result.stderr)
+        self.assertEqual(
+            second_result.stderr.count('* All targets are up to date'),
+            skip_messages
+        )
+
+    def test_incremental_generation_skips_unchanged_targets(self):
+        manifest_path = os.path.join(self.temp_dir.name, 'manifest.json')
+        args = ['--incremental', manifest_path, '--single-process']
+        self.check_incremental_runs(args, 1)
+
+        # The targets are generated again when the registry changes.
+        self.write_registry(
+            SyntheticRegistry(20, 20, 5, 4, 0.2, seed=1).build()
+        )
+        result = self.run_generate(*args)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('targets changed', result.stderr)
+        self.assertNotIn('All targets are up to date', result.stderr)
+
+    def test_incremental_generation_of_separate_targets(self):
+        manifest_path = os.path.join(self.temp_dir.name, 'manifest.json')
+        self.check_incremental_runs(
+            ['--incremental', manifest_path], len(generate_targets)
+        )
+
+    def test_incremental_generation_with_registry_cache(self):
+        cache_dir = os.path.join(self.temp_dir.name, 'cache')
+        self.check_incremental_runs(
+            ['--cache-dir', cache_dir, '--incremental', '--single-process'], 1
+        )
+
+        self.assertTrue(
+            os.path.isfile(os.path.join(cache_dir, 'generate_manifest.json'))
+        )
+        self.assertTrue(
+            any(name.endswith('.pickle') for name in os.listdir(cache_dir))
+        )
+
+    def test_failed_generation_is_reported(self):
+        self.write_registry('<registry>')
+
+        for args in [['--single-process'], []]:
+            result = self.run_generate(*args)
+
+            self.assertNotEqual(result.returncode, 0)
+            self.assertIn(
+                'Failed to generate {} of {} targets'.format(
+                    len(generate_targets), len(generate_targets)
+                ), result.stderr
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2021 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+'''Tests for the registry cache written by gencode.py
+
+Loads a small synthetic registry with the Khronos registry scripts from the Vulkan-Headers
+submodule, and checks that the loaded registry state is restored from the cache.
+
+Run with: python3 -m unittest discover framework/generated/test
+'''
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+)
+
+from generate_vulkan import KHRONOS_REGISTRY_DIR, BASE_GENERATOR_DIR, GENERATOR_DIR, VK_HEADERS_DIR
+from benchmark_vulkan import SyntheticRegistry
+
+sys.path[1:1] = [
+    KHRONOS_REGISTRY_DIR, BASE_GENERATOR_DIR, GENERATOR_DIR, VK_HEADERS_DIR
+]
+
+try:
+    import gencode
+    from registry.reg import Registry, etree
+except ImportError:
+    gencode = None
+
+
+@unittest.skipIf(
+    gencode is None, 'The Khronos registry scripts are not available'
+)
+class RegistryCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.registry_path = os.path.join(self.temp_dir.name, 'vk.xml')
+        with open(self.registry_path, 'w', encoding='utf-8') as f:
+            f.write(SyntheticRegistry(20, 20, 5, 4, 0.2).build())
+
+        self.cache_path = os.path.join(
+            self.temp_dir.name, 'cache', gencode.registry_cache_prefix + 'test'
+            + gencode.registry_cache_suffix
+        )
+
+    def load_registry(self):
+        reg = Registry()
+        reg.loadElementTree(etree.parse(self.registry_path))
+        return reg
+
+    def get_cache_files(self):
+        return sorted(os.listdir(os.path.dirname(self.cache_path)))
+
+    def test_cached_registry_matches_loaded_registry(self):
+        reg = self.load_registry()
+        gencode.save_registry_cache(reg, self.cache_path)
+
+        self.assertEqual(
+            self.get_cache_files(), [os.path.basename(self.cache_path)]
+        )
+
+        cached_reg = Registry()
+        self.assertTrue(
+            gencode.load_registry_cache(cached_reg, self.cache_path)
+        )
+
+        for dict_name in ['typedict', 'enumdict', 'cmddict', 'extdict']:
+            loaded = getattr(reg, dict_name)
+            cached = getattr(cached_reg, dict_name)
+            self.assertTrue(loaded)
+            self.assertEqual(sorted(loaded), sorted(cached))
+            for name, info in loaded.items():
+                self.assertEqual(
+                    etree.tostring(info.elem),
+                    etree.tostring(cached[name].elem)
+                )
+
+        # The attributes excluded from the cache are those of the new registry.
+        self.assertIsNot(
+            cached_reg.commandextensiontuple, reg.commandextensiontuple
+        )
+        self.assertEqual(
+            cached_reg.commandextensiontuple._fields,
+            reg.commandextensiontuple._fields
+        )
+
+    def test_cache_files_for_other_inputs_are_removed(self):
+        reg = self.load_registry()
+        old_cache_path = os.path.join(
+            os.path.dirname(self.cache_path), gencode.registry_cache_prefix
+            + 'old' + gencode.registry_cache_suffix
+        )
+        gencode.save_registry_cache(reg, old_cache_path)
+        gencode.save_registry_cache(reg, self.cache_path)
+
+        self.assertEqual(
+            self.get_cache_files(), [os.path.basename(self.cache_path)]
+        )
+
+    def test_registry_that_cannot_be_pickled_is_not_cached(self):
+        reg = self.load_registry()
+        reg.unpicklable = lambda: None
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            gencode.save_registry_cache(reg, self.cache_path)
+
+        self.assertIn('Unable to write registry cache', stderr.getvalue())
+        self.assertEqual(self.get_cache_files(), [])
+
+    def test_unreadable_cache_is_ignored(self):
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, 'wb') as f:
+            f.write(b'not a pickle')
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertFalse(
+                gencode.load_registry_cache(Registry(), self.cache_path)
+            )
+
+        self.assertIn('Ignoring unreadable registry cache', stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -38,10 +38,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import difflib
 import os
 import re
 import sys
 import json
+import tempfile
+import weakref
+import zlib
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from types import MappingProxyType
 from generator import GeneratorOptions, OutputGenerator, noneStr, regSortFeatures, write
 from vkconventions import VulkanConventions
 
@@ -97,8 +104,17 @@ class ValueInfo():
       is_array - True if the member is an array.
       is_dynamic - True if the memory for the member is an array and it is dynamically allocated.
       is_const - True if the member is a const.
+    ValueInfo objects are created for every parameter and struct member of the registry, so attributes
+    are stored in slots instead of a per-instance dictionary.
     """
 
+    __slots__ = (
+        'name', 'base_type', 'full_type', 'pointer_count', 'array_length',
+        'array_length_value', 'array_capacity', 'array_dimension',
+        'platform_base_type', 'platform_full_type', 'bitfield_width',
+        'is_pointer', 'is_array', 'is_dynamic', 'is_const', 'is_com_outptr'
+    )
+
     def __init__(
         self,
         name,
@@ -134,6 +150,385 @@ class ValueInfo():
         self.is_com_outptr = is_com_outptr
 
 
+class CodeEmitter():
+    """CodeEmitter - Class to accumulate generated code in memory.
+    Output fragments are collected in a list, which is joined once when the generated file is written, instead
+    of being written line by line or concatenated into ever larger strings.  Provides the write() method of a
+    text file, so that the emitter can be used as the generator output file with the write() function, and
+    methods to emit lines of code at an indentation level.
+
+    Members:
+      indent_size - Number of spaces per indentation level.
+      indent_level - Current indentation level applied by emit().
+    """
+
+    def __init__(self, indent_size=4):
+        self.indent_size = indent_size
+        self.indent_level = 0
+        self.__fragments = []
+
+    def write(self, text):
+        """Append text to the output, without indentation."""
+        self.__fragments.append(text)
+        return len(text)
+
+    def flush(self):
+        """File interface compatibility. Output is written by the generator when the file ends."""
+
+    def close(self):
+        """Release the accumulated output."""
+        self.__fragments = []
+
+    def getvalue(self):
+        """Return the accumulated output as a single string."""
+        return ''.join(self.__fragments)
+
+    def emit(self, *lines):
+        """Append lines of code to the output, indented to the current indentation level.
+        Each argument may contain multiple lines.  Empty lines are not indented.
+        """
+        prefix = ' ' * (self.indent_level * self.indent_size)
+        for text in lines:
+            if prefix:
+                text = '\n'.join(
+                    [
+                        prefix + line if line else line
+                        for line in text.split('\n')
+                    ]
+                )
+            self.__fragments.append(text)
+            self.__fragments.append('\n')
+
+    @contextmanager
+    def indent(self, levels=1):
+        """Context manager that increases the indentation level for lines emitted within its scope."""
+        self.indent_level += levels
+        try:
+            yield
+        finally:
+            self.indent_level -= levels
+
+
+class ShardedCodeEmitter():
+    """ShardedCodeEmitter - Class to accumulate generated code for a file that is split into parts.
+    Provides the same interface as CodeEmitter.  Code written to the sharded emitter, such as the include
+    statements and namespace declarations written by beginFile() and endFile(), is copied to every part.
+    Per-feature code is written directly to the individual part emitters.
+
+    Members:
+      shards - List of CodeEmitter objects, one per part.
+    """
+
+    def __init__(self, shard_count, indent_size=4):
+        self.shards = [CodeEmitter(indent_size) for _ in range(shard_count)]
+
+    def write(self, text):
+        """Append text to every part, without indentation."""
+        for shard in self.shards:
+            shard.write(text)
+        return len(text)
+
+    def flush(self):
+        """File interface compatibility. Output is written by the generator when the file ends."""
+
+    def close(self):
+        """Release the accumulated output."""
+        for shard in self.shards:
+            shard.close()
+
+    def emit(self, *lines):
+        """Append lines of code to every part, indented to the current indentation level."""
+        for shard in self.shards:
+            shard.emit(*lines)
+
+    @contextmanager
+    def indent(self, levels=1):
+        """Context manager that increases the indentation level for lines emitted within its scope."""
+        for shard in self.shards:
+            shard.indent_level += levels
+        try:
+            yield
+        finally:
+            for shard in self.shards:
+                shard.indent_level -= levels
+
+
+class RegistryTypeIndex():
+    """RegistryTypeIndex - Class to index the <type> elements of a loaded registry by name.
+    Replaces XPath searches of the registry tree, which scan every <type> element, with dictionary lookups.
+    The index is built once per registry and is shared by all generators using the registry.
+
+    Members:
+      categories - Map of type names to the value of the category attribute of their <type> element.
+      members - Map of struct and union type names to lists of their <member> elements.
+      aliases - Map of type alias names to the names of the aliased types.
+    """
+
+    def __init__(self, registry):
+        self.categories = dict()
+        self.members = dict()
+        self.aliases = dict()
+
+        for elem in registry.tree.findall('types/type'):
+            # Aliases are not type definitions, and are only recorded in the alias map.
+            alias = elem.get('alias')
+            if alias:
+                self.aliases[elem.get('name')] = alias
+                continue
+
+            name_elem = elem.find('name')
+            if name_elem is not None:
+                name = name_elem.text
+            else:
+                name = elem.get('name')
+
+            if name:
+                category = elem.get('category')
+                self.categories[name] = category
+                if (category == 'struct') or (category == 'union'):
+                    self.members[name] = elem.findall('member')
+
+    def is_handle(self, name, include_aliases=False):
+        """Check for a handle type definition, or optionally a handle type alias."""
+        if include_aliases and (name in self.aliases):
+            name = self.aliases[name]
+        return self.categories.get(name) == 'handle'
+
+    def get_member_types(self, name):
+        """Return the <type> elements of the members of a struct or union type, or an empty list for other types."""
+        return [
+            member.find('type') for member in self.members.get(name, [])
+            if member.find('type') is not None
+        ]
+
+
+# Type indices for loaded registries.
+_registry_type_indices = weakref.WeakKeyDictionary()
+
+
+def get_registry_type_index(registry):
+    """Return the type index for a registry, building it on first use."""
+    type_index = _registry_type_indices.get(registry)
+    if type_index is None:
+        type_index = RegistryTypeIndex(registry)
+        _registry_type_indices[registry] = type_index
+    return type_index
+
+
+class StructHandleAnalysis():
+    """StructHandleAnalysis - Class to determine which structs defined by a registry reference handles.
+    The handle reachability of every struct is computed once per registry and is shared by all generators
+    using the registry, so that the result does not depend on the order that each generator processes structs.
+
+    Members:
+      handle_members - Map of struct names to the indices of the struct members that are handles, structs
+        containing handles, unions with struct members containing handles, pNext chains that can include structs
+        with handles, or members with the type of a struct containing handles.  Structs without handle members
+        have an empty list.
+      handle_ptr_structs - Set of struct names with handle members that are pointers or arrays, or pNext chains
+        that can include structs with handle pointers.
+      pnext_handles - Map of pNext extension struct names to a tuple of two Boolean values, indicating that the
+        struct has handle members and that it has handle members that are pointers.
+    """
+
+    def __init__(self, registry, type_index, make_value_info):
+        self.handle_members = dict()
+        self.handle_ptr_structs = set()
+        self.pnext_handles = dict()
+
+        self.__valid_extension_structs = registry.validextensionstructs
+        self.__type_index = type_index
+        self.__struct_values = {
+            name: make_value_info(members)
+            for name, members in type_index.members.items()
+            if type_index.categories[name] == 'struct'
+        }
+        self.__union_values = {
+            name: make_value_info(members)
+            for name, members in type_index.members.items()
+            if type_index.categories[name] == 'union'
+        }
+
+        for name in self.__struct_values:
+            self.__check_struct(name)
+
+        # Release the member values, which are only needed to build the analysis.
+        self.__struct_values = None
+        self.__union_values = None
+
+    def get_pnext_handles(self, typename):
+        """Determines if the specified struct type can reference pNext extension structs that contain handles.
+        Returns a tuple of two Boolean values, indicating that a valid extension struct has handle members and
+        that a valid extension struct has handle members that are pointers.
+        """
+        found_handles = False
+        found_handle_ptrs = False
+        for struct_name in self.__valid_extension_structs.get(typename, []):
+            if struct_name not in self.pnext_handles:
+                has_handles = False
+                has_handle_ptrs = False
+                for member_type in self.__type_index.get_member_types(
+                    struct_name
+                ):
+                    if self.__type_index.is_handle(member_type.text):
+                        has_handles = True
+                        if member_type.tail and ('*' in member_type.tail):
+                            has_handle_ptrs = True
+                self.pnext_handles[struct_name] = (
+                    has_handles, has_handle_ptrs
+                )
+
+            has_handles, has_handle_ptrs = self.pnext_handles[struct_name]
+            found_handles = found_handles or has_handles
+            found_handle_ptrs = found_handle_ptrs or has_handle_ptrs
+
+        return found_handles, found_handle_ptrs
+
+    def __check_struct(self, typename):
+        """Compute the handle members of a struct, after computing the handle members of its struct members."""
+        if typename in self.handle_members:
+            return
+
+        # Mark the struct as processed, without handles, while its members are checked.
+        self.handle_members[typename] = []
+
+        values = self.__struct_values[typename]
+        handles = []
+        has_handle_pointer = False
+        for index, value in enumerate(values):
+            if self.__type_index.is_handle(
+                value.base_type, include_aliases=True
+            ):
+                # The member is a handle.
+                handles.append(index)
+                if value.is_pointer or value.is_array:
+                    has_handle_pointer = True
+            elif value.base_type in self.__struct_values:
+                self.__check_struct(value.base_type)
+                if self.handle_members[value.base_type]:
+                    # The member is a struct that contains a handle.
+                    handles.append(index)
+                    if value.name in self.handle_ptr_structs:
+                        has_handle_pointer = True
+            elif value.base_type in self.__union_values:
+                # Check the union for structs that contain handles.
+                for union_value in self.__union_values[value.base_type]:
+                    if union_value.base_type in self.__struct_values:
+                        self.__check_struct(union_value.base_type)
+                        if self.handle_members[union_value.base_type]:
+                            handles.append(index)
+                            has_handle_pointer = True
+                            break
+            elif 'pNext' in value.name:
+                # The pNext chain may include a struct with handles.
+                has_pnext_handles, has_pnext_handle_ptrs = self.get_pnext_handles(
+                    typename
+                )
+                if has_pnext_handles:
+                    handles.append(index)
+                    if has_pnext_handle_ptrs:
+                        has_handle_pointer = True
+
+        if handles:
+            # Members with the same type as the struct are also handle members, now that the struct is known to
+            # contain handles.
+            for index, value in enumerate(values):
+                if value.base_type == typename:
+                    handles.append(index)
+
+            self.handle_members[typename] = handles
+            if has_handle_pointer:
+                self.handle_ptr_structs.add(typename)
+
+
+# Lists of ValueInfo objects created from the <param> and <member> elements of loaded registries, indexed
+# by the platform type substitutions applied to the values and the elements.
+_registry_value_infos = weakref.WeakKeyDictionary()
+
+# Pattern matching the identifiers of an array length expression.
+_identifier_pattern = re.compile(r'\w+')
+
+# Struct handle analyses for loaded registries.
+_struct_handle_analyses = weakref.WeakKeyDictionary()
+
+
+@lru_cache(maxsize=None)
+def load_json_config(filename):
+    """Load a JSON configuration file.  Each file is parsed once per process and the content is shared
+    by all generators, so it must not be modified."""
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_blacklists(filename):
+    """Load a blacklists JSON file, returning frozen sets of the blacklisted API call names, struct names,
+    and <class>_<method> names, shared by all generators."""
+    lists = load_json_config(filename)
+    method_names = []
+    if 'classmethods' in lists:
+        for class_name, method_list in lists['classmethods'].items():
+            for method_name in method_list:
+                method_names.append(class_name + '_' + method_name)
+    return (
+        frozenset(lists['functions']), frozenset(lists['structures']),
+        frozenset(method_names)
+    )
+
+
+@lru_cache(maxsize=None)
+def load_platform_types(filename):
+    """Load a platform types JSON file, returning a read-only map of platform specific type names to
+    their trace format type info and a frozen set of platform specific struct names, shared by all
+    generators."""
+    types = dict()
+    structs = set()
+    for platform in load_json_config(filename).values():
+        types.update(platform['types'])
+        if platform['structs']:
+            structs.update(platform['structs'])
+    return MappingProxyType(types), frozenset(structs)
+
+
+@lru_cache(maxsize=None)
+def load_generation_profile(filename):
+    """Load a generation profile JSON file, returning regular expressions matching the names of the API
+    versions and extensions to emit.  The profile may contain a "versions" list of API versions and an
+    "extensions" list of extensions to emit, which default to all versions and extensions, and an
+    "exclude_extensions" list of extensions not to emit."""
+    profile = load_json_config(filename)
+    versions = _features_pat
+    if 'versions' in profile:
+        versions = _make_re_string(profile['versions'])
+    extensions = _emit_extensions_pat
+    if 'extensions' in profile:
+        extensions = _make_re_string(profile['extensions'])
+    if profile.get('exclude_extensions'):
+        extensions = '(?!{}){}'.format(
+            _make_re_string(profile['exclude_extensions']), extensions
+        )
+    return versions, extensions
+
+
+@lru_cache(maxsize=None)
+def load_function_overrides(filename):
+    """Load an overrides JSON file, returning a read-only map of API call names to the names of the
+    functions that replace them, shared by all generators."""
+    return MappingProxyType(load_json_config(filename)['functions'])
+
+
+def get_struct_handle_analysis(registry, make_value_info):
+    """Return the struct handle analysis for a registry, building it on first use with the specified
+    function for creating ValueInfo lists from <member> elements."""
+    analysis = _struct_handle_analyses.get(registry)
+    if analysis is None:
+        analysis = StructHandleAnalysis(
+            registry, get_registry_type_index(registry), make_value_info
+        )
+        _struct_handle_analyses[registry] = analysis
+    return analysis
+
+
 class BaseGeneratorOptions(GeneratorOptions):
     """BaseGeneratorOptions - subclass of GeneratorOptions.
     Options for Vulkan API parameter encoding and decoding C++ code generation.
@@ -145,6 +540,11 @@ class BaseGeneratorOptions(GeneratorOptions):
       blacklists - Path to JSON file listing apicalls and structs to ignore.
       platform_types - Path to JSON file listing platform (WIN32, X11, etc.)
         specific types that are defined outside of the Vulkan header.
+      shard_count - Number of parts to split the generated file into.  When greater
+        than one, the per-feature output is split across <name>_partN files, and a
+        <name>_parts.cmake file listing the parts is written.
+      generation_profile - Path to JSON file listing the API versions and extensions
+        to emit, set with set_generation_profile(), or None to emit all of them.
 
     Additional members (from Khronos Registry COptionsGenerator)
       prefix_text - list of strings to prefix generated header with
@@ -190,7 +590,8 @@ class BaseGeneratorOptions(GeneratorOptions):
         add_extensions=_add_extensions_pat,
         remove_extensions=_remove_extensions_pat,
         emit_extensions=_emit_extensions_pat,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        shard_count=1
     ):
         GeneratorOptions.__init__(
             self,
@@ -220,6 +621,31 @@ class BaseGeneratorOptions(GeneratorOptions):
         self.align_func_param = align_func_param
         self.code_generator = True
         self.extraVulkanHeaders = extraVulkanHeaders
+        self.shard_count = shard_count
+        self.generation_profile = None
+
+    def set_generation_profile(self, filename):
+        """Restrict the emitted API versions and extensions to those selected by a generation profile.
+        The types and commands of the other versions and extensions are still processed, so that they
+        are known to the generators, but no code is generated for them."""
+        self.emitversions, self.emitExtensions = load_generation_profile(
+            filename
+        )
+        self.generation_profile = filename
+
+    def get_shard_filenames(self):
+        """Return the names of the files that the generated file is split into, or an empty list if it is not split."""
+        if (self.shard_count <= 1) or (self.filename is None):
+            return []
+        base, ext = os.path.splitext(self.filename)
+        return [
+            '{}_part{}{}'.format(base, index, ext)
+            for index in range(self.shard_count)
+        ]
+
+    def get_shard_list_filename(self):
+        """Return the name of the CMake file listing the parts of the generated file."""
+        return os.path.splitext(self.filename)[0] + '_parts.cmake'
 
 
 class BaseGenerator(OutputGenerator):
@@ -230,19 +656,19 @@ class BaseGenerator(OutputGenerator):
     """
 
     # These API calls should not be processed by the code generator.  They require special implementations.
-    APICALL_BLACKLIST = []
+    APICALL_BLACKLIST = frozenset()
 
     # These method calls should not be processed by the code generator.  They require special implementations.
-    METHODCALL_BLACKLIST = []
+    METHODCALL_BLACKLIST = frozenset()
 
     # These structures should not be processed by the code generator.  They require special implementations.
-    STRUCT_BLACKLIST = []
+    STRUCT_BLACKLIST = frozenset()
 
     # Platform specific basic types that have been defined extarnally to the Vulkan header.
-    PLATFORM_TYPES = {}
+    PLATFORM_TYPES = MappingProxyType({})
 
     # Platform specific structure types that have been defined extarnally to the Vulkan header.
-    PLATFORM_STRUCTS = []
+    PLATFORM_STRUCTS = frozenset()
 
     GENERIC_HANDLE_APICALLS = {
         'vkDebugReportMessageEXT': {
@@ -314,6 +740,11 @@ class BaseGenerator(OutputGenerator):
     ):
         OutputGenerator.__init__(self, err_file, warn_file, diag_file)
 
+        # beginFile() replaces the class level blacklists and platform types with the union of the class
+        # level entries and the entries loaded from the JSON configuration files, so that entries loaded by
+        # one generator are not seen by other generators running in the same process.
+        self.platform_types_key = ()
+
         # Typenames
         self.struct_names = set()  # Set of Vulkan struct typenames
         self.handle_names = set()  # Set of Vulkan handle typenames
@@ -328,16 +759,17 @@ class BaseGenerator(OutputGenerator):
         self.process_structs = process_structs  # Populate the feature_struct_members map
         self.feature_break = feature_break  # Insert a line break between features
 
+        # When check_only is set, the output is compared with the existing files instead of being written,
+        # and output_diffs lists unified diffs of the existing files that differ from the output.
+        self.check_only = False
+        self.output_diffs = []
+
         # Command parameter and struct member data for the current feature
         if self.process_structs:
             self.feature_struct_members = dict(
             )  # Map of struct names to lists of per-member ValueInfo
             self.feature_struct_aliases = dict(
             )  # Map of struct names to aliases
-            self.extension_structs_with_handles = dict(
-            )  # Map of extension struct names to a Boolean value indicating that a struct member has a handle type
-            self.extension_structs_with_handle_ptrs = dict(
-            )  # Map of extension struct names to a Boolean value indicating that a struct member with a handle type is a pointer
         if self.process_cmds:
             self.feature_cmd_params = dict(
             )  # Map of cmd names to lists of per-parameter ValueInfo
@@ -352,17 +784,37 @@ class BaseGenerator(OutputGenerator):
         The subclass should override this method."""
 
     def beginFile(self, gen_opts):
-        """Method override."""
-        OutputGenerator.beginFile(self, gen_opts)
+        """Method override.
+        Output is accumulated in memory by a CodeEmitter instead of being written to the target
+        file by the OutputGenerator base class, so that endFile() writes the file with a single
+        I/O call, and only replaces the target file when its content has changed.
+        """
+        self.genOpts = gen_opts
+        self.conventions = gen_opts.conventions
+        self.output_changed = False
+        self.output_diffs = []
+        if gen_opts.get_shard_filenames():
+            self.outFile = ShardedCodeEmitter(
+                gen_opts.shard_count, self.INDENT_SIZE
+            )
+        else:
+            self.outFile = CodeEmitter(self.INDENT_SIZE)
 
         if gen_opts.blacklists:
             self.__load_blacklists(gen_opts.blacklists)
         if gen_opts.platform_types:
             self.__load_platform_types(gen_opts.platform_types)
+            self.platform_types_key = tuple(
+                sorted(
+                    (name, info['baseType'], info['replaceWith'])
+                    for name, info in self.PLATFORM_TYPES.items()
+                )
+            )
 
             # Platform defined struct processing must be implemented manually,
             # so these structs will be added to the blacklist.
-            self.STRUCT_BLACKLIST += self.PLATFORM_STRUCTS
+            self.STRUCT_BLACKLIST = frozenset(self.STRUCT_BLACKLIST
+                                              ).union(self.PLATFORM_STRUCTS)
 
         # User-supplied prefix text, if any (list of strings)
         if (gen_opts.prefix_text):
@@ -378,6 +830,17 @@ class BaseGenerator(OutputGenerator):
             write('#define ', header_sym, file=self.outFile)
             self.newline()
 
+    def emit_lines(self, *lines):
+        """Append lines of code to the output file, at the current indentation level.
+
+        Named emit_lines() because OutputGenerator uses self.emit as the feature emit flag.
+        """
+        self.outFile.emit(*lines)
+
+    def indented(self, levels=1):
+        """Return a context manager that indents the lines emitted within its scope."""
+        return self.outFile.indent(levels)
+
     def includeVulkanHeaders(self, gen_opts):
         """Write Vulkan header include statements
         """
@@ -393,8 +856,145 @@ class BaseGenerator(OutputGenerator):
             self.newline()
             write('#endif', file=self.outFile)
 
-        # Finish processing in superclass
-        OutputGenerator.endFile(self)
+        for log_file in [self.errFile, self.warnFile, self.diagFile]:
+            if log_file:
+                log_file.flush()
+
+        shard_filenames = self.genOpts.get_shard_filenames()
+        if shard_filenames:
+            self.output_changed = self.write_shards(shard_filenames)
+        elif self.genOpts.filename is not None:
+            self.output_changed = self.write_if_changed(
+                os.path.join(self.genOpts.directory, self.genOpts.filename),
+                self.outFile.getvalue().encode('utf-8')
+            )
+            if self.remove_stale_shards([]):
+                self.output_changed = True
+        else:
+            sys.stdout.write(self.outFile.getvalue())
+
+        self.outFile.close()
+        self.genOpts = None
+
+    def write_shards(self, shard_filenames):
+        """Write the parts of a sharded file, and the CMake file listing the parts.
+        The unsplit file is removed, because the parts replace it in the source lists and it
+        would otherwise be left out of date.
+        Returns True if any of the files were written or removed.
+        """
+        directory = self.genOpts.directory
+        list_filename = self.genOpts.get_shard_list_filename()
+        changed = False
+        for shard, shard_filename in zip(self.outFile.shards, shard_filenames):
+            if self.write_if_changed(
+                os.path.join(directory, shard_filename),
+                shard.getvalue().encode('utf-8')
+            ):
+                changed = True
+
+        # The list defines a GFXRECON_<NAME>_SOURCES variable, to replace the unsplit file in the source lists.
+        variable = 'GFXRECON_{}_SOURCES'.format(
+            os.path.splitext(self.genOpts.filename)[0].upper()
+        )
+        shard_list = [
+            '# Generated list of the parts of {}'.format(
+                self.genOpts.filename
+            )
+        ]
+        shard_list.append('set({}'.format(variable))
+        shard_list.extend(
+            [
+                '    ${{CMAKE_CURRENT_LIST_DIR}}/{}'.format(shard_filename)
+                for shard_filename in shard_filenames
+            ]
+        )
+        shard_list.append(')')
+        shard_list.append('')
+        if self.write_if_changed(
+            os.path.join(directory, list_filename),
+            '\n'.join(shard_list).encode('utf-8')
+        ):
+            changed = True
+
+        if self.remove_stale_shards(shard_filenames + [list_filename]):
+            changed = True
+
+        unsplit_path = os.path.join(directory, self.genOpts.filename)
+        if os.path.isfile(unsplit_path):
+            self.remove_output(unsplit_path)
+            changed = True
+        return changed
+
+    def remove_stale_shards(self, keep):
+        """Remove parts of the generated file left by a previous run with a different shard count.
+        Returns True if any parts were removed.
+        """
+        directory = self.genOpts.directory
+        base, ext = os.path.splitext(self.genOpts.filename)
+        pattern = re.compile(
+            '{0}_part[0-9]+{1}$|{0}_parts\\.cmake$'.format(
+                re.escape(base), re.escape(ext)
+            )
+        )
+        removed = False
+        if os.path.isdir(directory):
+            for filename in os.listdir(directory):
+                if pattern.match(filename) and (filename not in keep):
+                    self.remove_output(os.path.join(directory, filename))
+                    removed = True
+        return removed
+
+    def remove_output(self, path):
+        """Remove a generated file that is no longer written.
+        When check_only is set, the file is not removed, and a diff is recorded for its removal.
+        """
+        if self.check_only:
+            self.add_output_diff(path, b'')
+        else:
+            os.remove(path)
+
+    def write_if_changed(self, path, content):
+        """Write content to the file at path, unless the file already contains the same content.
+        The file is replaced atomically, by writing a temporary file in the same directory and
+        then renaming it, so that an interrupted generator run never leaves a partial file.
+        Returns True if the file was written.
+        When check_only is set, the file is not written, and a diff is recorded if it would have been.
+        """
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                if f.read() == content:
+                    return False
+
+        if self.check_only:
+            self.add_output_diff(path, content)
+            return True
+
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=directory, suffix='.tmp', delete=False
+        ) as f:
+            f.write(content)
+        os.replace(f.name, path)
+        return True
+
+    def add_output_diff(self, path, content):
+        """Record a unified diff from the existing file at path to the generated content, for check_only mode.
+        An empty content indicates that the file would be removed."""
+        existing = ''
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                existing = f.read().decode('utf-8', errors='replace')
+        self.output_diffs.append(
+            ''.join(
+                difflib.unified_diff(
+                    existing.splitlines(keepends=True),
+                    content.decode('utf-8').splitlines(keepends=True),
+                    fromfile=path if existing else '/dev/null',
+                    tofile=path if content else '/dev/null'
+                )
+            )
+        )
 
     def beginFeature(self, interface, emit):
         """Method override. Start processing in superclass."""
@@ -413,7 +1013,18 @@ class BaseGenerator(OutputGenerator):
 
     def endFeature(self):
         """Method override. Generate code for the feature."""
-        if self.emit and self.need_feature_generation():
+        if self.emit:
+            if isinstance(self.outFile, ShardedCodeEmitter):
+                self.__generate_sharded_feature()
+            else:
+                self.__generate_feature_block()
+
+        # Finish processing in superclass
+        OutputGenerator.endFeature(self)
+
+    def __generate_feature_block(self):
+        """Generate code for the feature, with the feature's protection macro."""
+        if self.need_feature_generation():
             if self.feature_break:
                 self.newline()
 
@@ -430,8 +1041,59 @@ class BaseGenerator(OutputGenerator):
                     file=self.outFile
                 )
 
-        # Finish processing in superclass
-        OutputGenerator.endFeature(self)
+    def __generate_sharded_feature(self):
+        """Generate code for the feature, split across the parts of a sharded file.
+        Each command and struct is assigned to a part by a hash of its name, so that the assignment is
+        stable between runs and between registry versions.  generate_feature() is invoked once per part,
+        with the feature data sets reduced to the commands and structs assigned to the part.
+        """
+        sharded_file = self.outFile
+        shard_count = len(sharded_file.shards)
+        feature_sets = [
+            name for name in [
+                'feature_cmd_params', 'feature_struct_members',
+                'feature_struct_aliases'
+            ] if hasattr(self, name)
+        ]
+        full_sets = {name: getattr(self, name) for name in feature_sets}
+        try:
+            for index, shard in enumerate(sharded_file.shards):
+                for name, values in full_sets.items():
+                    setattr(
+                        self, name, {
+                            key: value
+                            for key, value in values.items()
+                            if self.get_shard_index(key, shard_count) == index
+                        }
+                    )
+                self.outFile = shard
+                self.__generate_feature_block()
+        finally:
+            for name, values in full_sets.items():
+                setattr(self, name, values)
+            self.outFile = sharded_file
+
+    def get_shard_index(self, name, shard_count):
+        """Return the index of the part that the code for a command or struct is written to."""
+        return zlib.crc32(name.encode('utf-8')) % shard_count
+
+    def single_shard(self):
+        """Return a context manager that directs the output written within its scope to the first part of
+        a sharded file, for definitions that must only appear once.  Has no effect when the file is not sharded.
+        """
+        if isinstance(self.outFile, ShardedCodeEmitter):
+            return self.__redirect_output(self.outFile.shards[0])
+        return nullcontext()
+
+    @contextmanager
+    def __redirect_output(self, output):
+        """Context manager that temporarily replaces the output file."""
+        saved_output = self.outFile
+        self.outFile = output
+        try:
+            yield
+        finally:
+            self.outFile = saved_output
 
     def genType(self, typeinfo, name, alias):
         """Method override. Type generation."""
@@ -532,7 +1194,27 @@ class BaseGenerator(OutputGenerator):
     def make_value_info(self, params):
         """Generate a list of ValueInfo objects from a list of <param> or <member> tags
          params - list of <param> or <member> tags to process
+        The ValueInfo objects are cached for the registry and shared by all generators using the
+        same platform types, so they must not be modified after they are created.
         """
+        registry = getattr(self, 'registry', None)
+        if registry is None:
+            return self.__create_value_info(params)
+
+        cache = _registry_value_infos.get(registry)
+        if cache is None:
+            cache = dict()
+            _registry_value_infos[registry] = cache
+
+        key = (self.platform_types_key, tuple(params))
+        values = cache.get(key)
+        if values is None:
+            values = self.__create_value_info(params)
+            cache[key] = values
+        return list(values)
+
+    def __create_value_info(self, params):
+        """Create the list of ValueInfo objects returned by make_value_info()."""
         values = []
         for param in params:
             # Get name
@@ -590,14 +1272,20 @@ class BaseGenerator(OutputGenerator):
                 )
             )
 
-        # Link array values to their corresponding length values
-        for array_value in [v for v in values if v.array_length]:
-            for v in values:
-                if re.search(
-                    r'\b{}\b'.format(v.name), array_value.array_length
-                ):
-                    array_value.array_length_value = v
-                    break
+        # Link array values to their corresponding length values, which are the first values
+        # named by the identifiers of the array length expressions.
+        value_indices = dict()
+        for index, value in enumerate(values):
+            value_indices.setdefault(value.name, index)
+        for array_value in values:
+            if array_value.array_length:
+                indices = [
+                    value_indices[identifier] for identifier in
+                    _identifier_pattern.findall(array_value.array_length)
+                    if identifier in value_indices
+                ]
+                if indices:
+                    array_value.array_length_value = values[min(indices)]
 
         return values
 
@@ -764,65 +1452,13 @@ class BaseGenerator(OutputGenerator):
             if not self.is_cmd_black_listed(key)
         ]
 
+    def get_struct_handle_analysis(self):
+        """Return the struct handle analysis shared by all generators using the current registry."""
+        return get_struct_handle_analysis(self.registry, self.make_value_info)
+
     def check_struct_pnext_handles(self, typename):
         """Determines if the specified struct type can reference pNext extension structs that contain handles."""
-        found_handles = False
-        found_handle_ptrs = False
-        valid_extension_structs = self.registry.validextensionstructs.get(
-            typename
-        )
-        if valid_extension_structs:
-            # Need to search the XML tree for pNext structures that have not been processed yet.
-            for struct_name in valid_extension_structs:
-                # Check for cached results from a previous check for this struct
-                if struct_name in self.extension_structs_with_handles:
-                    if self.extension_structs_with_handles[struct_name]:
-                        found_handles = True
-                    if self.extension_structs_with_handle_ptrs[struct_name]:
-                        found_handle_ptrs = True
-                else:
-                    # If a pre-existing result was not found, check the XML registry for the struct
-                    has_handles = False
-                    hasHandlePtrs = False
-                    type_info = self.registry.lookupElementInfo(
-                        struct_name, self.registry.typedict
-                    )
-                    if type_info:
-                        member_infos = [
-                            member for member in
-                            type_info.elem.findall('.//member/type')
-                        ]
-                        if member_infos:
-                            for member_info in member_infos:
-                                found = self.registry.tree.find(
-                                    "types/type/[name='" + member_info.text
-                                    + "'][@category='handle']"
-                                )
-                                if found:
-                                    has_handles = True
-                                    self.extension_structs_with_handles[
-                                        struct_name] = True
-                                    if member_info.tail and (
-                                        '*' in member_info.tail
-                                    ):
-                                        self.extension_structs_with_handle_ptrs[
-                                            struct_name] = True
-                                        hasHandlePtrs = True
-                                    else:
-                                        self.extension_structs_with_handle_ptrs[
-                                            struct_name] = False
-
-                    if has_handles:
-                        found_handles = True
-                        if hasHandlePtrs:
-                            found_handle_ptrs = True
-                    else:
-                        self.extension_structs_with_handles[struct_name
-                                                            ] = False
-                        self.extension_structs_with_handle_ptrs[struct_name
-                                                                ] = False
-
-        return found_handles, found_handle_ptrs
+        return self.get_struct_handle_analysis().get_pnext_handles(typename)
 
     def check_struct_member_handles(
         self,
@@ -836,6 +1472,24 @@ class BaseGenerator(OutputGenerator):
         Structs with member handles are added to a dictionary, where the key is the structure type and the value is a list of the handle members.
         An optional list of structure types that contain handle members with pointer types may also be generated.
         """
+        if (not self.is_dx12_class()) and (not ignore_output) and (
+            structs_with_map_data is None
+        ) and (type(self).is_handle is BaseGenerator.is_handle):
+            # Vulkan structs use the handle reachability computed once for all structs in the registry, unless
+            # the generator overrides is_handle() to match a subset of the registry's handle types.
+            analysis = self.get_struct_handle_analysis()
+            handle_members = analysis.handle_members.get(typename)
+            if handle_members:
+                values = self.feature_struct_members[typename]
+                structs_with_handles[typename] = [
+                    values[index] for index in handle_members
+                ]
+                if (structs_with_handle_ptrs is not None
+                    ) and (typename in analysis.handle_ptr_structs):
+                    structs_with_handle_ptrs.append(typename)
+                return True
+            return False
+
         handles = []
         has_handle_pointer = False
         map_data = []
@@ -1331,26 +1985,22 @@ class BaseGenerator(OutputGenerator):
         return None
 
     def __load_blacklists(self, filename):
-        lists = json.loads(open(filename, 'r').read())
-        self.APICALL_BLACKLIST += lists['functions']
-        self.STRUCT_BLACKLIST += lists['structures']
-        if 'classmethods' in lists:
-            for class_name, method_list in lists['classmethods'].items():
-                for method_name in method_list:
-                    self.METHODCALL_BLACKLIST.append(
-                        class_name + '_' + method_name
-                    )
+        apicalls, structs, methods = load_blacklists(filename)
+        self.APICALL_BLACKLIST = frozenset(self.APICALL_BLACKLIST
+                                           ).union(apicalls)
+        self.STRUCT_BLACKLIST = frozenset(self.STRUCT_BLACKLIST).union(structs)
+        self.METHODCALL_BLACKLIST = frozenset(self.METHODCALL_BLACKLIST
+                                              ).union(methods)
 
     def __load_platform_types(self, filename):
-        platforms = json.loads(open(filename, 'r').read())
-        for platform_name in platforms:
-            platform = platforms[platform_name]
-            platform_types = platform['types']
-            platform_types.update(self.VULKAN_REPLACE_TYPE)
-
-            for type in platform_types:
-                self.PLATFORM_TYPES[type] = platform_types[type]
-
-            platform_structs = platform['structs']
-            if platform_structs:
-                self.PLATFORM_STRUCTS += platform_structs
+        platform_types, platform_structs = load_platform_types(filename)
+        if platform_types:
+            self.PLATFORM_TYPES = MappingProxyType(
+                {
+                    **self.PLATFORM_TYPES,
+                    **platform_types,
+                    **self.VULKAN_REPLACE_TYPE
+                }
+            )
+        self.PLATFORM_STRUCTS = frozenset(self.PLATFORM_STRUCTS
+                                          ).union(platform_structs)
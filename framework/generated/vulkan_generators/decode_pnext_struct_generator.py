@@ -79,131 +79,94 @@ class DecodePNextStructGenerator(BaseGenerator):
         """Method override."""
         BaseGenerator.beginFile(self, gen_opts)
 
-        write(
+        self.emit_lines(
             '#include "decode/custom_vulkan_struct_decoders.h"',
-            file=self.outFile
-        )
-        write('#include "decode/decode_allocator.h"', file=self.outFile)
-        write('#include "decode/pnext_node.h"', file=self.outFile)
-        write('#include "decode/pnext_typed_node.h"', file=self.outFile)
-        write(
+            '#include "decode/decode_allocator.h"',
+            '#include "decode/pnext_node.h"',
+            '#include "decode/pnext_typed_node.h"',
             '#include "generated/generated_vulkan_struct_decoders.h"',
-            file=self.outFile
-        )
-        write(
             '#include "generated/generated_vulkan_enum_to_string.h"',
-            file=self.outFile
-        )
-        write('#include "util/logging.h"', file=self.outFile)
-        self.newline()
-        write('#include <cassert>', file=self.outFile)
-        self.newline()
-        write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
-        write('GFXRECON_BEGIN_NAMESPACE(decode)', file=self.outFile)
-        self.newline()
-        write(
+            '#include "util/logging.h"',
+            '',
+            '#include <cassert>',
+            '',
+            'GFXRECON_BEGIN_NAMESPACE(gfxrecon)',
+            'GFXRECON_BEGIN_NAMESPACE(decode)',
+            '',
             'size_t DecodePNextStruct(const uint8_t* parameter_buffer, size_t buffer_size,  PNextNode** pNext)',
-            file=self.outFile
-        )
-        write('{', file=self.outFile)
-        write('    assert(pNext != nullptr);', file=self.outFile)
-        self.newline()
-        write('    size_t bytes_read = 0;', file=self.outFile)
-        write('    uint32_t attrib = 0;', file=self.outFile)
-        self.newline()
-        write(
-            '    if ((parameter_buffer != nullptr) && (buffer_size >= sizeof(attrib)))',
-            file=self.outFile
-        )
-        write('    {', file=self.outFile)
-        write('        size_t stype_offset = 0;', file=self.outFile)
-        self.newline()
-        write(
-            '        // Peek at the pointer attribute mask to make sure we have a non-NULL value that can be decoded.',
-            file=self.outFile
-        )
-        write(
-            '        attrib = *(reinterpret_cast<const uint32_t*>(parameter_buffer));',
-            file=self.outFile
-        )
-        self.newline()
-        write(
-            '        if ((attrib & format::PointerAttributes::kIsNull) != format::PointerAttributes::kIsNull)',
-            file=self.outFile
-        )
-        write('        {', file=self.outFile)
-        write(
-            '            // Offset to VkStructureType, after the pointer encoding preamble.',
-            file=self.outFile
-        )
-        write('            stype_offset = sizeof(attrib);', file=self.outFile)
-        self.newline()
-        write(
-            '            if ((attrib & format::PointerAttributes::kHasAddress) == format::PointerAttributes::kHasAddress)',
-            file=self.outFile
-        )
-        write('            {', file=self.outFile)
-        write(
-            '                stype_offset += sizeof(format::AddressEncodeType);',
-            file=self.outFile
-        )
-        write('            }', file=self.outFile)
-        write('        }', file=self.outFile)
-        self.newline()
-        write(
-            '        if ((stype_offset != 0) && ((buffer_size - stype_offset) >= sizeof(VkStructureType)))',
-            file=self.outFile
-        )
-        write('        {', file=self.outFile)
-        write(
-            '            const VkStructureType* sType = reinterpret_cast<const VkStructureType*>(parameter_buffer + stype_offset);',
-            file=self.outFile
-        )
-        self.newline()
-        write('            switch (*sType)', file=self.outFile)
-        write('            {', file=self.outFile)
-        write('            default:', file=self.outFile)
-        write(
-            '                // TODO: This may need to be a fatal error',
-            file=self.outFile
-        )
-        write(
-            '                GFXRECON_LOG_ERROR("Failed to decode pNext value with unrecognized VkStructureType = %s", (util::ToString(*sType).c_str()));',
-            file=self.outFile
-        )
-        write('                break;', file=self.outFile)
+            '{',
+        )
+        with self.indented():
+            self.emit_lines(
+                'assert(pNext != nullptr);',
+                '',
+                'size_t bytes_read = 0;',
+                'uint32_t attrib = 0;',
+                '',
+                'if ((parameter_buffer != nullptr) && (buffer_size >= sizeof(attrib)))',
+                '{',
+            )
+            with self.indented():
+                self.emit_lines(
+                    'size_t stype_offset = 0;',
+                    '',
+                    '// Peek at the pointer attribute mask to make sure we have a non-NULL value that can be decoded.',
+                    'attrib = *(reinterpret_cast<const uint32_t*>(parameter_buffer));',
+                    '',
+                    'if ((attrib & format::PointerAttributes::kIsNull) != format::PointerAttributes::kIsNull)',
+                    '{',
+                    '    // Offset to VkStructureType, after the pointer encoding preamble.',
+                    '    stype_offset = sizeof(attrib);',
+                    '',
+                    '    if ((attrib & format::PointerAttributes::kHasAddress) == format::PointerAttributes::kHasAddress)',
+                    '    {',
+                    '        stype_offset += sizeof(format::AddressEncodeType);',
+                    '    }',
+                    '}',
+                    '',
+                    'if ((stype_offset != 0) && ((buffer_size - stype_offset) >= sizeof(VkStructureType)))',
+                    '{',
+                    '    const VkStructureType* sType = reinterpret_cast<const VkStructureType*>(parameter_buffer + stype_offset);',
+                    '',
+                    '    switch (*sType)',
+                    '    {',
+                    '    default:',
+                    '        // TODO: This may need to be a fatal error',
+                    '        GFXRECON_LOG_ERROR("Failed to decode pNext value with unrecognized VkStructureType = %s", (util::ToString(*sType).c_str()));',
+                    '        break;',
+                )
 
     def endFile(self):
         """Method override."""
-        write('            }', file=self.outFile)
-        write('        }', file=self.outFile)
-        write('    }', file=self.outFile)
-        self.newline()
-        write('    if ((bytes_read == 0) && (attrib != 0))', file=self.outFile)
-        write('    {', file=self.outFile)
-        write(
-            '        // The encoded pointer attribute mask included kIsNull, or the sType was unrecognized.',
-            file=self.outFile
-        )
-        write(
-            '        // We will report that we read the attribute mask, but nothing else was decoded.',
-            file=self.outFile
+        with self.indented():
+            self.emit_lines(
+                '        }',
+                '    }',
+                '}',
+                '',
+                'if ((bytes_read == 0) && (attrib != 0))',
+                '{',
+                '    // The encoded pointer attribute mask included kIsNull, or the sType was unrecognized.',
+                '    // We will report that we read the attribute mask, but nothing else was decoded.',
+                '    bytes_read = sizeof(attrib);',
+                '}',
+                '',
+                'return bytes_read;',
+            )
+        self.emit_lines(
+            '}',
+            '',
+            'GFXRECON_END_NAMESPACE(decode)',
+            'GFXRECON_END_NAMESPACE(gfxrecon)',
         )
-        write('        bytes_read = sizeof(attrib);', file=self.outFile)
-        write('    }', file=self.outFile)
-        self.newline()
-        write('    return bytes_read;', file=self.outFile)
-        write('}', file=self.outFile)
-        self.newline()
-        write('GFXRECON_END_NAMESPACE(decode)', file=self.outFile)
-        write('GFXRECON_END_NAMESPACE(gfxrecon)', file=self.outFile)
 
         # Finish processing in superclass
         BaseGenerator.endFile(self)
 
     def genStruct(self, typeinfo, typename, alias):
         """Method override."""
-        if not alias:
+        # Structs of API versions and extensions that are not emitted are excluded from the pNext switch.
+        if not alias and self.emit:
             # Only process struct types that specify a 'structextends' tag, which indicates the struct can be used in a pNext chain.
             parent_structs = typeinfo.elem.get('structextends')
             if parent_structs:
@@ -219,19 +182,13 @@ class DecodePNextStructGenerator(BaseGenerator):
 
     def generate_feature(self):
         """Performs C++ code generation for the feature."""
-        for struct in self.stype_values:
-            write(
-                '            case {}:'.format(self.stype_values[struct]),
-                file=self.outFile
-            )
-            write(
-                '                (*pNext) = DecodeAllocator::Allocate<PNextTypedNode<Decoded_{}>>();'
-                .format(struct),
-                file=self.outFile
-            )
-            write(
-                '                bytes_read = (*pNext)->Decode(parameter_buffer, buffer_size);',
-                file=self.outFile
-            )
-            write('                break;', file=self.outFile)
+        with self.indented(3):
+            for struct in self.stype_values:
+                self.emit_lines(
+                    'case {}:'.format(self.stype_values[struct]),
+                    '    (*pNext) = DecodeAllocator::Allocate<PNextTypedNode<Decoded_{}>>();'
+                    .format(struct),
+                    '    bytes_read = (*pNext)->Decode(parameter_buffer, buffer_size);',
+                    '    break;',
+                )
         self.stype_values = dict()
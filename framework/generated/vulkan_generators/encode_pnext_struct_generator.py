@@ -188,7 +188,8 @@ class EncodePNextStructGenerator(BaseGenerator):
 
     def genStruct(self, typeinfo, typename, alias):
         """Method override."""
-        if not alias:
+        # Structs of API versions and extensions that are not emitted are excluded from the pNext switch.
+        if not alias and self.emit:
             # Only process struct types that specify a 'structextends' tag, which indicates the struct can be used in a pNext chain.
             parent_structs = typeinfo.elem.get('structextends')
             if parent_structs:
@@ -39,57 +39,91 @@
 # limitations under the License.
 
 import argparse
+import ast
+import hashlib
+import importlib
+import json
+import multiprocessing
 import os
 import pdb
+import pickle
 import sys
+import sysconfig
+import tempfile
 import time
 from registry.reg import Registry, etree
 from generator import write
-
-# API Call Decoders
-from vulkan_decoder_body_generator import VulkanDecoderBodyGenerator, VulkanDecoderBodyGeneratorOptions
-from vulkan_decoder_header_generator import VulkanDecoderHeaderGenerator, VulkanDecoderHeaderGeneratorOptions
-
-# Struct Decoders
-from vulkan_struct_decoders_body_generator import VulkanStructDecodersBodyGenerator, VulkanStructDecodersBodyGeneratorOptions
-from vulkan_struct_decoders_forward_generator import VulkanStructDecodersForwardGenerator, VulkanStructDecodersForwardGeneratorOptions
-from vulkan_struct_decoders_header_generator import VulkanStructDecodersHeaderGenerator, VulkanStructDecodersHeaderGeneratorOptions
-from decode_pnext_struct_generator import DecodePNextStructGenerator, DecodePNextStructGeneratorOptions
-
-# Consumers
-from vulkan_consumer_header_generator import VulkanConsumerHeaderGenerator, VulkanConsumerHeaderGeneratorOptions
-from vulkan_ascii_consumer_body_generator import VulkanAsciiConsumerBodyGenerator, VulkanAsciiConsumerBodyGeneratorOptions
-from vulkan_replay_consumer_body_generator import VulkanReplayConsumerBodyGenerator, VulkanReplayConsumerBodyGeneratorOptions
-from vulkan_referenced_resource_consumer_header_generator import VulkanReferencedResourceHeaderGenerator, VulkanReferencedResourceHeaderGeneratorOptions
-from vulkan_referenced_resource_consumer_body_generator import VulkanReferencedResourceBodyGenerator, VulkanReferencedResourceBodyGeneratorOptions
-from vulkan_struct_handle_mappers_header_generator import VulkanStructHandleMappersHeaderGenerator, VulkanStructHandleMappersHeaderGeneratorOptions
-from vulkan_struct_handle_mappers_body_generator import VulkanStructHandleMappersBodyGenerator, VulkanStructHandleMappersBodyGeneratorOptions
-from vulkan_feature_util_body_generator import VulkanFeatureUtilBodyGenerator, VulkanFeatureUtilBodyGeneratorOptions
-
-# API Call Encoders
-from vulkan_api_call_encoders_body_generator import VulkanApiCallEncodersBodyGenerator, VulkanApiCallEncodersBodyGeneratorOptions
-from vulkan_api_call_encoders_header_generator import VulkanApiCallEncodersHeaderGenerator, VulkanApiCallEncodersHeaderGeneratorOptions
-from vulkan_command_buffer_util_body_generator import VulkanCommandBufferUtilBodyGenerator, VulkanCommandBufferUtilBodyGeneratorOptions
-from vulkan_command_buffer_util_header_generator import VulkanCommandBufferUtilHeaderGenerator, VulkanCommandBufferUtilHeaderGeneratorOptions
-from vulkan_dispatch_table_generator import VulkanDispatchTableGenerator, VulkanDispatchTableGeneratorOptions
-from layer_func_table_generator import LayerFuncTableGenerator, LayerFuncTableGeneratorOptions
-
-# Struct Encoders
-from vulkan_struct_encoders_body_generator import VulkanStructEncodersBodyGenerator, VulkanStructEncodersBodyGeneratorOptions
-from vulkan_struct_encoders_header_generator import VulkanStructEncodersHeaderGenerator, VulkanStructEncodersHeaderGeneratorOptions
-from encode_pnext_struct_generator import EncodePNextStructGenerator, EncodePNextStructGeneratorOptions
-from vulkan_struct_handle_wrappers_header_generator import VulkanStructHandleWrappersHeaderGenerator, VulkanStructHandleWrappersHeaderGeneratorOptions
-from vulkan_struct_handle_wrappers_body_generator import VulkanStructHandleWrappersBodyGenerator, VulkanStructHandleWrappersBodyGeneratorOptions
-
-# To String
-from vulkan_enum_to_string_body_generator import VulkanEnumToStringBodyGenerator, VulkanEnumToStringBodyGeneratorOptions
-from vulkan_enum_to_string_header_generator import VulkanEnumToStringHeaderGenerator, VulkanEnumToStringHeaderGeneratorOptions
-from vulkan_struct_to_string_body_generator import VulkanStructToStringBodyGenerator, VulkanStructToStringBodyGeneratorOptions
-from vulkan_pnext_to_string_body_generator import VulkanPNextToStringBodyGenerator, VulkanPNextToStringBodyGeneratorOptions
-from vulkan_struct_to_string_header_generator import VulkanStructToStringHeaderGenerator, VulkanStructToStringHeaderGeneratorOptions
-
-from vulkan_object_info_table_base2_header_generator import VulkanObjectInfoTableBase2HeaderGenerator, VulkanObjectInfoTableBase2HeaderGeneratorOptions
-from vulkan_state_table_header_generator import VulkanStateTableHeaderGenerator, VulkanStateTableHeaderGeneratorOptions
+from generator_profiler import GeneratorProfiler
+
+# Modules defining the generator classes, which are imported on demand so that only the modules
+# for the targets being generated are loaded. Each module also defines the generator's options
+# class, named <generator class name>Options.
+generator_modules = {
+    # API Call Decoders
+    'VulkanDecoderBodyGenerator': 'vulkan_decoder_body_generator',
+    'VulkanDecoderHeaderGenerator': 'vulkan_decoder_header_generator',
+
+    # Struct Decoders
+    'VulkanStructDecodersBodyGenerator':
+    'vulkan_struct_decoders_body_generator',
+    'VulkanStructDecodersForwardGenerator':
+    'vulkan_struct_decoders_forward_generator',
+    'VulkanStructDecodersHeaderGenerator':
+    'vulkan_struct_decoders_header_generator',
+    'DecodePNextStructGenerator': 'decode_pnext_struct_generator',
+
+    # Consumers
+    'VulkanConsumerHeaderGenerator': 'vulkan_consumer_header_generator',
+    'VulkanAsciiConsumerBodyGenerator': 'vulkan_ascii_consumer_body_generator',
+    'VulkanReplayConsumerBodyGenerator':
+    'vulkan_replay_consumer_body_generator',
+    'VulkanReferencedResourceHeaderGenerator':
+    'vulkan_referenced_resource_consumer_header_generator',
+    'VulkanReferencedResourceBodyGenerator':
+    'vulkan_referenced_resource_consumer_body_generator',
+    'VulkanStructHandleMappersHeaderGenerator':
+    'vulkan_struct_handle_mappers_header_generator',
+    'VulkanStructHandleMappersBodyGenerator':
+    'vulkan_struct_handle_mappers_body_generator',
+    'VulkanFeatureUtilBodyGenerator': 'vulkan_feature_util_body_generator',
+
+    # API Call Encoders
+    'VulkanApiCallEncodersBodyGenerator':
+    'vulkan_api_call_encoders_body_generator',
+    'VulkanApiCallEncodersHeaderGenerator':
+    'vulkan_api_call_encoders_header_generator',
+    'VulkanCommandBufferUtilBodyGenerator':
+    'vulkan_command_buffer_util_body_generator',
+    'VulkanCommandBufferUtilHeaderGenerator':
+    'vulkan_command_buffer_util_header_generator',
+    'VulkanDispatchTableGenerator': 'vulkan_dispatch_table_generator',
+    'LayerFuncTableGenerator': 'layer_func_table_generator',
+
+    # Struct Encoders
+    'VulkanStructEncodersBodyGenerator':
+    'vulkan_struct_encoders_body_generator',
+    'VulkanStructEncodersHeaderGenerator':
+    'vulkan_struct_encoders_header_generator',
+    'EncodePNextStructGenerator': 'encode_pnext_struct_generator',
+    'VulkanStructHandleWrappersHeaderGenerator':
+    'vulkan_struct_handle_wrappers_header_generator',
+    'VulkanStructHandleWrappersBodyGenerator':
+    'vulkan_struct_handle_wrappers_body_generator',
+
+    # To String
+    'VulkanEnumToStringBodyGenerator': 'vulkan_enum_to_string_body_generator',
+    'VulkanEnumToStringHeaderGenerator':
+    'vulkan_enum_to_string_header_generator',
+    'VulkanStructToStringBodyGenerator':
+    'vulkan_struct_to_string_body_generator',
+    'VulkanPNextToStringBodyGenerator':
+    'vulkan_pnext_to_string_body_generator',
+    'VulkanStructToStringHeaderGenerator':
+    'vulkan_struct_to_string_header_generator',
+    'VulkanObjectInfoTableBase2HeaderGenerator':
+    'vulkan_object_info_table_base2_header_generator',
+    'VulkanStateTableHeaderGenerator': 'vulkan_state_table_header_generator'
+}
 
 # Simple timer functions
 start_time = None
@@ -143,9 +177,10 @@ def getExtraVulkanHeaders(extraHeadersDir):
 
 
 def make_gen_opts(args):
-    """Returns a directory of [ generator function, generator options ] indexed
-    by specified short names. The generator options incorporate the following
-    parameters:
+    """Returns a directory of [ generator class name, generator options arguments ]
+    indexed by specified short names. The generator and generator options classes
+    are only imported when a target is generated, with get_gen_opts(). The generator
+    options incorporate the following parameters:
 
     args is an parsed argument object; see below for the fields that are used.
     """
@@ -197,8 +232,8 @@ def make_gen_opts(args):
     #
     # API call decoder generators
     gen_opts['generated_vulkan_decoder.cpp'] = [
-        VulkanDecoderBodyGenerator,
-        VulkanDecoderBodyGeneratorOptions(
+        'VulkanDecoderBodyGenerator',
+        dict(
             filename='generated_vulkan_decoder.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -206,13 +241,16 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=False,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            shard_count=args.shards,
+            dispatch_table=args.decode_dispatch_table,
+            lazy_decode=args.lazy_decode
         )
     ]
 
     gen_opts['generated_vulkan_decoder.h'] = [
-        VulkanDecoderHeaderGenerator,
-        VulkanDecoderHeaderGeneratorOptions(
+        'VulkanDecoderHeaderGenerator',
+        dict(
             filename='generated_vulkan_decoder.h',
             directory=directory,
             blacklists=blacklists,
@@ -227,8 +265,8 @@ def make_gen_opts(args):
     #
     # Struct decoder generators
     gen_opts['generated_vulkan_struct_decoders.cpp'] = [
-        VulkanStructDecodersBodyGenerator,
-        VulkanStructDecodersBodyGeneratorOptions(
+        'VulkanStructDecodersBodyGenerator',
+        dict(
             filename='generated_vulkan_struct_decoders.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -236,13 +274,14 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=False,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            shard_count=args.shards
         )
     ]
 
     gen_opts['generated_vulkan_struct_decoders_forward.h'] = [
-        VulkanStructDecodersForwardGenerator,
-        VulkanStructDecodersForwardGeneratorOptions(
+        'VulkanStructDecodersForwardGenerator',
+        dict(
             filename='generated_vulkan_struct_decoders_forward.h',
             directory=directory,
             blacklists=blacklists,
@@ -255,8 +294,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_struct_decoders.h'] = [
-        VulkanStructDecodersHeaderGenerator,
-        VulkanStructDecodersHeaderGeneratorOptions(
+        'VulkanStructDecodersHeaderGenerator',
+        dict(
             filename='generated_vulkan_struct_decoders.h',
             directory=directory,
             blacklists=blacklists,
@@ -269,8 +308,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_decode_pnext_struct.cpp'] = [
-        DecodePNextStructGenerator,
-        DecodePNextStructGeneratorOptions(
+        'DecodePNextStructGenerator',
+        dict(
             filename='generated_decode_pnext_struct.cpp',
             directory=directory,
             prefix_text=prefix_strings + vk_prefix_strings,
@@ -283,8 +322,8 @@ def make_gen_opts(args):
     #
     # Consumer generation
     gen_opts['generated_vulkan_consumer.h'] = [
-        VulkanConsumerHeaderGenerator,
-        VulkanConsumerHeaderGeneratorOptions(
+        'VulkanConsumerHeaderGenerator',
+        dict(
             class_name='VulkanConsumer',
             base_class_header='vulkan_consumer_base.h',
             is_override=False,
@@ -300,8 +339,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_ascii_consumer.h'] = [
-        VulkanConsumerHeaderGenerator,
-        VulkanConsumerHeaderGeneratorOptions(
+        'VulkanConsumerHeaderGenerator',
+        dict(
             class_name='VulkanAsciiConsumer',
             base_class_header='vulkan_ascii_consumer_base.h',
             is_override=True,
@@ -317,8 +356,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_referenced_resource_consumer.h'] = [
-        VulkanReferencedResourceHeaderGenerator,
-        VulkanReferencedResourceHeaderGeneratorOptions(
+        'VulkanReferencedResourceHeaderGenerator',
+        dict(
             filename='generated_vulkan_referenced_resource_consumer.h',
             directory=directory,
             blacklists=blacklists,
@@ -331,8 +370,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_replay_consumer.h'] = [
-        VulkanConsumerHeaderGenerator,
-        VulkanConsumerHeaderGeneratorOptions(
+        'VulkanConsumerHeaderGenerator',
+        dict(
             class_name='VulkanReplayConsumer',
             base_class_header='vulkan_replay_consumer_base.h',
             is_override=True,
@@ -350,8 +389,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_ascii_consumer.cpp'] = [
-        VulkanAsciiConsumerBodyGenerator,
-        VulkanAsciiConsumerBodyGeneratorOptions(
+        'VulkanAsciiConsumerBodyGenerator',
+        dict(
             filename='generated_vulkan_ascii_consumer.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -359,13 +398,15 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=False,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            shard_count=args.shards,
+            streaming=args.to_string_streaming
         )
     ]
 
     gen_opts['generated_vulkan_replay_consumer.cpp'] = [
-        VulkanReplayConsumerBodyGenerator,
-        VulkanReplayConsumerBodyGeneratorOptions(
+        'VulkanReplayConsumerBodyGenerator',
+        dict(
             filename='generated_vulkan_replay_consumer.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -379,8 +420,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_referenced_resource_consumer.cpp'] = [
-        VulkanReferencedResourceBodyGenerator,
-        VulkanReferencedResourceBodyGeneratorOptions(
+        'VulkanReferencedResourceBodyGenerator',
+        dict(
             filename='generated_vulkan_referenced_resource_consumer.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -393,8 +434,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_struct_handle_mappers.h'] = [
-        VulkanStructHandleMappersHeaderGenerator,
-        VulkanStructHandleMappersHeaderGeneratorOptions(
+        'VulkanStructHandleMappersHeaderGenerator',
+        dict(
             filename='generated_vulkan_struct_handle_mappers.h',
             directory=directory,
             blacklists=blacklists,
@@ -406,8 +447,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_struct_handle_mappers.cpp'] = [
-        VulkanStructHandleMappersBodyGenerator,
-        VulkanStructHandleMappersBodyGeneratorOptions(
+        'VulkanStructHandleMappersBodyGenerator',
+        dict(
             filename='generated_vulkan_struct_handle_mappers.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -419,8 +460,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_feature_util.cpp'] = [
-        VulkanFeatureUtilBodyGenerator,
-        VulkanFeatureUtilBodyGeneratorOptions(
+        'VulkanFeatureUtilBodyGenerator',
+        dict(
             filename='generated_vulkan_feature_util.cpp',
             directory=directory,
             platform_types=platform_types,
@@ -434,8 +475,8 @@ def make_gen_opts(args):
     #
     # API call encoder generators
     gen_opts['generated_vulkan_api_call_encoders.h'] = [
-        VulkanApiCallEncodersHeaderGenerator,
-        VulkanApiCallEncodersHeaderGeneratorOptions(
+        'VulkanApiCallEncodersHeaderGenerator',
+        dict(
             filename='generated_vulkan_api_call_encoders.h',
             directory=directory,
             blacklists=blacklists,
@@ -448,8 +489,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_api_call_encoders.cpp'] = [
-        VulkanApiCallEncodersBodyGenerator,
-        VulkanApiCallEncodersBodyGeneratorOptions(
+        'VulkanApiCallEncodersBodyGenerator',
+        dict(
             filename='generated_vulkan_api_call_encoders.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -458,13 +499,14 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=False,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            shard_count=args.shards
         )
     ]
 
     gen_opts['generated_vulkan_command_buffer_util.h'] = [
-        VulkanCommandBufferUtilHeaderGenerator,
-        VulkanCommandBufferUtilHeaderGeneratorOptions(
+        'VulkanCommandBufferUtilHeaderGenerator',
+        dict(
             filename='generated_vulkan_command_buffer_util.h',
             directory=directory,
             blacklists=blacklists,
@@ -477,8 +519,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_command_buffer_util.cpp'] = [
-        VulkanCommandBufferUtilBodyGenerator,
-        VulkanCommandBufferUtilBodyGeneratorOptions(
+        'VulkanCommandBufferUtilBodyGenerator',
+        dict(
             filename='generated_vulkan_command_buffer_util.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -491,8 +533,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_dispatch_table.h'] = [
-        VulkanDispatchTableGenerator,
-        VulkanDispatchTableGeneratorOptions(
+        'VulkanDispatchTableGenerator',
+        dict(
             filename='generated_vulkan_dispatch_table.h',
             directory=directory,
             prefix_text=prefix_strings + vk_prefix_strings,
@@ -503,8 +545,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_layer_func_table.h'] = [
-        LayerFuncTableGenerator,
-        LayerFuncTableGeneratorOptions(
+        'LayerFuncTableGenerator',
+        dict(
             filename='generated_layer_func_table.h',
             directory=directory,
             prefix_text=prefix_strings + vk_prefix_strings,
@@ -517,8 +559,8 @@ def make_gen_opts(args):
     #
     # Struct encoder generators
     gen_opts['generated_vulkan_struct_encoders.cpp'] = [
-        VulkanStructEncodersBodyGenerator,
-        VulkanStructEncodersBodyGeneratorOptions(
+        'VulkanStructEncodersBodyGenerator',
+        dict(
             filename='generated_vulkan_struct_encoders.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -531,8 +573,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_struct_encoders.h'] = [
-        VulkanStructEncodersHeaderGenerator,
-        VulkanStructEncodersHeaderGeneratorOptions(
+        'VulkanStructEncodersHeaderGenerator',
+        dict(
             filename='generated_vulkan_struct_encoders.h',
             directory=directory,
             blacklists=blacklists,
@@ -545,8 +587,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_encode_pnext_struct.cpp'] = [
-        EncodePNextStructGenerator,
-        EncodePNextStructGeneratorOptions(
+        'EncodePNextStructGenerator',
+        dict(
             filename='generated_encode_pnext_struct.cpp',
             directory=directory,
             prefix_text=prefix_strings + vk_prefix_strings,
@@ -557,8 +599,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_struct_handle_wrappers.h'] = [
-        VulkanStructHandleWrappersHeaderGenerator,
-        VulkanStructHandleWrappersHeaderGeneratorOptions(
+        'VulkanStructHandleWrappersHeaderGenerator',
+        dict(
             filename='generated_vulkan_struct_handle_wrappers.h',
             directory=directory,
             blacklists=blacklists,
@@ -570,8 +612,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_struct_handle_wrappers.cpp'] = [
-        VulkanStructHandleWrappersBodyGenerator,
-        VulkanStructHandleWrappersBodyGeneratorOptions(
+        'VulkanStructHandleWrappersBodyGenerator',
+        dict(
             filename='generated_vulkan_struct_handle_wrappers.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -585,8 +627,8 @@ def make_gen_opts(args):
     #
     # To string generators
     gen_opts['generated_vulkan_enum_to_string.h'] = [
-        VulkanEnumToStringHeaderGenerator,
-        VulkanEnumToStringHeaderGeneratorOptions(
+        'VulkanEnumToStringHeaderGenerator',
+        dict(
             filename='generated_vulkan_enum_to_string.h',
             directory=directory,
             blacklists=blacklists,
@@ -599,8 +641,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_enum_to_string.cpp'] = [
-        VulkanEnumToStringBodyGenerator,
-        VulkanEnumToStringBodyGeneratorOptions(
+        'VulkanEnumToStringBodyGenerator',
+        dict(
             filename='generated_vulkan_enum_to_string.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -608,13 +650,14 @@ def make_gen_opts(args):
             prefixText=prefix_strings + vk_prefix_strings,
             protectFile=False,
             protectFeature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            lookupTables=args.enum_lookup_tables
         )
     ]
 
     gen_opts['generated_vulkan_pnext_to_string.cpp'] = [
-        VulkanPNextToStringBodyGenerator,
-        VulkanPNextToStringBodyGeneratorOptions(
+        'VulkanPNextToStringBodyGenerator',
+        dict(
             filename='generated_vulkan_pnext_to_string.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -627,8 +670,8 @@ def make_gen_opts(args):
     ]
 
     gen_opts['generated_vulkan_struct_to_string.h'] = [
-        VulkanStructToStringHeaderGenerator,
-        VulkanStructToStringHeaderGeneratorOptions(
+        'VulkanStructToStringHeaderGenerator',
+        dict(
             filename='generated_vulkan_struct_to_string.h',
             directory=directory,
             blacklists=blacklists,
@@ -636,13 +679,14 @@ def make_gen_opts(args):
             prefixText=prefix_strings + vk_prefix_strings,
             protectFile=True,
             protectFeature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            streaming=args.to_string_streaming
         )
     ]
 
     gen_opts['generated_vulkan_struct_to_string.cpp'] = [
-        VulkanStructToStringBodyGenerator,
-        VulkanStructToStringBodyGeneratorOptions(
+        'VulkanStructToStringBodyGenerator',
+        dict(
             filename='generated_vulkan_struct_to_string.cpp',
             directory=directory,
             blacklists=blacklists,
@@ -650,13 +694,15 @@ def make_gen_opts(args):
             prefixText=prefix_strings + vk_prefix_strings,
             protectFile=False,
             protectFeature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            shard_count=args.shards,
+            streaming=args.to_string_streaming
         )
     ]
 
     gen_opts['generated_vulkan_object_info_table_base2.h'] = [
-        VulkanObjectInfoTableBase2HeaderGenerator,
-        VulkanObjectInfoTableBase2HeaderGeneratorOptions(
+        'VulkanObjectInfoTableBase2HeaderGenerator',
+        dict(
             filename='generated_vulkan_object_info_table_base2.h',
             directory=directory,
             blacklists=blacklists,
@@ -664,13 +710,14 @@ def make_gen_opts(args):
             prefixText=prefix_strings + vk_prefix_strings,
             protectFile=True,
             protectFeature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            pagedMaps=args.object_info_paged_maps
         )
     ]
 
     gen_opts['generated_vulkan_state_table.h'] = [
-        VulkanStateTableHeaderGenerator,
-        VulkanStateTableHeaderGeneratorOptions(
+        'VulkanStateTableHeaderGenerator',
+        dict(
             filename='generated_vulkan_state_table.h',
             directory=directory,
             blacklists=blacklists,
@@ -678,28 +725,42 @@ def make_gen_opts(args):
             prefixText=prefix_strings + vk_prefix_strings,
             protectFile=True,
             protectFeature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            hashMaps=args.state_table_hash_maps
         )
     ]
 
 
-def gen_target(args):
+def get_gen_opts(args, target):
+    """Returns [ generator class, generator options ] for a target, importing the
+    module that defines the target's generator and generator options classes.
+    The generation profile specified by args is applied to the options.
+    """
+    generator_name, options_args = gen_opts[target]
+    module = importlib.import_module(generator_modules[generator_name])
+    create_generator = getattr(module, generator_name)
+    options = getattr(module, generator_name + 'Options')(**options_args)
+    if args.generation_profile:
+        options.set_generation_profile(args.generation_profile)
+    return [create_generator, options]
+
+
+def gen_target(args, target):
     """Generate a target based on the options in the matching gen_opts{} object.
     This is encapsulated in a function so it can be profiled and/or timed.
     The args parameter is an parsed argument object containing the following
     fields that are used:
-      target - target to generate
       directory - directory to generate it in
       protect - True if re-inclusion wrappers should be created
       extensions - list of additional extensions to include in generated
       interfaces
+    The target parameter is the name of the target to generate.
     """
     # Create generator options with specified parameters
     make_gen_opts(args)
 
-    if args.target in gen_opts:
-        create_generator = gen_opts[args.target][0]
-        options = gen_opts[args.target][1]
+    if target in gen_opts:
+        create_generator, options = get_gen_opts(args, target)
 
         if not args.quiet:
             write('* Building', options.filename, file=sys.stderr)
@@ -737,17 +798,504 @@ def gen_target(args):
         gen = create_generator(
             err_file=err_warn, warn_file=err_warn, diag_file=diag
         )
+        gen.check_only = args.check
 
         return (gen, options)
     else:
         write(
             'No generator options for unknown target:',
-            args.target,
+            target,
             file=sys.stderr
         )
         return None
 
 
+def set_registry_generator(reg, gen, options):
+    """Attach a generator and its options to a registry that has already been
+    loaded, so that the registry can be reused to generate another target.
+    Resets the required/declared state left in the registry by a previous
+    apiGen() call and reproduces the bindings made by the Registry constructor.
+    """
+    reg.apiReset()
+    reg.gen = gen
+    reg.genOpts = options
+    gen.registry = reg
+    gen.genOpts = options
+    options.registry = reg
+
+
+def gen_registry_target(args, reg, gen, options):
+    """Run the generator for a single target against a loaded registry.
+    Returns a tuple containing the target file name, the wall clock time
+    spent generating it, a flag indicating that the target file changed, and
+    the diffs of the target files that differ from the output in check mode.
+    """
+    global registry_load_time
+    target_start_time = time.perf_counter()
+
+    if (args.debug):
+        pdb.run('reg.apiGen()', globals(), {'reg': reg})
+    elif args.profile:
+        profiler = GeneratorProfiler(options.filename)
+        profiler.instrument(gen)
+        # The registry is loaded once per process, so the load time is attributed to a single target.
+        if registry_load_target in (None, options.filename):
+            profiler.add_phase('registry_load', registry_load_time)
+            registry_load_time = 0.0
+        else:
+            profiler.add_phase('registry_load', 0.0)
+
+        with profiler.scope('apiGen'):
+            reg.apiGen()
+        profiler.add_phase(
+            'api_gen',
+            profiler.get_function_time('apiGen')
+            - profiler.get_function_time('write_if_changed')
+        )
+        profiler.add_phase(
+            'write_output', profiler.get_function_time('write_if_changed')
+        )
+        profiler.write_reports(args.profile)
+    else:
+        start_timer(args.time)
+        reg.apiGen()
+        end_timer(args.time, '* Time to generate ' + options.filename + ' =')
+
+    if not args.quiet:
+        write('* Generated', options.filename, file=sys.stderr)
+
+    return (
+        options.filename, time.perf_counter() - target_start_time,
+        gen.output_changed, gen.output_diffs
+    )
+
+
+# Time spent loading the registry, which has not yet been attributed to a profiled target.
+registry_load_time = 0.0
+
+# Target that the registry load time is attributed to, when worker processes share a registry
+# loaded by the parent process.  Otherwise None, to attribute it to the first profiled target.
+registry_load_target = None
+
+# Registry attributes that are excluded from the registry cache: the active generator, and the namedtuple
+# class that Registry.__init__ creates at run time, which cannot be pickled.  These attributes are set by the
+# Registry constructor before the cached state is restored.
+registry_cache_excludes = ['gen', 'genOpts', 'commandextensiontuple']
+
+# File name prefix and suffix of the registry cache files, which are named with a hash of the cached inputs.
+registry_cache_prefix = 'vk_registry_'
+registry_cache_suffix = '.pickle'
+
+
+def hash_file(hasher, path):
+    """Add the content of a file to a hashlib object."""
+    with open(path, 'rb') as f:
+        hasher.update(f.read())
+
+
+def get_file_hash(path):
+    """Return the SHA-256 hash of a file's content, or None if the file does not exist."""
+    if not os.path.isfile(path):
+        return None
+    hasher = hashlib.sha256()
+    hash_file(hasher, path)
+    return hasher.hexdigest()
+
+
+def get_registry_cache_path(args):
+    """Return the path of the registry cache file for the current inputs.
+    The file name contains a hash of the XML registry file, the extra Vulkan headers,
+    and the Python sources that determine the content of the loaded registry.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(repr(sys.version_info[:2]).encode('utf-8'))
+    hash_file(hasher, args.registry)
+
+    if args.headers_dir is not None:
+        for header in sorted(getExtraVulkanHeaders(args.headers_dir)):
+            hasher.update(header.encode('utf-8'))
+            hash_file(hasher, os.path.join(args.headers_dir, header))
+
+    for module_name in [Registry.__module__, write.__module__, __name__]:
+        module_path = getattr(sys.modules[module_name], '__file__', None)
+        if module_path:
+            hash_file(hasher, module_path)
+
+    return os.path.join(
+        args.cache_dir,
+        registry_cache_prefix + hasher.hexdigest()[:32] + registry_cache_suffix
+    )
+
+
+def load_registry_cache(reg, cache_path):
+    """Restore the loaded registry state from a cache file.
+    Returns False if the cache file does not exist or cannot be read.
+    """
+    if not os.path.isfile(cache_path):
+        return False
+
+    try:
+        with open(cache_path, 'rb') as f:
+            state = pickle.load(f)
+    except Exception as e:
+        write(
+            'Ignoring unreadable registry cache',
+            cache_path,
+            e,
+            file=sys.stderr
+        )
+        return False
+
+    reg.__dict__.update(state)
+    return True
+
+
+def save_registry_cache(reg, cache_path):
+    """Write the loaded registry state to a cache file.
+    The file is written to a temporary file first and then moved into place, so that
+    concurrent generator runs never read a partially written cache.  Cache files written
+    for other inputs are removed once the new cache file is in place.  A registry that
+    cannot be written to the cache is reported, and is not cached.
+    """
+    state = {
+        key: value
+        for key, value in reg.__dict__.items()
+        if key not in registry_cache_excludes
+    }
+
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_file = tempfile.NamedTemporaryFile(
+        dir=cache_dir, suffix='.tmp', delete=False
+    )
+    try:
+        with temp_file:
+            pickle.dump(state, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file.name, cache_path)
+    except Exception as e:
+        # Do not leave a partially written temporary file in the cache directory.
+        os.unlink(temp_file.name)
+        write('Unable to write registry cache', cache_path, e, file=sys.stderr)
+        return
+    except:
+        os.unlink(temp_file.name)
+        raise
+
+    # Remove the cache files written for previous versions of the registry and generator sources.
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if name.startswith(registry_cache_prefix) and name.endswith(
+            registry_cache_suffix
+        ) and (path != cache_path):
+            try:
+                os.remove(path)
+            except OSError:
+                # The file may have been removed by a concurrent generator run.
+                pass
+
+
+def load_registry(args, gen, options):
+    """Create a registry for the specified generator and load the XML registry file into it.
+    When a cache directory is specified, the loaded registry state is read from the cache
+    when it is present, and written to the cache after the XML registry file is loaded
+    when it is not.
+    """
+    global registry_load_time
+    load_start_time = time.perf_counter()
+    reg = Registry(gen, options)
+
+    cache_path = None
+    if args.cache_dir:
+        cache_path = get_registry_cache_path(args)
+
+        start_timer(args.time)
+        if load_registry_cache(reg, cache_path):
+            end_timer(args.time, '* Time to load cached registry =')
+            registry_load_time += time.perf_counter() - load_start_time
+            return reg
+
+    start_timer(args.time)
+    tree = etree.parse(args.registry)
+    end_timer(args.time, '* Time to make ElementTree =')
+
+    start_timer(args.time)
+    reg.loadElementTree(tree)
+    end_timer(args.time, '* Time to parse ElementTree =')
+
+    if cache_path:
+        start_timer(args.time)
+        save_registry_cache(reg, cache_path)
+        end_timer(args.time, '* Time to write registry cache =')
+
+    registry_load_time += time.perf_counter() - load_start_time
+    return reg
+
+
+def init_worker(worker_args, worker_reg, registry_target):
+    """Initialize the state for a worker process of the parallel generation pool.
+    When worker processes are forked, the registry loaded by the parent process is inherited
+    and worker_reg references it. Otherwise worker_reg is None and the worker process loads
+    the registry once, with the generator for registry_target, to be reused for all of the
+    targets assigned to the worker.
+    """
+    global args, reg, err_warn, diag, registry_load_target
+    args = worker_args
+
+    if (args.errfile):
+        err_warn = open(args.errfile, 'a', encoding='utf-8')
+    else:
+        err_warn = sys.stderr
+
+    if (args.diagfile):
+        diag = open(args.diagfile, 'a', encoding='utf-8')
+    else:
+        diag = None
+
+    if worker_reg is None:
+        (gen, options) = gen_target(args, registry_target)
+        reg = load_registry(args, gen, options)
+    else:
+        reg = worker_reg
+        registry_load_target = registry_target
+
+
+def gen_worker_target(target):
+    """Generate a single target from a worker process of the parallel generation pool."""
+    (gen, options) = gen_target(args, target)
+    set_registry_generator(reg, gen, options)
+    return gen_registry_target(args, reg, gen, options)
+
+
+def gen_parallel_targets(args, reg, targets):
+    """Generate the targets with a pool of worker processes.
+    Each worker reuses a loaded registry rather than parsing the XML registry for each target.
+    Returns a list of (target file name, generation time, changed, diffs) tuples.
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+        worker_reg = reg
+    else:
+        context = multiprocessing.get_context('spawn')
+        worker_reg = None
+
+    # Start with the targets that took the longest to generate last time, using the size of the
+    # previously generated file as an estimate, so that a large target is not left for the end.
+    def previous_size(target):
+        path = os.path.join(args.directory, target)
+        return os.path.getsize(path) if os.path.isfile(path) else 0
+
+    ordered_targets = sorted(targets, key=previous_size, reverse=True)
+
+    with context.Pool(
+        min(args.jobs, len(targets)),
+        initializer=init_worker,
+        initargs=(args, worker_reg, ordered_targets[0])
+    ) as pool:
+        return list(
+            pool.imap_unordered(
+                gen_worker_target, ordered_targets, chunksize=1
+            )
+        )
+
+
+def report_target_results(target_results):
+    """Print the targets whose files changed and, for multiple targets, the time
+    spent generating each target, slowest first."""
+    if len(target_results) > 1:
+        write('* Target generation times:', file=sys.stderr)
+        for filename, elapsed, changed, diffs in sorted(
+            target_results, key=lambda entry: entry[1], reverse=True
+        ):
+            write(
+                '*   {:<56}{:8.3f}s{}'.format(
+                    filename, elapsed, ' (changed)' if changed else ''
+                ),
+                file=sys.stderr
+            )
+
+    changed_targets = [entry[0] for entry in target_results if entry[2]]
+    write(
+        '* {} of {} targets changed'.format(
+            len(changed_targets), len(target_results)
+        ),
+        file=sys.stderr
+    )
+    for filename in changed_targets:
+        write('*   Updated', filename, file=sys.stderr)
+
+
+# Maximum number of diff lines printed for each file that differs from the generated output in check mode.
+check_diff_lines = 100
+
+
+def report_check_results(target_results):
+    """Print the diffs of the target files that differ from the generated output, in check mode.
+    Returns the number of targets that differ."""
+    differing_targets = 0
+    for filename, elapsed, changed, diffs in sorted(target_results):
+        if not changed:
+            continue
+        differing_targets += 1
+        for diff in diffs:
+            lines = diff.splitlines()
+            added = sum(
+                1 for line in lines[2:]
+                if line.startswith('+') and not line.startswith('+++')
+            )
+            removed = sum(
+                1 for line in lines[2:]
+                if line.startswith('-') and not line.startswith('---')
+            )
+            write(
+                '* {} differs: {} lines added, {} lines removed'.format(
+                    filename, added, removed
+                ),
+                file=sys.stderr
+            )
+            for line in lines[:check_diff_lines]:
+                write(line)
+            remaining_lines = len(lines) - check_diff_lines
+            if remaining_lines > 0:
+                write('... {} more diff lines'.format(remaining_lines))
+
+    write(
+        '* {} of {} targets differ from the generated output'.format(
+            differing_targets, len(target_results)
+        ),
+        file=sys.stderr
+    )
+    return differing_targets
+
+
+# JSON configuration file options read by the generators, recorded in the generation manifest.
+manifest_config_options = [
+    'blacklists', 'platform_types', 'replay_overrides', 'capture_overrides',
+    'generation_profile'
+]
+
+# Cache of the local module names imported by each Python source file.
+module_imports = {}
+
+
+def is_installed_module_file(path):
+    """Determine if a module file belongs to the Python installation rather than the code generator."""
+    path = os.path.normcase(os.path.realpath(path))
+    for install_path in set(sysconfig.get_paths().values()):
+        install_path = os.path.normcase(os.path.realpath(install_path))
+        if path.startswith(install_path + os.sep):
+            return True
+    return False
+
+
+def get_module_imports(path):
+    """Return the names of the modules imported by a Python source file."""
+    if path not in module_imports:
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), path)
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom
+                            ) and node.module and (node.level == 0):
+                names.append(node.module)
+        module_imports[path] = names
+    return module_imports[path]
+
+
+def get_generator_module_files(create_generator, options):
+    """Return the source files of the modules that define a target's generator and options
+    classes, and of the generator modules that they import, transitively.
+    gencode.py is included for the options it creates, but its imports are not followed
+    because they are not used to generate the target.
+    """
+    files = [os.path.abspath(__file__)]
+    visited = set()
+    pending = [
+        cls.__module__
+        for cls in type(options).__mro__ + create_generator.__mro__
+    ]
+    while pending:
+        name = pending.pop()
+        if name in visited:
+            continue
+        visited.add(name)
+
+        path = getattr(sys.modules.get(name), '__file__', None)
+        if (not path) or (not path.endswith('.py')
+                          ) or is_installed_module_file(path):
+            continue
+
+        files.append(os.path.abspath(path))
+        pending.extend(get_module_imports(path))
+
+    return sorted(set(files))
+
+
+def get_output_filenames(options):
+    """Return the names of the files written for a target, which are the parts and part list of a sharded target."""
+    shard_filenames = options.get_shard_filenames()
+    if shard_filenames:
+        return shard_filenames + [options.get_shard_list_filename()]
+    return [options.filename]
+
+
+def make_manifest_entry(args, target):
+    """Create the generation manifest entry for a target, recording content hashes for the
+    target's registry, generator modules, JSON configuration files and output files.
+    """
+    create_generator, options = get_gen_opts(args, target)
+
+    configs = {}
+    for option in manifest_config_options:
+        path = getattr(options, option, None)
+        if path:
+            configs[os.path.abspath(path)] = get_file_hash(path)
+
+    return {
+        'registry': get_file_hash(args.registry),
+        'extra_headers': options.extraVulkanHeaders,
+        'modules': {
+            path: get_file_hash(path)
+            for path in get_generator_module_files(create_generator, options)
+        },
+        'configs': configs,
+        'shard_count': options.shard_count,
+        'dispatch_table': getattr(options, 'dispatch_table', False),
+        'lazy_decode': getattr(options, 'lazy_decode', False),
+        'lookup_tables': getattr(options, 'lookupTables', False),
+        'hash_maps': getattr(options, 'hashMaps', False),
+        'paged_maps': getattr(options, 'pagedMaps', False),
+        'streaming': getattr(options, 'streaming', False),
+        'output': {
+            filename: get_file_hash(os.path.join(args.directory, filename))
+            for filename in get_output_filenames(options)
+        }
+    }
+
+
+def load_manifest(path):
+    """Load the generation manifest, returning an empty manifest if it does not exist or cannot be read."""
+    if os.path.isfile(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except ValueError:
+            write('Ignoring unreadable manifest', path, file=sys.stderr)
+    return {}
+
+
+def save_manifest(path, manifest):
+    """Write the generation manifest, replacing the previous manifest atomically."""
+    manifest_dir = os.path.dirname(os.path.abspath(path))
+    os.makedirs(manifest_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        'w', dir=manifest_dir, suffix='.tmp', encoding='utf-8', delete=False
+    ) as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(f.name, path)
+
+
 # -feature name
 # -extension name
 # For both, "name" may be a single name, or a space-separated list
@@ -778,7 +1326,30 @@ if __name__ == '__main__':
         help='Disable inclusion protection in output headers'
     )
     parser.add_argument(
-        '-profile', action='store_true', help='Enable profiling'
+        '-profile',
+        dest='profile',
+        action='store',
+        nargs='?',
+        const='.',
+        default=None,
+        help='\n'.join(
+            [
+                'Enable profiling, writing a JSON report and a collapsed stack report for each target to the specified directory.',
+                'The reports record the time spent loading the registry, traversing the registry features, in each generator method, and writing the output.'
+            ]
+        )
+    )
+    parser.add_argument(
+        '-generation-profile',
+        dest='generation_profile',
+        action='store',
+        default=None,
+        help='\n'.join(
+            [
+                'Path to a generation profile JSON file, listing the API versions and extensions to generate code for.',
+                'The profile may contain "versions", "extensions" and "exclude_extensions" lists.  All versions and extensions are generated by default.'
+            ]
+        )
     )
     parser.add_argument(
         '-registry',
@@ -798,6 +1369,40 @@ if __name__ == '__main__':
             ]
         )
     )
+    parser.add_argument(
+        '-cache-dir',
+        dest='cache_dir',
+        action='store',
+        default=None,
+        help='\n'.join(
+            [
+                'Path to a directory for caching the loaded registry between runs.',
+                'When a cached registry matching the current inputs is found, XML parsing is skipped.'
+            ]
+        )
+    )
+    parser.add_argument(
+        '-manifest',
+        dest='manifest',
+        action='store',
+        default=None,
+        help='\n'.join(
+            [
+                'Path to a manifest file recording the inputs of each generated target.',
+                'Only targets whose registry, generator modules, JSON configuration files or output changed since the manifest was written are generated.'
+            ]
+        )
+    )
+    parser.add_argument(
+        '-check',
+        action='store_true',
+        help='\n'.join(
+            [
+                'Compare the generated targets with the files in the output directory, without writing any files.',
+                'Prints a diff of each file that differs, and exits with a non-zero status if any file differs.'
+            ]
+        )
+    )
     parser.add_argument('-time', action='store_true', help='Enable timing')
     parser.add_argument(
         '-validate', action='store_true', help='Enable group validation'
@@ -810,7 +1415,11 @@ if __name__ == '__main__':
         help='Create target and related files in specified directory'
     )
     parser.add_argument(
-        'target', metavar='target', nargs='?', help='Specify target'
+        'target',
+        metavar='target',
+        nargs='*',
+        help=
+        'Specify target; multiple targets are generated from a single load of the registry'
     )
     parser.add_argument(
         '-quiet',
@@ -825,6 +1434,65 @@ if __name__ == '__main__':
         default=True,
         help='Enable script output during normal execution.'
     )
+    parser.add_argument(
+        '-jobs',
+        action='store',
+        dest='jobs',
+        type=int,
+        default=1,
+        help='Number of worker processes to use when generating multiple targets'
+    )
+    parser.add_argument(
+        '-shards',
+        action='store',
+        dest='shards',
+        type=int,
+        default=1,
+        help=
+        'Number of parts to split the largest generated source files into, for parallel compilation'
+    )
+    parser.add_argument(
+        '-decode-dispatch-table',
+        action='store_true',
+        dest='decode_dispatch_table',
+        help=
+        'Dispatch decoded API calls through a table indexed by API call ID instead of a switch statement'
+    )
+    parser.add_argument(
+        '-lazy-decode',
+        action='store_true',
+        dest='lazy_decode',
+        help=
+        'Decode API call array parameters when they are first accessed by a consumer'
+    )
+    parser.add_argument(
+        '-enum-lookup-tables',
+        action='store_true',
+        dest='enum_lookup_tables',
+        help=
+        'Convert enums and flags to strings with name lookup tables instead of switch statements'
+    )
+    parser.add_argument(
+        '-state-table-hash-maps',
+        action='store_true',
+        dest='state_table_hash_maps',
+        help=
+        'Store the capture state table handle wrappers in hash maps instead of ordered maps'
+    )
+    parser.add_argument(
+        '-object-info-paged-maps',
+        action='store_true',
+        dest='object_info_paged_maps',
+        help=
+        'Store the replay object info table entries in pages indexed by capture ID instead of hash maps'
+    )
+    parser.add_argument(
+        '-to-string-streaming',
+        action='store_true',
+        dest='to_string_streaming',
+        help=
+        'Write struct and API call parameter strings directly to the output stream instead of creating temporary strings'
+    )
     parser.add_argument(
         '-configs',
         action='store',
@@ -847,17 +1515,38 @@ if __name__ == '__main__':
     else:
         diag = None
 
-    (gen, options) = gen_target(args)
+    make_gen_opts(args)
 
-    reg = Registry(gen, options)
+    targets = []
+    for target in args.target:
+        if target in gen_opts:
+            targets.append(target)
+        else:
+            write(
+                'No generator options for unknown target:',
+                target,
+                file=sys.stderr
+            )
 
-    start_timer(args.time)
-    tree = etree.parse(args.registry)
-    end_timer(args.time, '* Time to make ElementTree =')
+    if not targets:
+        sys.exit(1)
 
-    start_timer(args.time)
-    reg.loadElementTree(tree)
-    end_timer(args.time, '* Time to parse ElementTree =')
+    # Every target is compared in check mode, and the manifest is not updated.
+    if args.check:
+        args.manifest = None
+
+    if args.manifest:
+        manifest = load_manifest(args.manifest)
+        targets = [
+            target for target in targets
+            if manifest.get(target) != make_manifest_entry(args, target)
+        ]
+        if not targets:
+            write('* All targets are up to date', file=sys.stderr)
+            sys.exit(0)
+
+    (gen, options) = gen_target(args, targets[0])
+    reg = load_registry(args, gen, options)
 
     if (args.validate):
         reg.validateGroups()
@@ -866,12 +1555,22 @@ if __name__ == '__main__':
         write('* Dumping registry to regdump.txt', file=sys.stderr)
         reg.dumpReg(filehandle=open('regdump.txt', 'w', encoding='utf-8'))
 
-    if (args.debug):
-        pdb.run('reg.api_gen()')
+    if (args.jobs > 1) and (len(targets) > 1) and not args.debug:
+        target_results = gen_parallel_targets(args, reg, targets)
     else:
-        start_timer(args.time)
-        reg.apiGen()
-        end_timer(args.time, '* Time to generate ' + options.filename + ' =')
-
-    if not args.quiet:
-        write('* Generated', options.filename, file=sys.stderr)
+        target_results = []
+        for index, target in enumerate(targets):
+            if index > 0:
+                (gen, options) = gen_target(args, target)
+                set_registry_generator(reg, gen, options)
+            target_results.append(gen_registry_target(args, reg, gen, options))
+
+    if args.check:
+        sys.exit(1 if report_check_results(target_results) else 0)
+
+    report_target_results(target_results)
+
+    if args.manifest:
+        for target in targets:
+            manifest[target] = make_manifest_entry(args, target)
+        save_manifest(args.manifest, manifest)
@@ -0,0 +1,162 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2021 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+# File name suffixes of the JSON and collapsed stack profile reports written for each target.
+PROFILE_JSON_SUFFIX = '.profile.json'
+PROFILE_STACKS_SUFFIX = '.profile.folded'
+
+
+class GeneratorProfiler():
+    """GeneratorProfiler - Class to record the time spent generating a target.
+    Instruments the methods of a generator object, recording the number of calls and the
+    inclusive and exclusive time of each method, and the exclusive time of each call stack.
+    Writes a JSON report and a collapsed stack report, which can be rendered as a flame graph
+    with tools such as flamegraph.pl or speedscope.
+
+    Members:
+      target - Name of the profiled target, used as the root of the call stacks.
+      phases - Dictionary of generation phase names to the time spent in the phase.
+    """
+
+    # Generator methods called by the registry, which are always instrumented.
+    PROFILED_METHODS = [
+        'beginFile', 'endFile', 'beginFeature', 'endFeature', 'genType',
+        'genStruct', 'genGroup', 'genEnum', 'genCmd', 'write_if_changed'
+    ]
+
+    # Generator helper methods with these name prefixes are also instrumented.
+    PROFILED_PREFIXES = ('generate_', 'make_', 'check_')
+
+    def __init__(self, target):
+        self.target = target
+        self.phases = dict()
+        self.__stack = [target]
+        self.__child_times = [0.0]
+        self.__stack_times = dict()
+        self.__functions = dict()
+
+    def instrument(self, gen):
+        """Replace the profiled methods of a generator object with instrumented wrappers."""
+        for name in dir(type(gen)):
+            if (name in self.PROFILED_METHODS) or name.startswith(
+                self.PROFILED_PREFIXES
+            ):
+                method = getattr(gen, name, None)
+                if callable(method):
+                    setattr(gen, name, self.__wrap(name, method))
+
+    def __wrap(self, name, method):
+        """Return a wrapper that records the time spent in method."""
+
+        @functools.wraps(method)
+        def profiled_method(*args, **kwargs):
+            with self.scope(name):
+                return method(*args, **kwargs)
+
+        return profiled_method
+
+    @contextmanager
+    def scope(self, name):
+        """Context manager that records the time spent within its scope as a call to name."""
+        self.__stack.append(name)
+        self.__child_times.append(0.0)
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start_time
+            exclusive = elapsed - self.__child_times.pop()
+
+            key = ';'.join(self.__stack)
+            self.__stack_times[
+                key] = self.__stack_times.get(key, 0.0) + exclusive
+
+            stats = self.__functions.setdefault(name, [0, 0.0, 0.0])
+            stats[0] += 1
+            # Only the outermost call of a recursive method adds to the inclusive time.
+            if name not in self.__stack[1:-1]:
+                stats[1] += elapsed
+            stats[2] += exclusive
+
+            self.__stack.pop()
+            self.__child_times[-1] += elapsed
+
+    def add_phase(self, name, seconds):
+        """Record the time spent in a generation phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def get_function_time(self, name):
+        """Return the inclusive time spent in calls to name."""
+        return self.__functions.get(name, [0, 0.0, 0.0])[1]
+
+    def make_report(self):
+        """Return the profile as a dictionary that can be written as JSON."""
+        functions = [
+            {
+                'name': name,
+                'calls': stats[0],
+                'total_seconds': round(stats[1], 6),
+                'self_seconds': round(stats[2], 6)
+            } for name, stats in self.__functions.items()
+        ]
+        functions.sort(key=lambda entry: entry['self_seconds'], reverse=True)
+
+        return {
+            'target': self.target,
+            'total_seconds': round(sum(self.phases.values()), 6),
+            'phases': {
+                name: round(seconds, 6)
+                for name, seconds in self.phases.items()
+            },
+            'functions': functions
+        }
+
+    def make_collapsed_stacks(self):
+        """Return the exclusive time of each call stack, in microseconds, in collapsed stack format."""
+        lines = []
+        for key, seconds in sorted(self.__stack_times.items()):
+            microseconds = int(seconds * 1000000)
+            if microseconds > 0:
+                lines.append('{} {}'.format(key, microseconds))
+        return '\n'.join(lines) + '\n'
+
+    def write_reports(self, directory):
+        """Write the JSON and collapsed stack reports for the target to a directory."""
+        os.makedirs(directory, exist_ok=True)
+        with open(
+            os.path.join(directory, self.target + PROFILE_JSON_SUFFIX),
+            'w',
+            encoding='utf-8'
+        ) as f:
+            json.dump(self.make_report(), f, indent=2)
+        with open(
+            os.path.join(directory, self.target + PROFILE_STACKS_SUFFIX),
+            'w',
+            encoding='utf-8'
+        ) as f:
+            f.write(self.make_collapsed_stacks())
@@ -22,7 +22,7 @@
 # IN THE SOFTWARE.
 
 import sys
-from base_generator import BaseGenerator, BaseGeneratorOptions, write
+from base_generator import BaseGenerator, BaseGeneratorOptions
 
 
 class LayerFuncTableGeneratorOptions(BaseGeneratorOptions):
@@ -84,37 +84,49 @@ class LayerFuncTableGenerator(BaseGenerator):
             'vkEnumerateDeviceExtensionProperties'
         ]
 
+        # Table entries are collected from all features and written in name order by endFile
+        self.func_table_entries = dict()
+
     def beginFile(self, gen_opts):
         """Method override."""
         BaseGenerator.beginFile(self, gen_opts)
 
-        write(
+        self.emit_lines(
             '#include "encode/custom_vulkan_api_call_encoders.h"',
-            file=self.outFile
-        )
-        write(
             '#include "generated/generated_vulkan_api_call_encoders.h"',
-            file=self.outFile
+            '#include "layer/trace_layer.h"',
+            '#include "util/defines.h"',
+            '',
         )
-        write('#include "layer/trace_layer.h"', file=self.outFile)
-        write('#include "util/defines.h"', file=self.outFile)
-        self.newline()
         self.includeVulkanHeaders(gen_opts)
-        self.newline()
-        write('#include <unordered_map>', file=self.outFile)
-        self.newline()
-        write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
-        self.newline()
-        write(
-            'const std::unordered_map<std::string, PFN_vkVoidFunction> func_table = {',
-            file=self.outFile
+        self.emit_lines(
+            '',
+            'GFXRECON_BEGIN_NAMESPACE(gfxrecon)',
+            '',
+            'struct LayerFuncTableEntry',
+            '{',
+            '    const char*        name;',
+            '    PFN_vkVoidFunction func;',
+            '};',
+            '',
         )
 
     def endFile(self):
         """Method override."""
-        write('};', file=self.outFile)
-        self.newline()
-        write('GFXRECON_END_NAMESPACE(gfxrecon)', file=self.outFile)
+        # Entries are sorted by name with the same ordering as strcmp, so that the table can be searched
+        # with a binary search and initialized without constructing any strings at library load.
+        self.emit_lines(
+            '// Sorted by name for binary search.',
+            'const LayerFuncTableEntry func_table[] = {'
+        )
+        with self.indented():
+            self.emit_lines(
+                *[
+                    self.func_table_entries[cmd]
+                    for cmd in sorted(self.func_table_entries)
+                ]
+            )
+        self.emit_lines('};', '', 'GFXRECON_END_NAMESPACE(gfxrecon)')
 
         # Finish processing in superclass
         BaseGenerator.endFile(self)
@@ -130,11 +142,11 @@ class LayerFuncTableGenerator(BaseGenerator):
         for cmd in self.get_filtered_cmd_names():
             align = 100 - len(cmd)
             if (cmd in self.LAYER_FUNCTIONS):
-                body = '    {{ "{}",{}reinterpret_cast<PFN_vkVoidFunction>({}) }},'.format(
+                body = '{{ "{}",{}reinterpret_cast<PFN_vkVoidFunction>({}) }},'.format(
                     cmd, (' ' * align), cmd[2:]
                 )
             else:
-                body = '    {{ "{}",{}reinterpret_cast<PFN_vkVoidFunction>(encode::{}) }},'.format(
+                body = '{{ "{}",{}reinterpret_cast<PFN_vkVoidFunction>(encode::{}) }},'.format(
                     cmd, (' ' * align), cmd[2:]
                 )
-            write(body, file=self.outFile)
+            self.func_table_entries[cmd] = body
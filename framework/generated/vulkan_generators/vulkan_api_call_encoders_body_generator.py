@@ -22,7 +22,7 @@
 # IN THE SOFTWARE.
 
 import sys
-from base_generator import BaseGenerator, BaseGeneratorOptions, ValueInfo, json, write
+from base_generator import BaseGenerator, BaseGeneratorOptions, ValueInfo, load_function_overrides, write
 
 
 class VulkanApiCallEncodersBodyGeneratorOptions(BaseGeneratorOptions):
@@ -38,7 +38,8 @@ class VulkanApiCallEncodersBodyGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        shard_count=1
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -49,7 +50,8 @@ class VulkanApiCallEncodersBodyGeneratorOptions(BaseGeneratorOptions):
             prefix_text,
             protect_file,
             protect_feature,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            shard_count=shard_count
         )
         self.capture_overrides = capture_overrides
 
@@ -215,29 +217,36 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
         has_outputs = self.has_outputs(return_type, values)
         arg_list = self.make_arg_list(values)
 
-        body = ''
+        body = []
 
-        body += indent + 'auto state_lock = VulkanCaptureManager::Get()->AcquireSharedStateLock();\n'
-        body += '\n'
+        body.append(
+            indent +
+            'auto state_lock = VulkanCaptureManager::Get()->AcquireSharedStateLock();\n'
+        )
+        body.append('\n')
 
         if has_outputs or (return_type and return_type != 'void'):
             encode_after = True
 
         if has_outputs and (return_type and return_type != 'void'):
             omit_output_param = 'omit_output_data'
-            body += indent + 'bool omit_output_data = false;\n'
-            body += '\n'
+            body.append(indent + 'bool omit_output_data = false;\n')
+            body.append('\n')
 
-        body += indent + 'CustomEncoderPreCall<format::ApiCallId::ApiCall_{}>::Dispatch(VulkanCaptureManager::Get(), {});\n'.format(
-            name, arg_list
+        body.append(
+            indent +
+            'CustomEncoderPreCall<format::ApiCallId::ApiCall_{}>::Dispatch(VulkanCaptureManager::Get(), {});\n'
+            .format(name, arg_list)
         )
 
         if not encode_after:
-            body += self.make_parameter_encoding(
-                name, values, return_type, indent, omit_output_param
+            body.append(
+                self.make_parameter_encoding(
+                    name, values, return_type, indent, omit_output_param
+                )
             )
 
-        body += '\n'
+        body.append('\n')
 
         if is_override:
             # Capture overrides simply call the override function without handle unwrap/wrap
@@ -246,17 +255,18 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
                 self.CAPTURE_OVERRIDES[name], self.make_arg_list(values)
             )
             if return_type and return_type != 'void':
-                body += indent + '{} result = {};\n'.format(
-                    return_type, call_expr
+                body.append(
+                    indent
+                    + '{} result = {};\n'.format(return_type, call_expr)
                 )
             else:
-                body += indent + '{};\n'.format(call_expr)
+                body.append(indent + '{};\n'.format(call_expr))
 
             if has_outputs and (return_type and return_type != 'void'):
-                body += indent + 'if (result < 0)\n'
-                body += indent + '{\n'
-                body += indent + '    omit_output_data = true;\n'
-                body += indent + '}\n'
+                body.append(indent + 'if (result < 0)\n')
+                body.append(indent + '{\n')
+                body.append(indent + '    omit_output_data = true;\n')
+                body.append(indent + '}\n')
         else:
             # Check for handles that need unwrapping.
             unwrap_expr, unwrapped_arg_list, need_unwrap_memory = self.make_handle_unwrapping(
@@ -264,95 +274,103 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
             )
             if unwrap_expr:
                 if need_unwrap_memory:
-                    body += indent + 'auto handle_unwrap_memory = VulkanCaptureManager::Get()->GetHandleUnwrapMemory();\n'
-                body += unwrap_expr
-                body += '\n'
+                    body.append(
+                        indent +
+                        'auto handle_unwrap_memory = VulkanCaptureManager::Get()->GetHandleUnwrapMemory();\n'
+                    )
+                body.append(unwrap_expr)
+                body.append('\n')
 
             # Construct the function call to dispatch to the next layer.
             call_expr = self.make_layer_dispatch_call(
                 name, values, unwrapped_arg_list
             )
             if return_type and return_type != 'void':
-                body += indent + '{} result = {};\n'.format(
-                    return_type, call_expr
+                body.append(
+                    indent
+                    + '{} result = {};\n'.format(return_type, call_expr)
                 )
             else:
-                body += indent + '{};\n'.format(call_expr)
+                body.append(indent + '{};\n'.format(call_expr))
 
             # Wrap newly created handles.
             wrap_expr = self.make_handle_wrapping(values, indent)
             if wrap_expr:
-                body += '\n'
+                body.append('\n')
                 if return_type and return_type != 'void':
-                    body += indent + 'if (result >= 0)\n'
-                    body += indent + '{\n'
-                    body += '    ' + wrap_expr
-                    body += indent + '}\n'
+                    body.append(indent + 'if (result >= 0)\n')
+                    body.append(indent + '{\n')
+                    body.append('    ' + wrap_expr)
+                    body.append(indent + '}\n')
                     if has_outputs:
-                        body += indent + 'else\n'
-                        body += indent + '{\n'
-                        body += indent + '    omit_output_data = true;\n'
-                        body += indent + '}\n'
+                        body.append(indent + 'else\n')
+                        body.append(indent + '{\n')
+                        body.append(indent + '    omit_output_data = true;\n')
+                        body.append(indent + '}\n')
                 else:
-                    body += wrap_expr
+                    body.append(wrap_expr)
             elif has_outputs and (return_type and return_type != 'void'):
-                body += indent + 'if (result < 0)\n'
-                body += indent + '{\n'
-                body += indent + '    omit_output_data = true;\n'
-                body += indent + '}\n'
+                body.append(indent + 'if (result < 0)\n')
+                body.append(indent + '{\n')
+                body.append(indent + '    omit_output_data = true;\n')
+                body.append(indent + '}\n')
 
         if encode_after:
-            body += self.make_parameter_encoding(
-                name, values, return_type, indent, omit_output_param
+            body.append(
+                self.make_parameter_encoding(
+                    name, values, return_type, indent, omit_output_param
+                )
             )
 
-        body += '\n'
+        body.append('\n')
         if return_type and return_type != 'void':
-            body += '    CustomEncoderPostCall<format::ApiCallId::ApiCall_{}>::Dispatch(VulkanCaptureManager::Get(), result, {});\n'.format(
-                name, arg_list
+            body.append(
+                '    CustomEncoderPostCall<format::ApiCallId::ApiCall_{}>::Dispatch(VulkanCaptureManager::Get(), result, {});\n'
+                .format(name, arg_list)
             )
         else:
-            body += '    CustomEncoderPostCall<format::ApiCallId::ApiCall_{}>::Dispatch(VulkanCaptureManager::Get(), {});\n'.format(
-                name, arg_list
+            body.append(
+                '    CustomEncoderPostCall<format::ApiCallId::ApiCall_{}>::Dispatch(VulkanCaptureManager::Get(), {});\n'
+                .format(name, arg_list)
             )
 
         cleanup_expr = self.make_handle_cleanup(name, values, indent)
         if cleanup_expr:
-            body += '\n'
-            body += cleanup_expr
+            body.append('\n')
+            body.append(cleanup_expr)
 
         if return_type and return_type != 'void':
-            body += '\n'
-            body += '    return result;\n'
+            body.append('\n')
+            body.append('    return result;\n')
 
-        return body
+        return ''.join(body)
 
     def make_parameter_encoding(
         self, name, values, return_type, indent, omit_output_param
     ):
-        body = '\n'
-        body += indent + self.make_begin_api_call(name, values)
-        body += indent + 'if (encoder)\n'
-        body += indent + '{\n'
+        body = ['\n']
+        body.append(indent + self.make_begin_api_call(name, values))
+        body.append(indent + 'if (encoder)\n')
+        body.append(indent + '{\n')
         indent += ' ' * self.INDENT_SIZE
 
         for value in values:
             method_call = self.make_encoder_method_call(
                 name, value, values, '', omit_output_param
             )
-            body += indent + '{};\n'.format(method_call)
+            body.append(indent + '{};\n'.format(method_call))
 
         if return_type and return_type != 'void':
             method_call = self.make_encoder_method_call(
                 name, ValueInfo('result', return_type, return_type), [], ''
             )
-            body += indent + '{};\n'.format(method_call)
+            body.append(indent + '{};\n'.format(method_call))
 
         # Determine the appropriate end call: Create handle call, destroy handle call, or general call.
-        body += indent + self.make_end_api_call(name, values, return_type)
+        body.append(indent + self.make_end_api_call(name, values, return_type))
         indent = indent[0:-self.INDENT_SIZE]
-        body += indent + '}\n'
-        return body
+        body.append(indent + '}\n')
+        return ''.join(body)
 
     def make_begin_api_call(self, name, values):
         if name.startswith('vkCreate') or name.startswith(
@@ -725,5 +743,4 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
         return False
 
     def __load_capture_overrides(self, filename):
-        overrides = json.loads(open(filename, 'r').read())
-        self.CAPTURE_OVERRIDES = overrides['functions']
+        self.CAPTURE_OVERRIDES = load_function_overrides(filename)
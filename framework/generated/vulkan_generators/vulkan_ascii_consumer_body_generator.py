@@ -37,7 +37,9 @@ class VulkanAsciiConsumerBodyGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        shard_count=1,
+        streaming=False  # Write parameters directly to the output stream instead of converting them to strings.
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -48,8 +50,10 @@ class VulkanAsciiConsumerBodyGeneratorOptions(BaseGeneratorOptions):
             prefix_text,
             protect_file,
             protect_feature,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            shard_count=shard_count
         )
+        self.streaming = streaming
 
 
 class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
@@ -81,9 +85,13 @@ class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
             'vkGetAccelerationStructureBuildSizesKHR',
         }
 
+        # Set from the generator options when the file is started
+        self.streaming = False
+
     def beginFile(self, gen_opts):
         """Method override."""
         BaseGenerator.beginFile(self, gen_opts)
+        self.streaming = gen_opts.streaming
 
         includes = inspect.cleandoc(
             '''
@@ -145,7 +153,7 @@ class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
                         uint32_t tabCount = 0;
                         uint32_t tabSize = 4;
                         WriteApiCallToFile(call_info, "{0}", toStringFlags, tabCount, tabSize,
-                            [&](std::stringstream& strStrm)
+                            [&](std::ostream& strStrm)
                             {{
                     '''.format(cmd)
                 )
@@ -170,7 +178,11 @@ class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
 
         # Handle function return value
         if not 'void' in return_type:
-            body = '            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, \'"\' + ToString(returnValue, toStringFlags, tabCount, tabSize) + \'"\');\n'
+            if self.streaming:
+                body = '            FieldNameToStream(strStrm, true, "return", toStringFlags, tabCount, tabSize);\n'
+                body += '            strStrm << \'"\' << ToString(returnValue, toStringFlags, tabCount, tabSize) << \'"\';\n'
+            else:
+                body = '            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, \'"\' + ToString(returnValue, toStringFlags, tabCount, tabSize) + \'"\');\n'
 
         # Handle function arguments
         for value in values:
@@ -179,6 +191,9 @@ class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
             #   below without being handled the generated code will fail to compile
             toString = 'static_assert(false, "Unhandled value in `vulkan_ascii_consumer_body_generator.py`")'
 
+            # In streaming mode, values that are not written with a specific stream statement write their string
+            toStream = None
+
             # void data PointerDecoder requires custom handling
             if 'void' in value.full_type:
                 toString = 'DataPointerDecoderToString({0})'
@@ -204,6 +219,7 @@ class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
                         toString = 'HandlePointerDecoderToString({0})'
                     elif self.is_struct(value.base_type):
                         toString = 'PointerDecoderToString({0}, toStringFlags, tabCount, tabSize)'
+                        toStream = 'PointerDecoderToStream(strStrm, {0}, toStringFlags, tabCount, tabSize);'
                     elif self.is_enum(value.base_type):
                         toString = 'EnumPointerDecoderToString({0})'
                     else:
@@ -223,14 +239,21 @@ class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
                         toString = 'HandleIdToString({0})'
                     elif self.is_struct(value.base_type):
                         toString = 'ToString({0}, toStringFlags, tabCount, tabSize)'
+                        toStream = 'ToStream(strStrm, {0}, toStringFlags, tabCount, tabSize);'
                     elif self.is_enum(value.base_type):
                         toString = '\'"\' + ToString({0}, toStringFlags, tabCount, tabSize) + \'"\''
+                        toStream = 'strStrm << \'"\' << ToString({0}, toStringFlags, tabCount, tabSize) << \'"\';'
                     else:
                         toString = 'ToString({0}, toStringFlags, tabCount, tabSize)'
 
             firstField = 'true' if not body else 'false'
             valueName = ('[out]' if self.is_output_parameter(value) else '') + value.name
             toString = toString.format(value.name, value.array_length)
-            body += '            FieldToString(strStrm, {0}, "{1}", toStringFlags, tabCount, tabSize, {2});\n'.format(firstField, valueName, toString)
+            if self.streaming:
+                toStream = toStream.format(value.name, value.array_length) if toStream else 'strStrm << {0};'.format(toString)
+                body += '            FieldNameToStream(strStrm, {0}, "{1}", toStringFlags, tabCount, tabSize);\n'.format(firstField, valueName)
+                body += '            {0}\n'.format(toStream)
+            else:
+                body += '            FieldToString(strStrm, {0}, "{1}", toStringFlags, tabCount, tabSize, {2});\n'.format(firstField, valueName, toString)
         return body
     # yapf: enable
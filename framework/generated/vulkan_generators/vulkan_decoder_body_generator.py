@@ -27,7 +27,14 @@ from base_decoder_body_generator import BaseDecoderBodyGenerator
 
 
 class VulkanDecoderBodyGeneratorOptions(BaseGeneratorOptions):
-    """Options for generating a C++ class for Vulkan API parameter decoding."""
+    """Options for generating a C++ class for Vulkan API parameter decoding.
+
+    Additional members
+      dispatch_table - True if VulkanDecoder::DecodeFunctionCall should dispatch through a
+        table of member function pointers indexed by API call ID, instead of a switch statement.
+      lazy_decode - True if array parameters should be decoded when they are first accessed by a
+        consumer, instead of when the API call is decoded.
+    """
 
     def __init__(
         self,
@@ -38,7 +45,10 @@ class VulkanDecoderBodyGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        shard_count=1,
+        dispatch_table=False,
+        lazy_decode=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -49,8 +59,11 @@ class VulkanDecoderBodyGeneratorOptions(BaseGeneratorOptions):
             prefix_text,
             protect_file,
             protect_feature,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            shard_count=shard_count
         )
+        self.dispatch_table = dispatch_table
+        self.lazy_decode = lazy_decode
 
 
 class VulkanDecoderBodyGenerator(BaseDecoderBodyGenerator, BaseGenerator):
@@ -76,10 +89,19 @@ class VulkanDecoderBodyGenerator(BaseDecoderBodyGenerator, BaseGenerator):
         # Names of all Vulkan commands processed by the generator.
         self.cmd_names = []
 
+        # Generate a dispatch table for VulkanDecoder::DecodeFunctionCall instead of a switch statement.
+        self.dispatch_table = False
+
+        # Generate decoders that defer decoding of array parameters until they are accessed.
+        self.lazy_decode = False
+
     def beginFile(self, gen_opts):
         """Method override."""
         BaseGenerator.beginFile(self, gen_opts)
 
+        self.dispatch_table = gen_opts.dispatch_table
+        self.lazy_decode = gen_opts.lazy_decode
+
         write('#include "decode/handle_pointer_decoder.h"', file=self.outFile)
         write('#include "decode/pnext_node.h"', file=self.outFile)
         write('#include "decode/pointer_decoder.h"', file=self.outFile)
@@ -99,6 +121,8 @@ class VulkanDecoderBodyGenerator(BaseDecoderBodyGenerator, BaseGenerator):
         self.newline()
         self.includeVulkanHeaders(gen_opts)
         self.newline()
+        if self.dispatch_table:
+            write('#include <array>', file=self.outFile)
         write('#include <cstddef>', file=self.outFile)
         self.newline()
         write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
@@ -106,9 +130,13 @@ class VulkanDecoderBodyGenerator(BaseDecoderBodyGenerator, BaseGenerator):
 
     def endFile(self):
         """Method override."""
-        self.newline()
         # Generate the VulkanDecoder::DecodeFunctionCall method for all of the commands processed by the generator.
-        self.generate_decode_cases()
+        with self.single_shard():
+            self.newline()
+            if self.dispatch_table:
+                self.generate_decode_table()
+            else:
+                self.generate_decode_cases()
         self.newline()
         write('GFXRECON_END_NAMESPACE(decode)', file=self.outFile)
         write('GFXRECON_END_NAMESPACE(gfxrecon)', file=self.outFile)
@@ -22,7 +22,7 @@
 # IN THE SOFTWARE.
 
 import sys
-from base_generator import BaseGenerator, BaseGeneratorOptions, write
+from base_generator import BaseGenerator, BaseGeneratorOptions
 
 
 class VulkanDispatchTableGeneratorOptions(BaseGeneratorOptions):
@@ -90,97 +90,77 @@ class VulkanDispatchTableGenerator(BaseGenerator):
         """Method override."""
         BaseGenerator.beginFile(self, gen_opts)
 
-        write('#include "format/platform_types.h"', file=self.outFile)
-        write('#include "util/defines.h"', file=self.outFile)
-        write('#include "util/logging.h"', file=self.outFile)
-        self.newline()
-        write('#include "vulkan/vk_layer.h"', file=self.outFile)
+        self.emit_lines(
+            '#include "format/platform_types.h"',
+            '#include "util/defines.h"',
+            '#include "util/logging.h"',
+            '',
+            '#include "vulkan/vk_layer.h"',
+        )
         self.includeVulkanHeaders(gen_opts)
-        self.newline()
-        write('#ifdef WIN32', file=self.outFile)
-        write('#ifdef CreateEvent', file=self.outFile)
-        write('#undef CreateEvent', file=self.outFile)
-        write('#endif', file=self.outFile)
-        write('#ifdef CreateSemaphore', file=self.outFile)
-        write('#undef CreateSemaphore', file=self.outFile)
-        write('#endif', file=self.outFile)
-        write('#endif', file=self.outFile)
-        self.newline()
-        write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
-        write('GFXRECON_BEGIN_NAMESPACE(encode)', file=self.outFile)
+        self.emit_lines(
+            '',
+            '#ifdef WIN32',
+            '#ifdef CreateEvent',
+            '#undef CreateEvent',
+            '#endif',
+            '#ifdef CreateSemaphore',
+            '#undef CreateSemaphore',
+            '#endif',
+            '#endif',
+            '',
+            'GFXRECON_BEGIN_NAMESPACE(gfxrecon)',
+            'GFXRECON_BEGIN_NAMESPACE(encode)',
+        )
 
     def endFile(self):
         """Method override."""
-        self.newline()
-
-        write('typedef const void* DispatchKey;', file=self.outFile)
-        self.newline()
-
-        write(
+        self.emit_lines(
+            '',
+            'typedef const void* DispatchKey;',
+            '',
             '// Retrieve a dispatch key from a dispatchable handle',
-            file=self.outFile
-        )
-        write(
             'static DispatchKey GetDispatchKey(const void* handle)',
-            file=self.outFile
-        )
-        write('{', file=self.outFile)
-        write(
+            '{',
             '    const DispatchKey* dispatch_key = reinterpret_cast<const DispatchKey*>(handle);',
-            file=self.outFile
+            '    return (*dispatch_key);',
+            '}',
+            '',
         )
-        write('    return (*dispatch_key);', file=self.outFile)
-        write('}', file=self.outFile)
-
-        self.newline()
         self.generate_no_op_funcs()
-        self.newline()
-
-        write('struct LayerTable', file=self.outFile)
-        write('{', file=self.outFile)
-        write(
+        self.emit_lines(
+            '',
+            'struct LayerTable',
+            '{',
             '    PFN_vkCreateInstance CreateInstance{ nullptr };',
-            file=self.outFile
-        )
-        write(
             '    PFN_vkCreateDevice CreateDevice{ nullptr };',
-            file=self.outFile
+            '};',
+            '',
         )
-        write('};', file=self.outFile)
-
-        self.newline()
         self.generate_instance_cmd_table()
         self.newline()
         self.generate_device_cmd_table()
-        self.newline()
-
-        write(
+        self.emit_lines(
+            '',
             'template <typename GetProcAddr, typename Handle, typename FuncP>',
-            file=self.outFile
-        )
-        write(
             'static void LoadFunction(GetProcAddr gpa, Handle handle, const char* name, FuncP* funcp)',
-            file=self.outFile
-        )
-        write('{', file=self.outFile)
-        write(
+            '{',
             '    FuncP result = reinterpret_cast<FuncP>(gpa(handle, name));',
-            file=self.outFile
+            '    if (result != nullptr)',
+            '    {',
+            '        (*funcp) = result;',
+            '    }',
+            '}',
+            '',
         )
-        write('    if (result != nullptr)', file=self.outFile)
-        write('    {', file=self.outFile)
-        write('        (*funcp) = result;', file=self.outFile)
-        write('    }', file=self.outFile)
-        write('}', file=self.outFile)
-
-        self.newline()
         self.generate_load_instance_table_func()
         self.newline()
         self.generate_load_device_table_func()
-        self.newline()
-
-        write('GFXRECON_END_NAMESPACE(encode)', file=self.outFile)
-        write('GFXRECON_END_NAMESPACE(gfxrecon)', file=self.outFile)
+        self.emit_lines(
+            '',
+            'GFXRECON_END_NAMESPACE(encode)',
+            'GFXRECON_END_NAMESPACE(gfxrecon)',
+        )
 
         # Finish processing in superclass
         BaseGenerator.endFile(self)
@@ -218,87 +198,74 @@ class VulkanDispatchTableGenerator(BaseGenerator):
 
     def generate_instance_cmd_table(self):
         """Generate instance dispatch table structure."""
-        write('struct InstanceTable', file=self.outFile)
-        write('{', file=self.outFile)
-
-        for name in self.instance_cmd_names:
-            decl = '    PFN_{} {}{{ noop::{} }};'.format(
-                name, name[2:], name[2:]
+        self.emit_lines('struct InstanceTable', '{')
+        with self.indented():
+            self.emit_lines(
+                *[
+                    'PFN_{} {}{{ noop::{} }};'.
+                    format(name, name[2:], name[2:])
+                    for name in self.instance_cmd_names
+                ]
             )
-            write(decl, file=self.outFile)
-
-        write('};', file=self.outFile)
+        self.emit_lines('};')
 
     def generate_device_cmd_table(self):
         """Generate device dispatch table structure."""
-        write('struct DeviceTable', file=self.outFile)
-        write('{', file=self.outFile)
-
-        for name in self.device_cmd_names:
-            decl = '    PFN_{} {}{{ noop::{} }};'.format(
-                name, name[2:], name[2:]
+        self.emit_lines('struct DeviceTable', '{')
+        with self.indented():
+            self.emit_lines(
+                *[
+                    'PFN_{} {}{{ noop::{} }};'.
+                    format(name, name[2:], name[2:])
+                    for name in self.device_cmd_names
+                ]
             )
-            write(decl, file=self.outFile)
-
-        write('};', file=self.outFile)
+        self.emit_lines('};')
 
     def generate_no_op_funcs(self):
         """Generate no-op function definitions."""
-        write('GFXRECON_BEGIN_NAMESPACE(noop)', file=self.outFile)
-        write('// clang-format off', file=self.outFile)
-
-        for name in self.instance_cmd_names:
-            write(self.instance_cmd_names[name], file=self.outFile)
-
-        for name in self.device_cmd_names:
-            write(self.device_cmd_names[name], file=self.outFile)
-
-        write('// clang-format on', file=self.outFile)
-        write('GFXRECON_END_NAMESPACE(noop)', file=self.outFile)
+        self.emit_lines(
+            'GFXRECON_BEGIN_NAMESPACE(noop)', '// clang-format off',
+            *self.instance_cmd_names.values(), *self.device_cmd_names.values(),
+            '// clang-format on', 'GFXRECON_END_NAMESPACE(noop)'
+        )
 
     def generate_load_instance_table_func(self):
         """Generate function to set the instance table's functions with a getprocaddress routine."""
-        write(
+        self.emit_lines(
             'static void LoadInstanceTable(PFN_vkGetInstanceProcAddr gpa, VkInstance instance, InstanceTable* table)',
-            file=self.outFile
+            '{',
         )
-        write('{', file=self.outFile)
-        write('    assert(table != nullptr);', file=self.outFile)
-        self.newline()
-
-        for name in self.instance_cmd_names:
-            if name == 'vkGetInstanceProcAddr':
-                write(
-                    '    table->GetInstanceProcAddr = gpa;', file=self.outFile
-                )
-            else:
-                expr = '    LoadFunction(gpa, instance, "{}", &table->{});'.format(
-                    name, name[2:]
-                )
-                write(expr, file=self.outFile)
-
-        write('}', file=self.outFile)
+        with self.indented():
+            self.emit_lines('assert(table != nullptr);', '')
+            for name in self.instance_cmd_names:
+                if name == 'vkGetInstanceProcAddr':
+                    self.emit_lines('table->GetInstanceProcAddr = gpa;')
+                else:
+                    self.emit_lines(
+                        'LoadFunction(gpa, instance, "{}", &table->{});'.
+                        format(name, name[2:])
+                    )
+        self.emit_lines('}')
 
     def generate_load_device_table_func(self):
         """Generate function to set the device table's functions with a getprocaddress routine."""
-        write(
+        self.emit_lines(
             'static void LoadDeviceTable(PFN_vkGetDeviceProcAddr gpa, VkDevice device, DeviceTable* table)',
-            file=self.outFile
+            '{',
         )
-        write('{', file=self.outFile)
-        write('    assert(table != nullptr);', file=self.outFile)
-        self.newline()
-
-        for name in self.device_cmd_names:
-            if name == 'vkGetDeviceProcAddr':
-                write('    table->GetDeviceProcAddr = gpa;', file=self.outFile)
-            else:
-                expr = '    LoadFunction(gpa, device, "{}", &table->{});'.format(
-                    name, name[2:]
-                )
-                write(expr, file=self.outFile)
-
-        write('}', file=self.outFile)
+        with self.indented():
+            self.emit_lines('assert(table != nullptr);', '')
+            for name in self.device_cmd_names:
+                if name == 'vkGetDeviceProcAddr':
+                    self.emit_lines('table->GetDeviceProcAddr = gpa;')
+                else:
+                    self.emit_lines(
+                        'LoadFunction(gpa, device, "{}", &table->{});'.format(
+                            name, name[2:]
+                        )
+                    )
+        self.emit_lines('}')
 
     def make_full_typename(self, value):
         """Generate the full typename for the NoOp function parameters; the array types need the [] moved from the parameter name to the parameter typename."""
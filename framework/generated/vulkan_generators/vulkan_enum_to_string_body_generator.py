@@ -36,7 +36,8 @@ class VulkanEnumToStringBodyGeneratorOptions(BaseGeneratorOptions):
         prefixText='',
         protectFile=False,
         protectFeature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        lookupTables=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -49,6 +50,7 @@ class VulkanEnumToStringBodyGeneratorOptions(BaseGeneratorOptions):
             protectFeature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.lookupTables = lookupTables
 
 
 # VulkanEnumToStringBodyGenerator - subclass of BaseGenerator.
@@ -83,10 +85,14 @@ class VulkanEnumToStringBodyGenerator(BaseGenerator):
             'VkPipelineStageFlagBits2KHR',
         }
 
+        # Generate name lookup tables for enums, instead of switch statements.
+        self.lookupTables = False
+
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
         BaseGenerator.beginFile(self, genOpts)
+        self.lookupTables = genOpts.lookupTables
         body = inspect.cleandoc('''
             #include "generated_vulkan_enum_to_string.h"
             #include "decode/custom_vulkan_to_string.h"
@@ -110,6 +116,14 @@ class VulkanEnumToStringBodyGenerator(BaseGenerator):
         BaseGenerator.endFile(self)
     # yapf: enable
 
+    # Method override
+    def genGroup(self, groupinfo, group_name, alias):
+        BaseGenerator.genGroup(self, groupinfo, group_name, alias)
+        # Enums of API versions and extensions that are not emitted are treated as processed, so
+        # that they are skipped when the emitted features are generated.
+        if not self.emit:
+            self.processedEnums.add(group_name)
+
     #
     # Indicates that the current feature has C++ code to generate.
     def need_feature_generation(self):
@@ -125,6 +139,9 @@ class VulkanEnumToStringBodyGenerator(BaseGenerator):
         for enum in sorted(self.enum_names):
             if not enum in self.processedEnums and not enum in self.enumAliases and not enum in self.SKIP_ENUM:
                 self.processedEnums.add(enum)
+                if self.lookupTables and len(self.enumEnumerants[enum]):
+                    write(self.make_enum_table_functions(enum), file=self.outFile)
+                    continue
                 body = 'template <> std::string ToString<{0}>(const {0}& value, ToStringFlags, uint32_t, uint32_t)\n'
                 body += '{{\n'
                 if len(self.enumEnumerants[enum]):
@@ -142,3 +159,27 @@ class VulkanEnumToStringBodyGenerator(BaseGenerator):
                     body += '}}\n'
                 write(body.format(enum), file=self.outFile)
     # yapf: enable
+
+    #
+    # Generates the ToString() functions for an enum, which find the names of enum values and flags
+    # in tables built from a list of the enumerants, rather than in switch statements.
+    # yapf: disable
+    def make_enum_table_functions(self, enum):
+        body = 'static const VkEnumName<{0}> k{0}Names[] = {{\n'
+        for enumerant in self.enumEnumerants[enum]:
+            body += '    {{{{ {0}, "{0}" }}}},\n'.format(enumerant)
+        body += '}};\n'
+        body += '\n'
+        body += 'template <> std::string ToString<{0}>(const {0}& value, ToStringFlags, uint32_t, uint32_t)\n'
+        body += '{{\n'
+        body += '    static const VkEnumNameTable<{0}> table(k{0}Names, "Unhandled {0}");\n'
+        body += '    return table.GetName(value);\n'
+        body += '}}\n'
+        if 'Bits' in enum:
+            body += '\ntemplate <> std::string ToString<{0}>(VkFlags vkFlags, ToStringFlags, uint32_t, uint32_t)\n'
+            body += '{{\n'
+            body += '    static const VkBitmaskNameTable<{0}> table(k{0}Names, "Unhandled {0}");\n'
+            body += '    return table.GetNames(vkFlags);\n'
+            body += '}}\n'
+        return body.format(enum)
+    # yapf: enable
@@ -117,6 +117,14 @@ class VulkanEnumToStringHeaderGenerator(BaseGenerator):
         BaseGenerator.endFile(self)
     # yapf: enable
 
+    # Method override
+    def genGroup(self, groupinfo, group_name, alias):
+        BaseGenerator.genGroup(self, groupinfo, group_name, alias)
+        # Enums of API versions and extensions that are not emitted are treated as processed, so
+        # that they are skipped when the emitted features are generated.
+        if not self.emit:
+            self.processedEnums.add(group_name)
+
     #
     # Indicates that the current feature has C++ code to generate.
     def need_feature_generation(self):
@@ -101,9 +101,10 @@ class VulkanFeatureUtilBodyGenerator(BaseGenerator):
         BaseGenerator.genStruct(self, typeinfo, typename, alias)
 
         if not alias:
-            # Track this struct if it can be present in a pNext chain for features
+            # Track this struct if it can be present in a pNext chain for features.  Structs of API
+            # versions and extensions that are not emitted are excluded.
             parent_structs = typeinfo.elem.get('structextends')
-            if parent_structs:
+            if parent_structs and self.emit:
                 if "VkPhysicalDeviceFeatures2" in parent_structs:
                     # Build list of all boolean members which are the feature bits
                     members = []
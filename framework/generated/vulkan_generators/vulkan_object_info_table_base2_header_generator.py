@@ -36,7 +36,8 @@ class VulkanObjectInfoTableBase2HeaderGeneratorOptions(BaseGeneratorOptions):
         prefixText='',
         protectFile=False,
         protectFeature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        pagedMaps=False  # Store object info in maps indexed by capture ID instead of unordered maps.
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -49,6 +50,7 @@ class VulkanObjectInfoTableBase2HeaderGeneratorOptions(BaseGeneratorOptions):
             protectFeature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.pagedMaps = pagedMaps
 
 
 # Generates declarations for functions for Vulkan object info table
@@ -67,10 +69,14 @@ class VulkanObjectInfoTableBase2HeaderGenerator(BaseGenerator):
             diag_file=diag_file
         )
 
+        # Set from the generator options when the file is started
+        self.pagedMaps = False
+
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
         BaseGenerator.beginFile(self, genOpts)
+        self.pagedMaps = genOpts.pagedMaps
         self.write_include()
         write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
         write('GFXRECON_BEGIN_NAMESPACE(decode)', file=self.outFile)
@@ -103,11 +109,18 @@ class VulkanObjectInfoTableBase2HeaderGenerator(BaseGenerator):
             handle_info = handle_name + 'Info'
             handle_map = handle_name[0].lower() + handle_name[1:] + '_map_'
             add_code += '    void Add{0}({0}&& info) {{ AddObjectInfo(std::move(info), &{1}); }}\n'.format(handle_info, handle_map)
-            remove_code += '    void Remove{0}(format::HandleId id) {{ {1}.erase(id); }}\n'.format(handle_info, handle_map)
+            if self.pagedMaps:
+                remove_code += '    void Remove{0}(format::HandleId id) {{ {1}.Remove(id); }}\n'.format(handle_info, handle_map)
+            else:
+                remove_code += '    void Remove{0}(format::HandleId id) {{ {1}.erase(id); }}\n'.format(handle_info, handle_map)
             const_get_code += '    const {0}* Get{0}(format::HandleId id) const {{ return GetObjectInfo<{0}>(id, &{1}); }}\n'.format(handle_info, handle_map)
             get_code += '    {0}* Get{0}(format::HandleId id) {{ return GetObjectInfo<{0}>(id, &{1}); }}\n'.format(handle_info, handle_map)
-            visit_code += '    void Visit{0}(std::function<void(const {0}*)> visitor) const {{  for (const auto& entry : {1}) {{ visitor(&entry.second); }}  }}\n'.format(handle_info, handle_map)
-            map_code += '     std::unordered_map<format::HandleId, {0}> {1};\n'.format(handle_info, handle_map)
+            if self.pagedMaps:
+                visit_code += '    void Visit{0}(std::function<void(const {0}*)> visitor) const {{ {1}.Visit(visitor); }}\n'.format(handle_info, handle_map)
+                map_code += '     PagedObjectInfoMap<{0}> {1};\n'.format(handle_info, handle_map)
+            else:
+                visit_code += '    void Visit{0}(std::function<void(const {0}*)> visitor) const {{  for (const auto& entry : {1}) {{ visitor(&entry.second); }}  }}\n'.format(handle_info, handle_map)
+                map_code += '     std::unordered_map<format::HandleId, {0}> {1};\n'.format(handle_info, handle_map)
 
         self.newline()
         code = 'class VulkanObjectInfoTableBase2 : VulkanObjectInfoTableBase\n'
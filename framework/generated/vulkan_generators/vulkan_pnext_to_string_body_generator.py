@@ -111,7 +111,8 @@ class VulkanPNextToStringBodyGenerator(BaseGenerator):
 
     # Method override
     def genStruct(self, typeinfo, typename, alias):
-        if not alias:
+        # Structs of API versions and extensions that are not emitted are excluded from the pNext switch.
+        if not alias and self.emit:
             # Only process struct types that specify a 'structextends' tag, which indicates the struct can be used in a pNext chain.
             if typeinfo.elem.get('structextends'):
                 sType = self.make_structure_type_enum(typeinfo, typename)
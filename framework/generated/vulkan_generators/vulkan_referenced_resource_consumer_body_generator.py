@@ -107,6 +107,7 @@ class VulkanReferencedResourceBodyGenerator(BaseGenerator):
 
     def endFile(self):
         """Method override."""
+        handled_cmds = []
         for cmd, info in self.command_info.items():
             return_type = info[0]
             params = info[2]
@@ -116,6 +117,7 @@ class VulkanReferencedResourceBodyGenerator(BaseGenerator):
 
                 if (handles):
                     # Generate a function to add handles to the command buffer's referenced handle list.
+                    handled_cmds.append(cmd)
                     cmddef = '\n'
 
                     # Temporarily remove resource only matching restriction from is_handle() when generating the function signature.
@@ -149,6 +151,23 @@ class VulkanReferencedResourceBodyGenerator(BaseGenerator):
 
                     write(cmddef, file=self.outFile)
 
+        # Generate the filter for the API calls processed by the consumer, so that the decoder can skip the others.
+        cmddef = '\n'
+        cmddef += 'bool VulkanReferencedResourceConsumer::IsApiCallHandled(format::ApiCallId call_id) const\n'
+        cmddef += '{\n'
+        cmddef += '    switch (call_id)\n'
+        cmddef += '    {\n'
+        for cmd in handled_cmds:
+            cmddef += '        case format::ApiCallId::ApiCall_{}:\n'.format(
+                cmd
+            )
+        cmddef += '            return true;\n'
+        cmddef += '        default:\n'
+        cmddef += '            return VulkanReferencedResourceConsumerBase::IsApiCallHandled(call_id);\n'
+        cmddef += '    }\n'
+        cmddef += '}'
+        write(cmddef, file=self.outFile)
+
         self.newline()
         write('GFXRECON_END_NAMESPACE(decode)', file=self.outFile)
         write('GFXRECON_END_NAMESPACE(gfxrecon)', file=self.outFile)
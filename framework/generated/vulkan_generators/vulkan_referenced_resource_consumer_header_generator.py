@@ -137,6 +137,10 @@ class VulkanReferencedResourceHeaderGenerator(BaseGenerator):
 
                     write(cmddef, file=self.outFile)
 
+        write(
+            '\n    virtual bool IsApiCallHandled(format::ApiCallId call_id) const override;',
+            file=self.outFile
+        )
         write('};', file=self.outFile)
         self.newline()
         write('GFXRECON_END_NAMESPACE(decode)', file=self.outFile)
@@ -21,9 +21,8 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-import json
 import sys
-from base_generator import BaseGenerator, BaseGeneratorOptions, write
+from base_generator import BaseGenerator, BaseGeneratorOptions, load_function_overrides, write
 from base_replay_consumer_body_generator import BaseReplayConsumerBodyGenerator
 
 
@@ -811,5 +810,4 @@ class VulkanReplayConsumerBodyGenerator(
         return expr
 
     def __load_replay_overrides(self, filename):
-        overrides = json.loads(open(filename, 'r').read())
-        self.REPLAY_OVERRIDES = overrides['functions']
+        self.REPLAY_OVERRIDES = load_function_overrides(filename)
@@ -36,7 +36,8 @@ class VulkanStateTableHeaderGeneratorOptions(BaseGeneratorOptions):
         prefixText='',
         protectFile=False,
         protectFeature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        hashMaps=False  # Store wrappers in hash maps instead of ordered maps.
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -49,6 +50,7 @@ class VulkanStateTableHeaderGeneratorOptions(BaseGeneratorOptions):
             protectFeature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.hashMaps = hashMaps
 
 
 # Generates declarations for functions for Vulkan state table
@@ -67,10 +69,14 @@ class VulkanStateTableHeaderGenerator(BaseGenerator):
             diag_file=diag_file
         )
 
+        # Set from the generator options when the file is started
+        self.hashMaps = False
+
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
         BaseGenerator.beginFile(self, genOpts)
+        self.hashMaps = genOpts.hashMaps
         self.write_include()
         write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
         write('GFXRECON_BEGIN_NAMESPACE(encode)', file=self.outFile)
@@ -95,6 +101,7 @@ class VulkanStateTableHeaderGenerator(BaseGenerator):
         get_code = ''
         visit_code = ''
         map_code = ''
+        map_type = 'std::unordered_map' if self.hashMaps else 'std::map'
 
         for handle_name in sorted(self.handle_names):
             if handle_name in self.DUPLICATE_HANDLE_TYPES:
@@ -104,10 +111,13 @@ class VulkanStateTableHeaderGenerator(BaseGenerator):
             handle_map = handle_name[0].lower() + handle_name[1:] + '_map_'
             insert_code += '    bool InsertWrapper(format::HandleId id, {0}* wrapper) {{ return InsertEntry(id, wrapper, {1}); }}\n'.format(handle_wrapper, handle_map)
             remove_code += '    bool RemoveWrapper(const {0}* wrapper) {{ return RemoveEntry(wrapper, {1}); }}\n'.format(handle_wrapper, handle_map)
-            visit_code += '    void VisitWrappers(std::function<void({0}*)> visitor) const {{ for (auto entry : {1}) {{ visitor(entry.second); }} }}\n'.format(handle_wrapper, handle_map)
+            if self.hashMaps:
+                visit_code += '    void VisitWrappers(std::function<void({0}*)> visitor) const {{ VisitEntries({1}, visitor); }}\n'.format(handle_wrapper, handle_map)
+            else:
+                visit_code += '    void VisitWrappers(std::function<void({0}*)> visitor) const {{ for (auto entry : {1}) {{ visitor(entry.second); }} }}\n'.format(handle_wrapper, handle_map)
             get_code += '    {0}* Get{0}(format::HandleId id) {{ return GetWrapper<{0}>(id, {1}); }}\n'.format(handle_wrapper, handle_map)
             const_get_code += '    const {0}* Get{0}(format::HandleId id) const {{ return GetWrapper<{0}>(id, {1}); }}\n'.format(handle_wrapper, handle_map)
-            map_code += '    std::map<format::HandleId, {0}*> {1};\n'.format(handle_wrapper, handle_map)
+            map_code += '    {0}<format::HandleId, {1}*> {2};\n'.format(map_type, handle_wrapper, handle_map)
 
         self.newline()
         code = 'class VulkanStateTable : VulkanStateTableBase\n'
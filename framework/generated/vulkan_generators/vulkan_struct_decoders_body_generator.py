@@ -38,7 +38,8 @@ class VulkanStructDecodersBodyGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        shard_count=1
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -49,7 +50,8 @@ class VulkanStructDecodersBodyGeneratorOptions(BaseGeneratorOptions):
             prefix_text,
             protect_file,
             protect_feature,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            shard_count=shard_count
         )
 
 
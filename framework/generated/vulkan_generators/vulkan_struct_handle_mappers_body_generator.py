@@ -131,8 +131,9 @@ class VulkanStructHandleMappersBodyGenerator(
                 self.structs_with_handle_ptrs
             ):
                 # Track this struct if it can be present in a pNext chain, for generating the MapPNextStructHandles code.
+                # Structs of API versions and extensions that are not emitted are excluded.
                 parent_structs = typeinfo.elem.get('structextends')
-                if parent_structs:
+                if parent_structs and self.emit:
                     stype = self.make_structure_type_enum(typeinfo, typename)
                     if stype:
                         self.pnext_structs[typename] = stype
@@ -218,9 +218,10 @@ class VulkanStructHandleWrappersBodyGenerator(BaseGenerator):
                 typename, self.structs_with_handles
             )
 
-            # Track this struct if it can be present in a pNext chain.
+            # Track this struct if it can be present in a pNext chain.  Structs of API versions and
+            # extensions that are not emitted are excluded.
             parent_structs = typeinfo.elem.get('structextends')
-            if parent_structs:
+            if parent_structs and self.emit:
                 stype = self.make_structure_type_enum(typeinfo, typename)
                 if stype:
                     if has_handles:
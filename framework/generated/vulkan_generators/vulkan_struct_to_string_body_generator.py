@@ -36,7 +36,9 @@ class VulkanStructToStringBodyGeneratorOptions(BaseGeneratorOptions):
         prefixText='',
         protectFile=False,
         protectFeature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        shard_count=1,
+        streaming=False  # Generate ToStream() functions that write struct members directly to the output stream.
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -47,8 +49,10 @@ class VulkanStructToStringBodyGeneratorOptions(BaseGeneratorOptions):
             prefixText,
             protectFile,
             protectFeature,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            shard_count=shard_count
         )
+        self.streaming = streaming
 
 
 # VulkanStructToStringBodyGenerator - subclass of BaseGenerator.
@@ -80,10 +84,14 @@ class VulkanStructToStringBodyGenerator(BaseGenerator):
             'VkTransformMatrixKHR',
         }
 
+        # Set from the generator options when the file is started
+        self.streaming = False
+
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
         BaseGenerator.beginFile(self, genOpts)
+        self.streaming = genOpts.streaming
         body = inspect.cleandoc('''
             #include "decode/custom_vulkan_to_string.h"
             #include "generated_vulkan_struct_to_string.h"
@@ -121,7 +129,9 @@ class VulkanStructToStringBodyGenerator(BaseGenerator):
     # yapf: disable
     def generate_feature(self):
         for struct in self.get_filtered_struct_names():
-            if not struct in self.customImplementationRequired:
+            if self.streaming:
+                write(self.makeStreamingFunctions(struct), file=self.outFile)
+            elif not struct in self.customImplementationRequired:
                 body = inspect.cleandoc('''
                     template <> std::string ToString<{0}>(const {0}& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
                     {{
@@ -140,6 +150,45 @@ class VulkanStructToStringBodyGenerator(BaseGenerator):
                 write(body, file=self.outFile)
     # yapf: enable
 
+    #
+    # ToString() and ToStream() definitions for streaming mode, where ToString() writes to a stream with ToStream(), and
+    # ToStream() writes nested structures to the same stream. Structures with custom ToString() implementations get a
+    # ToStream() that writes the custom string.
+    # yapf: disable
+    def makeStreamingFunctions(self, struct):
+        if struct in self.customImplementationRequired:
+            body = inspect.cleandoc('''
+                template <> void ToStream<{0}>(std::ostream& strStrm, const {0}& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+                {{
+                    strStrm << ToString(obj, toStringFlags, tabCount, tabSize);
+                }}
+                '''.format(struct))
+            return body + '\n'
+
+        body = inspect.cleandoc('''
+            template <> std::string ToString<{0}>(const {0}& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+            {{
+                std::stringstream strStrm;
+                ToStream(strStrm, obj, toStringFlags, tabCount, tabSize);
+                return strStrm.str();
+            }}
+
+            template <> void ToStream<{0}>(std::ostream& strStrm, const {0}& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+            {{
+                ObjectToStream(strStrm, toStringFlags, tabCount, tabSize,
+                    [&]()
+                    {{
+            '''.format(struct))
+        body += '\n'
+        body += self.makeStructBody(struct, self.feature_struct_members[struct])
+        body += inspect.cleandoc('''
+                    }
+                );
+            }
+            ''')
+        return body + '\n'
+    # yapf: enable
+
     #
     # Command definition
     # yapf: disable
@@ -151,6 +200,9 @@ class VulkanStructToStringBodyGenerator(BaseGenerator):
             #   below without being handled the generated code will fail to compile
             toString = 'static_assert(false, "Unhandled value in `vulkan_struct_to_string_body_generator.py`")'
 
+            # In streaming mode, values that are not written with a specific stream statement write their string
+            toStream = None
+
             # pNext requires custom handling
             if 'pNext' in value.name:
                 toString = 'PNextToString(obj.pNext, toStringFlags, tabCount, tabSize)'
@@ -158,6 +210,7 @@ class VulkanStructToStringBodyGenerator(BaseGenerator):
             # Function pointers and void data pointers simply write the address
             elif 'pfn' in value.name or 'void' in value.full_type:
                 toString = '"\\"" + PtrToString(obj.{0}) + "\\""'
+                toStream = 'strStrm << \'"\' << PtrToString(obj.{0}) << \'"\';'
 
             # C strings require custom handling
             elif 'const char*' in value.full_type:
@@ -184,6 +237,7 @@ class VulkanStructToStringBodyGenerator(BaseGenerator):
                         toString = 'static_assert(false, "Unhandled pointer to VkHandle in `vulkan_struct_to_string_body_generator.py`")'
                     elif self.is_struct(value.base_type):
                         toString = '(obj.{0} ? ToString(*obj.{0}, toStringFlags, tabCount, tabSize) : "null")'
+                        toStream = 'PointerToStream(strStrm, obj.{0}, toStringFlags, tabCount, tabSize);'
                     elif self.is_enum(value.base_type):
                         toString = 'static_assert(false, "Unhandled pointer to VkEnum in `vulkan_struct_to_string_body_generator.py`")'
                     else:
@@ -198,22 +252,32 @@ class VulkanStructToStringBodyGenerator(BaseGenerator):
                         toString = 'ArrayToString({1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                     elif 'char' in value.base_type:
                         toString = '\'"\' + std::string(obj.{0}) + \'"\''
+                        toStream = 'strStrm << \'"\' << obj.{0} << \'"\';'
                     elif 'UUID' in value.array_length or 'LUID' in value.array_length:
                         toString = '\'"\' + UIDToString({1}, obj.{0}) + \'"\''
+                        toStream = 'strStrm << \'"\' << UIDToString({1}, obj.{0}) << \'"\';'
                     else:
                         toString = 'ArrayToString({1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                 else:
                     if self.is_handle(value.base_type):
                         toString = '\'"\' + VkHandleToString(obj.{0}) + \'"\''
+                        toStream = 'strStrm << \'"\' << VkHandleToString(obj.{0}) << \'"\';'
                     elif self.is_struct(value.base_type):
                         toString = 'ToString(obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toStream = 'ToStream(strStrm, obj.{0}, toStringFlags, tabCount, tabSize);'
                     elif self.is_enum(value.base_type):
                         toString = '\'"\' + ToString(obj.{0}, toStringFlags, tabCount, tabSize) + \'"\''
+                        toStream = 'strStrm << \'"\' << ToString(obj.{0}, toStringFlags, tabCount, tabSize) << \'"\';'
                     else:
                         toString = 'ToString(obj.{0}, toStringFlags, tabCount, tabSize)'
 
             firstField = 'true' if not body else 'false'
             toString = toString.format(value.name, value.array_length)
-            body += '            FieldToString(strStrm, {0}, "{1}", toStringFlags, tabCount, tabSize, {2});\n'.format(firstField, value.name, toString)
+            if self.streaming:
+                toStream = toStream.format(value.name, value.array_length) if toStream else 'strStrm << {0};'.format(toString)
+                body += '            FieldNameToStream(strStrm, {0}, "{1}", toStringFlags, tabCount, tabSize);\n'.format(firstField, value.name)
+                body += '            {0}\n'.format(toStream)
+            else:
+                body += '            FieldToString(strStrm, {0}, "{1}", toStringFlags, tabCount, tabSize, {2});\n'.format(firstField, value.name, toString)
         return body
     # yapf: enable
@@ -36,7 +36,8 @@ class VulkanStructToStringHeaderGeneratorOptions(BaseGeneratorOptions):
         prefixText='',
         protectFile=False,
         protectFeature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        streaming=False  # Declare ToStream() functions that write struct members directly to the output stream.
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -49,6 +50,7 @@ class VulkanStructToStringHeaderGeneratorOptions(BaseGeneratorOptions):
             protectFeature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.streaming = streaming
 
 
 # VulkanStructToStringHeaderGenerator - subclass of BaseGenerator.
@@ -69,10 +71,14 @@ class VulkanStructToStringHeaderGenerator(BaseGenerator):
             diag_file=diag_file
         )
 
+        # Set from the generator options when the file is started
+        self.streaming = False
+
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
         BaseGenerator.beginFile(self, genOpts)
+        self.streaming = genOpts.streaming
         includes = inspect.cleandoc(
             '''
             #include "format/platform_types.h"
@@ -121,5 +127,9 @@ class VulkanStructToStringHeaderGenerator(BaseGenerator):
             body = 'template <> std::string ToString<{0}>(const {0}& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);'.format(
                 struct
             )
+            if self.streaming:
+                body += '\ntemplate <> void ToStream<{0}>(std::ostream& strStrm, const {0}& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);'.format(
+                    struct
+                )
             write(body, file=self.outFile)
     # yapf: enable
@@ -25,3 +25,162 @@
 
 #define CATCH_CONFIG_MAIN
 #include <catch2/catch.hpp>
+
+#include "util/to_string.h"
+
+#include <sstream>
+#include <string>
+
+const gfxrecon::util::ToStringFlags kToStringFlags[] = { gfxrecon::util::kToString_Unformatted,
+                                                         gfxrecon::util::kToString_Formatted };
+
+// The string based implementations of the object and field helpers, which the stream based helpers replaced.
+template <typename ToStringFunctionType>
+static std::string StringObjectToString(gfxrecon::util::ToStringFlags toStringFlags,
+                                        uint32_t&                     tabCount,
+                                        uint32_t                      tabSize,
+                                        ToStringFunctionType          toStringFunction)
+{
+    std::stringstream strStrm;
+    strStrm << '{';
+    strStrm << gfxrecon::util::GetNewlineString(toStringFlags);
+    ++tabCount;
+    toStringFunction(strStrm);
+    --tabCount;
+    strStrm << gfxrecon::util::GetNewlineString(toStringFlags);
+    strStrm << gfxrecon::util::GetTabString(toStringFlags, tabCount, tabSize);
+    strStrm << '}';
+    return strStrm.str();
+}
+
+static void StringFieldToString(std::ostream&                 strStrm,
+                                bool                          firstField,
+                                const std::string&            fieldName,
+                                gfxrecon::util::ToStringFlags toStringFlags,
+                                uint32_t                      tabCount,
+                                uint32_t                      tabSize,
+                                const std::string&            fieldString)
+{
+    if (!firstField)
+    {
+        strStrm << ',' << gfxrecon::util::GetNewlineString(toStringFlags);
+    }
+    strStrm << gfxrecon::util::GetTabString(toStringFlags, tabCount, tabSize);
+    strStrm << "\"" << fieldName << "\":";
+    strStrm << gfxrecon::util::GetWhitespaceString(toStringFlags);
+    strStrm << fieldString;
+}
+
+TEST_CASE("to string stream helpers write the same strings as the string helpers", "[to_string]")
+{
+    SECTION("Whitespace written to streams matches whitespace strings")
+    {
+        for (auto toStringFlags : kToStringFlags)
+        {
+            for (uint32_t count : { 0, 1, 8 })
+            {
+                std::stringstream whitespace;
+                gfxrecon::util::WhitespaceToStream(whitespace, toStringFlags, count);
+                REQUIRE(whitespace.str() == gfxrecon::util::GetWhitespaceString(toStringFlags, count));
+
+                std::stringstream tab;
+                gfxrecon::util::TabToStream(tab, toStringFlags, count, 2);
+                REQUIRE(tab.str() == gfxrecon::util::GetTabString(toStringFlags, count, 2));
+            }
+
+            std::stringstream newline;
+            gfxrecon::util::NewlineToStream(newline, toStringFlags);
+            REQUIRE(newline.str() == gfxrecon::util::GetNewlineString(toStringFlags));
+        }
+    }
+
+    SECTION("Field names written to streams match field strings")
+    {
+        for (auto toStringFlags : kToStringFlags)
+        {
+            std::stringstream stream;
+            gfxrecon::util::FieldNameToStream(stream, true, "first", toStringFlags, 2, 4);
+            stream << "1";
+            gfxrecon::util::FieldNameToStream(stream, false, "second", toStringFlags, 2, 4);
+            stream << "2";
+
+            std::stringstream expected;
+            StringFieldToString(expected, true, "first", toStringFlags, 2, 4, "1");
+            StringFieldToString(expected, false, "second", toStringFlags, 2, 4, "2");
+
+            std::stringstream field;
+            gfxrecon::util::FieldToString(field, true, "first", toStringFlags, 2, 4, "1");
+            gfxrecon::util::FieldToString(field, false, "second", toStringFlags, 2, 4, "2");
+
+            REQUIRE(stream.str() == expected.str());
+            REQUIRE(field.str() == expected.str());
+        }
+    }
+
+    SECTION("Objects written to streams match object strings")
+    {
+        for (auto toStringFlags : kToStringFlags)
+        {
+            uint32_t tabCount = 1;
+            uint32_t tabSize  = 4;
+
+            std::string object =
+                gfxrecon::util::ObjectToString(toStringFlags, tabCount, tabSize, [&](std::ostream& strStrm) {
+                    gfxrecon::util::FieldToString(strStrm, true, "value", toStringFlags, tabCount, tabSize, "1");
+                    gfxrecon::util::FieldToString(
+                        strStrm,
+                        false,
+                        "child",
+                        toStringFlags,
+                        tabCount,
+                        tabSize,
+                        gfxrecon::util::ObjectToString(
+                            toStringFlags, tabCount, tabSize, [&](std::ostream& childStrStrm) {
+                                gfxrecon::util::FieldToString(
+                                    childStrStrm, true, "x", toStringFlags, tabCount, tabSize, "2");
+                            }));
+                });
+
+            REQUIRE(tabCount == 1);
+
+            std::string expected = StringObjectToString(toStringFlags, tabCount, tabSize, [&](std::ostream& strStrm) {
+                StringFieldToString(strStrm, true, "value", toStringFlags, tabCount, tabSize, "1");
+                StringFieldToString(
+                    strStrm,
+                    false,
+                    "child",
+                    toStringFlags,
+                    tabCount,
+                    tabSize,
+                    StringObjectToString(toStringFlags, tabCount, tabSize, [&](std::ostream& childStrStrm) {
+                        StringFieldToString(childStrStrm, true, "x", toStringFlags, tabCount, tabSize, "2");
+                    }));
+            });
+
+            std::stringstream stream;
+            gfxrecon::util::ObjectToStream(stream, toStringFlags, tabCount, tabSize, [&]() {
+                gfxrecon::util::FieldNameToStream(stream, true, "value", toStringFlags, tabCount, tabSize);
+                stream << "1";
+                gfxrecon::util::FieldNameToStream(stream, false, "child", toStringFlags, tabCount, tabSize);
+                gfxrecon::util::ObjectToStream(stream, toStringFlags, tabCount, tabSize, [&]() {
+                    gfxrecon::util::FieldNameToStream(stream, true, "x", toStringFlags, tabCount, tabSize);
+                    stream << "2";
+                });
+            });
+
+            REQUIRE(tabCount == 1);
+            REQUIRE(object == expected);
+            REQUIRE(stream.str() == expected);
+
+            if (toStringFlags & gfxrecon::util::kToString_Formatted)
+            {
+                REQUIRE(expected ==
+                        "{\n        \"value\": 1,\n        \"child\": {\n            \"x\": 2\n        }\n    }");
+            }
+            else
+            {
+                REQUIRE(expected == "{\"value\":1,\"child\":{\"x\":2}}");
+            }
+        }
+    }
+}
@@ -25,6 +25,9 @@
 
 #include "util/defines.h"
 
+#include <algorithm>
+#include <iterator>
+#include <ostream>
 #include <sstream>
 #include <string>
 #include <utility>
@@ -64,6 +67,35 @@ inline std::string ToString(uint32_t      apiFlags,
     return "0";
 }
 
+// Writes an object's string to a caller owned stream. Types with generated streaming support specialize this function
+// to write their members directly to the stream, without creating temporary strings for nested objects.
+template <typename T>
+inline void ToStream(std::ostream& strStrm,
+                     const T&      obj,
+                     ToStringFlags toStringFlags = kToString_Default,
+                     uint32_t      tabCount      = 0,
+                     uint32_t      tabSize       = 4)
+{
+    strStrm << ToString(obj, toStringFlags, tabCount, tabSize);
+}
+
+template <typename T>
+inline void PointerToStream(std::ostream& strStrm,
+                            const T*      pObj,
+                            ToStringFlags toStringFlags = kToString_Default,
+                            uint32_t      tabCount      = 0,
+                            uint32_t      tabSize       = 4)
+{
+    if (pObj != nullptr)
+    {
+        ToStream(strStrm, *pObj, toStringFlags, tabCount, tabSize);
+    }
+    else
+    {
+        strStrm << "null";
+    }
+}
+
 template <typename PtrType>
 inline std::string PtrToString(PtrType* ptr)
 {
@@ -95,23 +127,73 @@ inline std::string GetTabString(ToStringFlags toStringFlags, uint32_t tabCount,
     return GetWhitespaceString(toStringFlags, tabCount * tabSize);
 }
 
-template <typename ToStringFunctionType>
-inline std::string
-ObjectToString(ToStringFlags toStringFlags, uint32_t& tabCount, uint32_t tabSize, ToStringFunctionType toStringFunction)
+// The stream functions write whitespace directly to the stream, without creating temporary strings.
+inline void NewlineToStream(std::ostream& strStrm, ToStringFlags toStringFlags)
+{
+    if (toStringFlags & kToString_Formatted)
+    {
+        strStrm.put('\n');
+    }
+}
+
+inline void WhitespaceToStream(std::ostream& strStrm, ToStringFlags toStringFlags, uint32_t count = 1)
+{
+    if (toStringFlags & kToString_Formatted)
+    {
+        std::fill_n(std::ostreambuf_iterator<char>(strStrm), count, ' ');
+    }
+}
+
+inline void TabToStream(std::ostream& strStrm, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize = 4)
+{
+    WhitespaceToStream(strStrm, toStringFlags, tabCount * tabSize);
+}
+
+template <typename ToStreamFunctionType>
+inline void ObjectToStream(std::ostream&        strStrm,
+                           ToStringFlags        toStringFlags,
+                           uint32_t&            tabCount,
+                           uint32_t             tabSize,
+                           ToStreamFunctionType toStreamFunction)
 {
-    std::stringstream strStrm;
     strStrm << '{';
-    strStrm << GetNewlineString(toStringFlags);
+    NewlineToStream(strStrm, toStringFlags);
     ++tabCount;
-    toStringFunction(strStrm);
+    toStreamFunction();
     --tabCount;
-    strStrm << GetNewlineString(toStringFlags);
-    strStrm << GetTabString(toStringFlags, tabCount, tabSize);
+    NewlineToStream(strStrm, toStringFlags);
+    TabToStream(strStrm, toStringFlags, tabCount, tabSize);
     strStrm << '}';
+}
+
+template <typename ToStringFunctionType>
+inline std::string
+ObjectToString(ToStringFlags toStringFlags, uint32_t& tabCount, uint32_t tabSize, ToStringFunctionType toStringFunction)
+{
+    std::stringstream strStrm;
+    ObjectToStream(strStrm, toStringFlags, tabCount, tabSize, [&]() { toStringFunction(strStrm); });
     return strStrm.str();
 }
 
-inline void FieldToString(std::stringstream& strStrm,
+// Writes the separator and name for a field, which is followed by the field's value.
+inline void FieldNameToStream(std::ostream& strStrm,
+                              bool          firstField,
+                              const char*   fieldName,
+                              ToStringFlags toStringFlags,
+                              uint32_t      tabCount,
+                              uint32_t      tabSize)
+{
+    if (!firstField)
+    {
+        strStrm.put(',');
+        NewlineToStream(strStrm, toStringFlags);
+    }
+    TabToStream(strStrm, toStringFlags, tabCount, tabSize);
+    strStrm << '"' << fieldName << "\":";
+    WhitespaceToStream(strStrm, toStringFlags);
+}
+
+inline void FieldToString(std::ostream&      strStrm,
                           bool               firstField,
                           const std::string& fieldName,
                           ToStringFlags      toStringFlags,
@@ -119,13 +201,7 @@ inline void FieldToString(std::stringstream& strStrm,
                           uint32_t           tabSize,
                           const std::string& fieldString)
 {
-    if (!firstField)
-    {
-        strStrm << ',' << GetNewlineString(toStringFlags);
-    }
-    strStrm << GetTabString(toStringFlags, tabCount, tabSize);
-    strStrm << "\"" << fieldName << "\":";
-    strStrm << GetWhitespaceString(toStringFlags);
+    FieldNameToStream(strStrm, firstField, fieldName.c_str(), toStringFlags, tabCount, tabSize);
     strStrm << fieldString;
 }
 
@@ -142,16 +218,19 @@ inline std::string ArrayToString(uint32_t                  count,
     strStrm << '[';
     if (count && validateArrayFunction())
     {
-        strStrm << GetNewlineString(toStringFlags);
+        NewlineToStream(strStrm, toStringFlags);
         for (uint32_t i = 0; i < count; ++i)
         {
             if (i)
             {
-                strStrm << ',' << GetNewlineString(toStringFlags);
+                strStrm.put(',');
+                NewlineToStream(strStrm, toStringFlags);
             }
-            strStrm << GetTabString(toStringFlags, tabCount + 1, tabSize) << toStringFunction(i);
+            TabToStream(strStrm, toStringFlags, tabCount + 1, tabSize);
+            strStrm << toStringFunction(i);
         }
-        strStrm << GetNewlineString(toStringFlags) << GetTabString(toStringFlags, tabCount, tabSize);
+        NewlineToStream(strStrm, toStringFlags);
+        TabToStream(strStrm, toStringFlags, tabCount, tabSize);
     }
     strStrm << ']';
     return strStrm.str();
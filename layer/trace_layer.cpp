@@ -33,7 +33,9 @@
 
 #include "vulkan/vk_layer.h"
 
+#include <algorithm>
 #include <cstring>
+#include <iterator>
 #include <mutex>
 #include <string>
 #include <unordered_map>
@@ -98,6 +100,16 @@ static VkInstance get_instance_handle(const void* handle)
     return (entry != instance_handles.end()) ? entry->second : VK_NULL_HANDLE;
 }
 
+static PFN_vkVoidFunction get_layer_function(const char* name)
+{
+    // The generated function table is sorted by name.
+    auto entry = std::lower_bound(
+        std::begin(func_table), std::end(func_table), name, [](const LayerFuncTableEntry& lhs, const char* rhs) {
+            return std::strcmp(lhs.name, rhs) < 0;
+        });
+    return ((entry != std::end(func_table)) && (std::strcmp(entry->name, name) == 0)) ? entry->func : nullptr;
+}
+
 VKAPI_ATTR VkResult VKAPI_CALL dispatch_CreateInstance(const VkInstanceCreateInfo*  pCreateInfo,
                                                        const VkAllocationCallbacks* pAllocator,
                                                        VkInstance*                  pInstance)
@@ -203,11 +215,11 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetInstanceProcAddr(VkInstance instance
     {
         // Only check for a layer implementation of the requested function if it is available from the next level, or if
         // the instance handle is null and we can't determine if it is available from the next level.
-        const auto entry = func_table.find(pName);
+        const auto entry = get_layer_function(pName);
 
-        if (entry != func_table.end())
+        if (entry != nullptr)
         {
-            result = entry->second;
+            result = entry;
         }
     }
 
@@ -229,10 +241,10 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, cons
             {
                 // Only check for a layer implementation of the requested function if it is available from the next
                 // level.
-                const auto entry = func_table.find(pName);
-                if (entry != func_table.end())
+                const auto entry = get_layer_function(pName);
+                if (entry != nullptr)
                 {
-                    result = entry->second;
+                    result = entry;
                 }
             }
         }
@@ -144,6 +144,40 @@ class VulkanStatsConsumer : public gfxrecon::decode::VulkanConsumer
         return nullptr;
     }
 
+    virtual bool IsApiCallHandled(gfxrecon::format::ApiCallId call_id) const override
+    {
+        switch (call_id)
+        {
+            case gfxrecon::format::ApiCallId::ApiCall_vkCreateInstance:
+            case gfxrecon::format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties:
+            case gfxrecon::format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties2:
+            case gfxrecon::format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties2KHR:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCreateDevice:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCreateGraphicsPipelines:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCreateComputePipelines:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndexed:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndirect:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirect:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndirectCountKHR:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountKHR:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndirectByteCountEXT:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndirectCountAMD:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountAMD:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawMeshTasksNV:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectNV:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectCountNV:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDispatch:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDispatchIndirect:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDispatchBase:
+            case gfxrecon::format::ApiCallId::ApiCall_vkCmdDispatchBaseKHR:
+            case gfxrecon::format::ApiCallId::ApiCall_vkAllocateMemory:
+                return true;
+            default:
+                return false;
+        }
+    }
+
     virtual void ProcessStateBeginMarker(uint64_t frame_number) override
     {
         // Theres should only be one of these in a capture file.